@@ -0,0 +1,160 @@
+"""
+프로젝트 보고서 생성 벤치마크
+
+합성 프로젝트 데이터로 TaskHandler를 구성하고 iter_report()로 보고서를 끝까지 생성하는 데
+걸리는 시간을 아이템 수별로 측정합니다. 네트워크나 토큰 없이 실행할 수 있습니다.
+
+아이템당 시간과 가장 작은 크기 대비 아이템당 시간 비율(1.0이면 선형)을 함께 출력하며,
+비율이 --max-growth를 넘으면 선형보다 빠르게 느려진 것으로 보고 종료 코드 1을 반환합니다.
+
+사용법 (.github/scripts 디렉토리에서):
+    PYTHONPATH=. python benchmarks/report_benchmark.py
+    PYTHONPATH=. python benchmarks/report_benchmark.py --sizes 1000 10000 50000 --repeat 3 --memory
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+from core.task.handlers.task_handler import TaskHandler
+from core.task.formatters.report_formatter import ReportFormatter
+from core.task.models.constants import TASK_CATEGORIES
+from config.user_mappings import GITHUB_USER_MAPPING
+
+DEFAULT_SIZES = [1000, 5000, 10000, 50000]
+DEFAULT_TODOS_PER_TASK = 5
+# 가장 작은 크기 대비 아이템당 시간이 이 배수를 넘으면 비선형으로 판단 (측정 잡음 여유 포함)
+DEFAULT_MAX_GROWTH = 1.5
+# 합성 데이터의 생성일 분포 기간(일)과 완료 비율
+HISTORY_SPAN_DAYS = 180
+CLOSED_RATIO = 0.6
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace('+00:00', 'Z')
+
+def make_project(item_count: int, todos_per_task: int = DEFAULT_TODOS_PER_TASK, seed: int = 1) -> Tuple[Dict, Dict]:
+    """get_project_items()/get_task_issues()와 같은 형태의 합성 데이터를 만듭니다."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    logins = list(GITHUB_USER_MAPPING) or ['user']
+    categories = list(TASK_CATEGORIES)
+
+    items: Dict[int, Dict] = {}
+    tasks: Dict[str, Dict] = {}
+    task_count = max(1, item_count // todos_per_task)
+    for task_index in range(task_count):
+        task_name = f"Task {task_index}"
+        category = rng.choice(categories)
+        tasks[task_name] = {
+            'number': 1_000_000 + task_index,
+            'title': task_name,
+            'state': 'OPEN',
+            'created_at': _iso(now - timedelta(days=HISTORY_SPAN_DAYS)),
+            'closed_at': None,
+            'labels': [f"category:{category}"],
+            'assignees': [],
+            'expected_time': f"{rng.randint(1, 16)}h"
+        }
+
+    for number in range(1, item_count + 1):
+        task_name = f"Task {(number - 1) % task_count}"
+        created_at = now - timedelta(days=rng.uniform(0, HISTORY_SPAN_DAYS))
+        closed = rng.random() < CLOSED_RATIO
+        closed_at = min(now, created_at + timedelta(days=rng.uniform(0, 14))) if closed else None
+        items[number] = {
+            'id': f"PVTI_{number}",
+            'node_id': f"I_{number}",
+            'number': number,
+            'title': f"[{task_name}] todo {number}",
+            'url': f"https://github.com/example/repo/issues/{number}",
+            'state': 'CLOSED' if closed else 'OPEN',
+            'created_at': _iso(created_at),
+            'updated_at': _iso(closed_at or created_at),
+            'closed_at': _iso(closed_at) if closed_at else None,
+            'labels': tasks[task_name]['labels'],
+            'assignees': [{'login': rng.choice(logins)}],
+            'fields': {'Status': 'Done' if closed else 'In Progress'}
+        }
+    return items, tasks
+
+def measure(item_count: int, todos_per_task: int, repeat: int, memory: bool) -> Dict[str, float]:
+    """태스크 매핑 구성과 보고서 생성 시간을 repeat번 측정해 중앙값을 반환합니다."""
+    items, tasks = make_project(item_count, todos_per_task)
+    build_times: List[float] = []
+    render_times: List[float] = []
+    report_chars = 0
+    peak = 0
+
+    for _ in range(repeat):
+        if memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        task_manager = TaskHandler(items, tasks)
+        built = time.perf_counter()
+        # 본문 크기 제한 없이 전체를 청크 단위로 소비합니다.
+        report_chars = sum(len(chunk) for chunk in ReportFormatter('benchmark', task_manager).iter_report())
+        rendered = time.perf_counter()
+        if memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        build_times.append(built - started)
+        render_times.append(rendered - built)
+
+    return {
+        'build': statistics.median(build_times),
+        'render': statistics.median(render_times),
+        'chars': report_chars,
+        'peak_mb': peak / (1024 * 1024)
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="프로젝트 보고서 생성 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="투두 아이템 수 목록")
+    parser.add_argument('--todos-per-task', type=int, default=DEFAULT_TODOS_PER_TASK, help="태스크당 투두 수")
+    parser.add_argument('--repeat', type=int, default=3, help="크기별 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--max-growth', type=float, default=DEFAULT_MAX_GROWTH,
+                        help="가장 작은 크기 대비 허용하는 아이템당 시간 비율")
+    parser.add_argument('--memory', action='store_true', help="tracemalloc으로 최대 메모리 측정 (시간이 늘어남)")
+    args = parser.parse_args()
+
+    header = (f"{'items':>8} {'build(s)':>9} {'us/item':>8} {'growth':>7}"
+              f" {'render(s)':>10} {'us/item':>8} {'growth':>7} {'chars':>12}")
+    if args.memory:
+        header += f" {'peak(MB)':>10}"
+    print(header)
+
+    baseline = None
+    violations = []
+    for size in sorted(args.sizes):
+        result = measure(size, args.todos_per_task, args.repeat, args.memory)
+        per_item = {phase: result[phase] / size * 1e6 for phase in ('build', 'render')}
+        growth = {
+            phase: per_item[phase] / baseline[phase] if baseline and baseline[phase] else None
+            for phase in per_item
+        }
+        for phase, ratio in growth.items():
+            if ratio is not None and ratio > args.max_growth:
+                violations.append(f"{phase}: {size}개에서 아이템당 시간이 {ratio:.2f}배로 증가")
+
+        line = f"{size:>8}"
+        for phase in ('build', 'render'):
+            ratio = f"{growth[phase]:.2f}x" if growth[phase] is not None else '-'
+            line += f" {result[phase]:>{9 if phase == 'build' else 10}.3f} {per_item[phase]:>8.1f} {ratio:>7}"
+        line += f" {result['chars']:>12,}"
+        if args.memory:
+            line += f" {result['peak_mb']:>10.1f}"
+        print(line)
+        baseline = baseline or per_item
+
+    if violations:
+        print(f"\n선형 확장 기준(아이템당 시간 {args.max_growth}배 이하)을 넘었습니다:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,9 +3,10 @@ GitHub API 클라이언트
 """
 import os
 import logging
+import threading
 import requests
 from github import Github
-from typing import Dict, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,8 @@ class GitHubClient:
             "Accept": "application/vnd.github.v3+json"
         }
         self.g = Github(token)
+        # 마지막 GraphQL 요청의 오류 목록 (동시에 요청하는 스레드끼리 섞이지 않도록 스레드별 보관)
+        self._local = threading.local()
         
         repo_name = os.environ.get('GITHUB_REPOSITORY', '')
         if '/' in repo_name:
@@ -26,8 +29,22 @@ class GitHubClient:
         
         logger.info(f"조직 설정: {self.org}")
 
-    def _execute_graphql(self, query: str, variables: Dict[str, Any]) -> Optional[Dict]:
-        """GraphQL 쿼리를 실행합니다."""
+    @property
+    def last_errors(self) -> List[Dict]:
+        """현재 스레드에서 마지막으로 실행한 GraphQL 요청의 오류 목록"""
+        return getattr(self._local, 'errors', [])
+
+    @last_errors.setter
+    def last_errors(self, errors: List[Dict]) -> None:
+        self._local.errors = errors
+
+    def _execute_graphql(self, query: str, variables: Dict[str, Any], allow_partial: bool = False) -> Optional[Dict]:
+        """
+        GraphQL 쿼리를 실행합니다.
+        
+        allow_partial이면 일부 필드에 오류가 있어도 함께 받은 데이터를 반환합니다. (오류는 last_errors에 남음)
+        """
+        self.last_errors = []
         try:
             response = requests.post(
                 'https://api.github.com/graphql',
@@ -38,14 +55,39 @@ class GitHubClient:
             result = response.json()
             
             if 'errors' in result:
+                self.last_errors = result['errors']
+                if allow_partial and result.get('data'):
+                    logger.debug(f"GraphQL 부분 오류: {result['errors']}")
+                    return result['data']
                 logger.error(f"GraphQL 오류: {result['errors']}")
                 return None
             
             return result['data']
         except Exception as e:
             logger.error(f"GraphQL 쿼리 실행 중 오류 발생: {str(e)}")
+            self.last_errors = [{'message': str(e)}]
             return None
 
+    def _iter_rest(self, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict]:
+        """REST API 목록 응답을 페이지를 넘겨 가며 순회합니다."""
+        url = f"https://api.github.com{path}"
+        params = {'per_page': 100, **(params or {})}
+        while url:
+            try:
+                response = requests.get(url, params=params, headers=self.headers)
+                response.raise_for_status()
+            except Exception as e:
+                logger.error(f"REST 요청 실행 중 오류 발생 ({path}): {str(e)}")
+                return
+            yield from response.json()
+            # 다음 페이지 URL에는 쿼리 파라미터가 포함되어 있습니다.
+            url = response.links.get('next', {}).get('url')
+            params = None
+
+    def is_not_found(self) -> bool:
+        """현재 스레드의 마지막 GraphQL 요청이 존재하지 않는 노드 때문에 실패했는지 확인합니다."""
+        return any(error.get('type') == 'NOT_FOUND' for error in self.last_errors)
+
     def get_repo(self) -> Any:
         """현재 리포지토리 객체를 반환합니다."""
         return self.g.get_repo(os.environ.get('GITHUB_REPOSITORY')) 
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+저장소 이슈 이벤트 수집 핸들러
+"""
+import os
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from ..client import GitHubClient
+
+logger = logging.getLogger(__name__)
+
+# issues 워크플로우 트리거와 같은 이벤트 (opened는 이슈 생성 시각으로 판단)
+EVENT_TYPES = ('closed', 'labeled', 'assigned')
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+class IssueEventHandler:
+    """
+    지정한 구간의 이슈 이벤트를 issues webhook 페이로드와 같은 형태로 수집합니다.
+
+    이벤트마다 워크플로우를 실행하지 않고, 예약 실행에서 한 번에 모아 처리할 때 사용합니다.
+    """
+
+    def __init__(self, client: GitHubClient, repository: Optional[str] = None):
+        self.client = client
+        self.repository = repository or os.environ.get('GITHUB_REPOSITORY', '')
+
+    def collect(self, since: datetime, until: datetime) -> List[Dict]:
+        """
+        (since, until] 구간의 이벤트를 시간순으로 반환합니다.
+
+        Returns:
+            List[Dict]: {'action', 'issue', 'assignee', 'created_at'} 목록
+        """
+        events = []
+
+        # 구간 안에 생성된 이슈 (since 이후 갱신된 이슈만 조회)
+        for issue in self.client._iter_rest(f"/repos/{self.repository}/issues",
+                                            {'state': 'all', 'since': since.isoformat()}):
+            if issue.get('pull_request'):
+                continue
+            created_at = _parse_time(issue['created_at'])
+            if since < created_at <= until:
+                events.append(self._payload('opened', issue, None, created_at))
+
+        # 이벤트 목록은 최신순이므로 since 이전 이벤트를 만나면 중단
+        for event in self.client._iter_rest(f"/repos/{self.repository}/issues/events"):
+            created_at = _parse_time(event['created_at'])
+            if created_at <= since:
+                break
+            issue = event.get('issue')
+            if created_at > until or event.get('event') not in EVENT_TYPES or not issue or issue.get('pull_request'):
+                continue
+            events.append(self._payload(event['event'], issue, event.get('assignee'), created_at))
+
+        events.sort(key=lambda event: event['created_at'])
+        logger.info(f"이슈 이벤트 {len(events)}개 수집 ({since.isoformat()} ~ {until.isoformat()})")
+        return events
+
+    @staticmethod
+    def _payload(action: str, issue: Dict, assignee: Optional[Dict], created_at: datetime) -> Dict:
+        return {
+            'action': action,
+            'issue': issue,
+            'assignee': assignee,
+            'created_at': created_at.astimezone(timezone.utc).isoformat()
+        }
@@ -133,11 +133,13 @@ class GitHubProjectHandler:
                             }
                             content {
                                 ... on Issue {
+                                    id
                                     number
                                     title
                                     url
                                     state
                                     createdAt
+                                    updatedAt
                                     closedAt
                                     labels(first: 100) {
                                         nodes {
@@ -184,11 +186,13 @@ class GitHubProjectHandler:
             issue = node['content']
             item_data = {
                 'id': node['id'],
+                'node_id': issue['id'],
                 'number': issue['number'],
                 'title': issue['title'],
                 'url': issue['url'],
                 'state': issue['state'],
                 'created_at': issue['createdAt'],
+                'updated_at': issue['updatedAt'],
                 'closed_at': issue['closedAt'],
                 'labels': [label['name'] for label in issue['labels']['nodes']],
                 'assignees': [
@@ -0,0 +1,215 @@
+"""
+이슈 타임라인 일괄 조회 핸들러
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from ..client import GitHubClient
+from ...task.models.task import WorkTime
+from ...utils.state_store import StateStore
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_STATE = 'issue_timelines'
+# nodes(ids:) 한 번에 조회하는 이슈 수
+DEFAULT_BATCH_SIZE = 50
+IN_PROGRESS_STATUS = 'In Progress'
+
+TIMELINE_ITEM_TYPES = "[ASSIGNED_EVENT, CLOSED_EVENT, REOPENED_EVENT, PROJECT_V2_ITEM_STATUS_CHANGED_EVENT]"
+
+TIMELINE_ITEMS_FIELDS = """pageInfo {
+                    hasNextPage
+                    endCursor
+                }
+                nodes {
+                    __typename
+                    ... on AssignedEvent {
+                        createdAt
+                    }
+                    ... on ClosedEvent {
+                        createdAt
+                    }
+                    ... on ReopenedEvent {
+                        createdAt
+                    }
+                    ... on ProjectV2ItemStatusChangedEvent {
+                        createdAt
+                        status
+                    }
+                }"""
+
+TIMELINE_QUERY = """
+query($ids: [ID!]!) {
+    nodes(ids: $ids) {
+        ... on Issue {
+            id
+            updatedAt
+            timelineItems(first: 100, itemTypes: %s) {
+                %s
+            }
+        }
+    }
+}
+""" % (TIMELINE_ITEM_TYPES, TIMELINE_ITEMS_FIELDS)
+
+# 이벤트가 100개를 넘는 이슈의 나머지 페이지 조회
+TIMELINE_PAGE_QUERY = """
+query($id: ID!, $after: String!) {
+    node(id: $id) {
+        ... on Issue {
+            timelineItems(first: 100, after: $after, itemTypes: %s) {
+                %s
+            }
+        }
+    }
+}
+""" % (TIMELINE_ITEM_TYPES, TIMELINE_ITEMS_FIELDS)
+
+EVENT_TYPES = {
+    'AssignedEvent': 'assigned',
+    'ClosedEvent': 'closed',
+    'ReopenedEvent': 'reopened',
+    'ProjectV2ItemStatusChangedEvent': 'status'
+}
+
+class TimelineHandler:
+    """
+    여러 이슈의 타임라인(담당자 지정, 진행중 이동, 닫힘/재오픈)을 nodes(ids:)로 묶어 조회합니다.
+
+    조회 결과는 이슈 ID와 updatedAt 기준으로 캐시하여, 변경된 이슈만 다시 조회합니다.
+    """
+
+    def __init__(self, client: GitHubClient, store: Optional[StateStore] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        self.client = client
+        self.store = store or StateStore(TIMELINE_STATE)
+        self.batch_size = batch_size
+        self.cache: Dict[str, Dict] = self.store.load()
+
+    def collect(self, issues: Dict[str, str]) -> Dict[str, List[Dict]]:
+        """
+        이슈별 타임라인 이벤트를 반환합니다.
+
+        Args:
+            issues: 이슈 노드 ID -> updatedAt
+
+        Returns:
+            Dict[str, List[Dict]]: 이슈 노드 ID -> 이벤트 목록 ({'type', 'at', 'status'})
+        """
+        stale = [node_id for node_id, updated_at in issues.items()
+                 if self.cache.get(node_id, {}).get('updated_at') != updated_at]
+        if stale:
+            logger.info(f"타임라인 조회: {len(stale)}/{len(issues)}개 이슈 ({-(-len(stale) // self.batch_size)}회 요청)")
+
+        for start in range(0, len(stale), self.batch_size):
+            batch = stale[start:start + self.batch_size]
+            result = self.client._execute_graphql(TIMELINE_QUERY, {"ids": batch})
+            if not result:
+                logger.error(f"타임라인 조회 실패 ({len(batch)}개 이슈)")
+                continue
+            for node in result.get('nodes') or []:
+                if not node or 'timelineItems' not in node:
+                    continue
+                timeline_nodes = self._fetch_all_pages(node['id'], node['timelineItems'])
+                if timeline_nodes is None:
+                    continue
+                self.cache[node['id']] = {
+                    'updated_at': node['updatedAt'],
+                    'events': self._parse_events(timeline_nodes)
+                }
+
+        # 현재 프로젝트에 없는 이슈는 캐시에서 제거
+        self.cache = {node_id: entry for node_id, entry in self.cache.items() if node_id in issues}
+        self.store.save(self.cache)
+        return {node_id: entry['events'] for node_id, entry in self.cache.items()}
+
+    def collect_work_times(self, project_items: Dict[int, Dict], now: Optional[datetime] = None) -> Dict[int, WorkTime]:
+        """프로젝트 아이템(이슈 번호 -> 아이템)의 작업 시간을 계산합니다."""
+        issues = {
+            item['node_id']: item.get('updated_at')
+            for item in project_items.values() if item.get('node_id')
+        }
+        timelines = self.collect(issues)
+        now = now or datetime.now(timezone.utc)
+
+        work_times = {}
+        for number, item in project_items.items():
+            work_time = compute_work_time(timelines.get(item.get('node_id'), []), now)
+            if work_time:
+                work_times[number] = work_time
+        return work_times
+
+    def _fetch_all_pages(self, node_id: str, timeline: Dict) -> Optional[List[Dict]]:
+        """
+        첫 페이지 이후의 타임라인 이벤트를 이어서 조회합니다.
+
+        중간 페이지 조회에 실패하면 일부 이벤트만으로 작업 시간이 계산되지 않도록 None을 반환하며,
+        해당 이슈는 캐시하지 않아 다음 실행에서 다시 조회합니다.
+        """
+        nodes = list(timeline['nodes'])
+        page_info = timeline.get('pageInfo') or {}
+        while page_info.get('hasNextPage'):
+            result = self.client._execute_graphql(TIMELINE_PAGE_QUERY, {"id": node_id, "after": page_info['endCursor']})
+            page = ((result or {}).get('node') or {}).get('timelineItems')
+            if not page:
+                logger.warning(f"타임라인 다음 페이지 조회 실패 ({node_id}), 다음 실행에서 다시 조회합니다.")
+                return None
+            nodes.extend(page['nodes'])
+            page_info = page.get('pageInfo') or {}
+        return nodes
+
+    @staticmethod
+    def _parse_events(nodes: List[Dict]) -> List[Dict]:
+        events = []
+        for node in nodes:
+            event_type = EVENT_TYPES.get(node.get('__typename'))
+            if not event_type or not node.get('createdAt'):
+                continue
+            event = {'type': event_type, 'at': node['createdAt']}
+            if event_type == 'status':
+                event['status'] = node.get('status')
+            events.append(event)
+        events.sort(key=lambda event: event['at'])
+        return events
+
+def compute_work_time(events: List[Dict], now: datetime) -> Optional[WorkTime]:
+    """
+    타임라인 이벤트로 작업 시간을 계산합니다.
+
+    작업 시작은 첫 담당자 지정 또는 첫 '진행중' 이동 중 이른 시점이며, 작업 시간은
+    시작 이후 이슈가 열려 있던 구간(닫힘/재오픈 기준)의 합입니다.
+    """
+    started_at = None
+    is_open = True
+    open_since = None
+    closed_at = None
+    active = 0.0
+
+    for event in events:
+        at = datetime.fromisoformat(event['at'].replace('Z', '+00:00'))
+        if event['type'] == 'closed':
+            if open_since is not None:
+                active += (at - open_since).total_seconds()
+            is_open, open_since, closed_at = False, None, at
+        elif event['type'] == 'reopened':
+            is_open, closed_at = True, None
+            if started_at is not None:
+                open_since = at
+        elif started_at is None and (
+            event['type'] == 'assigned' or (event['type'] == 'status' and event.get('status') == IN_PROGRESS_STATUS)
+        ):
+            started_at = at
+            open_since = at if is_open else None
+
+    if started_at is None:
+        return None
+
+    if open_since is not None:
+        active += (now - open_since).total_seconds()
+    end = now if is_open else closed_at
+    return WorkTime(
+        started_at=started_at.isoformat(),
+        elapsed=max((end - started_at).total_seconds(), 0.0),
+        active=active,
+        finished=not is_open
+    )
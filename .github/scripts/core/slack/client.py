@@ -1,83 +1,87 @@
 """Slack API 클라이언트"""
 import os
 from typing import Dict, List
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
 from config.user_mappings import get_slack_users_by_position
+from .delivery import AsyncDeliverer, Delivery, DeliveryResult, DEFAULT_CONCURRENCY, PRIORITY_LOW, PRIORITY_NORMAL
+from .resolution_cache import ResolutionCache
+from .spool import DeliverySpool
 
 class SlackClient:
-    def __init__(self, token: str):
-        self.client = WebClient(token=token)
+    def __init__(self, token: str, concurrency: int = None):
+        self.cache = ResolutionCache()
+        self.spool = DeliverySpool()
+        self.deliverer = AsyncDeliverer(
+            token, concurrency or int(os.environ.get('SLACK_CONCURRENCY', DEFAULT_CONCURRENCY)), self.cache
+        )
         self.channel_id = os.environ['SLACK_CHANNEL_ID']
         self.pm_id = get_slack_users_by_position('pm')[0].replace('@', '')
         self.head_dev_id = get_slack_users_by_position('head_developer')[0].replace('@', '')
     
+    def send_many(self, deliveries: List[Delivery]) -> List[DeliveryResult]:
+        """
+        여러 수신자에게 동시에 전송하고 수신자별 결과를 반환합니다.
+        
+        일시적 오류로 실패한 메시지는 보관하며, 보관된 메시지는 flush_spool()에서만 재전송합니다.
+        """
+        results = self.deliverer.send(deliveries)
+        
+        for delivery, result in zip(deliveries, results):
+            if result.ok:
+                continue
+            print(f"메시지 전송 실패 (수신자: {result.recipient}): {result.error}")
+            if result.transient:
+                result.transient = self.spool.add(delivery)
+                if result.transient:
+                    print("다음 실행에서 재전송하도록 보관합니다.")
+            # 필요한 권한 정보 출력
+            if result.error and 'missing_scope' in result.error:
+                print("필요한 Slack API 권한: chat:write, im:write, users:read, users:read.email")
+                print("Slack API 애플리케이션 설정에서 권한을 추가하고 토큰을 재발급 받으세요.")
+        
+        self.cache.save()
+        self.spool.save()
+        return results
+    
+    def flush_spool(self) -> List[DeliveryResult]:
+        """
+        보관된 메시지를 별도 배치로 재전송합니다. (각 실행 스크립트 시작 시 한 번 호출)
+        
+        스레드로 나뉜 메시지는 마지막으로 보낸 메시지 다음부터 이어서 전송합니다.
+        """
+        spooled = self.spool.take()
+        if not spooled:
+            return []
+        # 꺼낸 메시지를 먼저 보관함에서 지워, 전송 도중 중단되어도 다음 실행에서 중복 전송하지 않습니다.
+        self.spool.save()
+        print(f"보관된 메시지 {len(spooled)}개를 재전송합니다.")
+        return self.send_many(spooled)
+    
+    def channel_delivery(self, message: Dict) -> Delivery:
+        """채널 알림 전송 요청 (DM보다 낮은 우선순위)"""
+        text = message['blocks'][0]['text']['text'] if 'text' in message['blocks'][0] else message['text']
+        return Delivery(self.channel_id, message['blocks'], text, priority=PRIORITY_LOW,
+                        continuations=message.get('continuations', []))
+    
     def send_channel_notification(self, message: Dict):
         """채널 알림 전송"""
-        try:
-            self.client.chat_postMessage(
-                channel=self.channel_id,
-                blocks=message['blocks'],
-                text=message['blocks'][0]['text']['text'] if 'text' in message['blocks'][0] else message['text']
-            )
-        except SlackApiError as e:
-            print(f"채널 메시지 전송 실패: {e.response['error']}")
+        self.send_many([self.channel_delivery(message)])
     
     def send_pm_report(self, message: Dict):
         """PM과 헤드 개발자에게 리포트 전송"""
         recipients = [self.pm_id, self.head_dev_id]
-        
-        for recipient in recipients:
-            try:
-                self.client.chat_postMessage(
-                    channel=recipient,
-                    blocks=message['blocks'],
-                    text=message['blocks'][0]['text']['text']
-                )
-            except SlackApiError as e:
-                print(f"리포트 전송 실패 (수신자: {recipient}): {e.response['error']}")
+        text = message.get('text') or message['blocks'][0]['text']['text']
+        self.send_many([
+            Delivery(recipient, message['blocks'], text, continuations=message.get('continuations', []))
+            for recipient in recipients
+        ])
     
-    def send_dm(self, user_id: str, blocks: List[Dict], text: str):
-        """DM 전송"""
-        try:
-            # '@' 기호 제거 및 사용자 ID 정리
-            clean_user_id = user_id.replace('@', '').strip()
-            
-            # 사용자 ID가 이메일 형식인지 확인
-            if '@' in clean_user_id and '.' in clean_user_id:
-                # 이메일 형식이면 사용자 조회
-                response = self.client.users_lookupByEmail(email=clean_user_id)
-                if response["ok"]:
-                    clean_user_id = response["user"]["id"]
-            
-            # 사용자 ID로 DM 채널 열기
-            response = self.client.conversations_open(users=[clean_user_id])
-            if response["ok"]:
-                channel_id = response["channel"]["id"]
-                
-                # DM 채널에 메시지 전송
-                self.client.chat_postMessage(
-                    channel=channel_id,
-                    blocks=blocks,
-                    text=text
-                )
-                print(f"DM 전송 성공 ({user_id})")
-            else:
-                error_msg = f"DM 채널 열기 실패 ({user_id}): {response.get('error', '알 수 없는 오류')}"
-                print(error_msg)
-                raise Exception(error_msg)
-                
-        except SlackApiError as e:
-            error_msg = f"DM 전송 실패 ({user_id}): {e.response['error']}"
-            print(error_msg)
-            # 필요한 권한 정보 출력
-            if 'missing_scope' in e.response['error']:
-                print("필요한 Slack API 권한: chat:write, im:write, users:read, users:read.email")
-                print("Slack API 애플리케이션 설정에서 권한을 추가하고 토큰을 재발급 받으세요.")
-            # 예외를 상위 호출자에게 전파
-            raise Exception(error_msg) from e
-        except Exception as e:
-            error_msg = f"DM 전송 중 예상치 못한 오류 발생 ({user_id}): {str(e)}"
-            print(error_msg)
+    def send_dm(self, user_id: str, blocks: List[Dict], text: str, priority: int = PRIORITY_NORMAL,
+                continuations: List[List[Dict]] = None):
+        """DM 전송 (보관함으로 넘어간 경우는 실패로 보지 않습니다)"""
+        result = self.send_many([Delivery(user_id, blocks, text, priority=priority, continuations=continuations or [])])[0]
+        if result.transient:
+            return
+        if not result.ok:
             # 예외를 상위 호출자에게 전파
-            raise Exception(error_msg) from e 
\ No newline at end of file
+            raise Exception(f"DM 전송 실패 ({user_id}): {result.error}")
+        print(f"DM 전송 성공 ({user_id})")
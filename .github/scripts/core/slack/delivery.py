@@ -0,0 +1,154 @@
+"""Slack 비동기 일괄 전송"""
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import aiohttp
+from slack_sdk.web.async_client import AsyncWebClient
+from slack_sdk.errors import SlackApiError
+from .rate_limiter import RateLimiter, get_retry_after
+from .resolution_cache import ResolutionCache, STALE_ERRORS
+
+# 동시에 처리하는 최대 수신자 수
+DEFAULT_CONCURRENCY = 8
+# 전송 우선순위 (작을수록 먼저 전송)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+# ratelimited 응답 시 실행 중 재시도 횟수와 최대 대기 시간(초). 넘기면 보관함으로 보냅니다.
+MAX_RATELIMIT_RETRIES = 3
+MAX_RETRY_WAIT = 30.0
+# 다음 실행에서 다시 시도할 만한 일시적 오류
+TRANSIENT_ERRORS = ('ratelimited', 'internal_error', 'service_unavailable', 'fatal_error', 'request_timeout')
+
+@dataclass
+class Delivery:
+    """전송 요청 (수신자: Slack 사용자 ID, 이메일 또는 채널 ID)"""
+    recipient: str
+    blocks: List[Dict]
+    text: str
+    priority: int = PRIORITY_NORMAL
+    # 첫 메시지의 스레드에 이어서 보낼 블록 목록 (메시지 분할 시)
+    continuations: List[List[Dict]] = field(default_factory=list)
+    attempts: int = 0
+    queued_at: Optional[str] = None
+    # 전송 진행 상황 (보관 후 재전송 시 이미 보낸 메시지는 건너뜁니다)
+    channel: Optional[str] = None
+    thread_ts: Optional[str] = None
+    pages_sent: int = 0
+
+@dataclass
+class DeliveryResult:
+    """수신자별 전송 결과"""
+    recipient: str
+    ok: bool
+    channel: Optional[str] = None
+    ts: Optional[str] = None
+    error: Optional[str] = None
+    # 일시적 오류로 실패하여 다음 실행에서 재전송해야 하는지 여부
+    transient: bool = False
+
+class AsyncDeliverer:
+    """
+    AsyncWebClient로 여러 수신자에게 동시에 메시지를 전송합니다.
+
+    모든 API 호출은 RateLimiter로 메서드별 한도에 맞춰 예약하며, 우선순위가 높은 전송부터 시작합니다.
+    """
+
+    def __init__(self, token: str, concurrency: int = DEFAULT_CONCURRENCY,
+                 cache: Optional[ResolutionCache] = None, limiter: Optional[RateLimiter] = None):
+        self.token = token
+        self.concurrency = concurrency
+        self.cache = cache or ResolutionCache()
+        self.limiter = limiter or RateLimiter()
+
+    def send(self, deliveries: List[Delivery]) -> List[DeliveryResult]:
+        """동기 코드에서 일괄 전송을 실행합니다. 결과는 요청 순서와 같습니다."""
+        if not deliveries:
+            return []
+        return asyncio.run(self.send_async(deliveries))
+
+    async def send_async(self, deliveries: List[Delivery]) -> List[DeliveryResult]:
+        """세마포어로 동시 요청 수를 제한하며 모든 전송을 처리합니다."""
+        client = AsyncWebClient(token=self.token)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def deliver(delivery: Delivery) -> DeliveryResult:
+            async with semaphore:
+                return await self._deliver(client, delivery)
+
+        # 세마포어는 대기 순서대로 깨우므로 우선순위 순으로 작업을 만듭니다.
+        order = sorted(range(len(deliveries)), key=lambda index: deliveries[index].priority)
+        tasks = {index: asyncio.ensure_future(deliver(deliveries[index])) for index in order}
+        await asyncio.gather(*tasks.values())
+        return [tasks[index].result() for index in range(len(deliveries))]
+
+    async def _deliver(self, client: AsyncWebClient, delivery: Delivery) -> DeliveryResult:
+        try:
+            try:
+                return await self._post(client, delivery)
+            except SlackApiError as e:
+                # 캐시된 ID가 무효화된 경우 캐시를 비우고 한 번 더 해석합니다.
+                if e.response.get('error') not in STALE_ERRORS or not self.cache.invalidate(delivery.recipient):
+                    raise
+                return await self._post(client, delivery)
+        except SlackApiError as e:
+            error = e.response.get('error', str(e))
+            return DeliveryResult(delivery.recipient, False, error=error, transient=error in TRANSIENT_ERRORS)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return DeliveryResult(delivery.recipient, False, error=str(e) or type(e).__name__, transient=True)
+        except Exception as e:
+            return DeliveryResult(delivery.recipient, False, error=str(e))
+
+    async def _post(self, client: AsyncWebClient, delivery: Delivery) -> DeliveryResult:
+        """첫 메시지와 이어지는 메시지를 전송하며, 보낸 만큼 delivery에 기록합니다."""
+        if delivery.thread_ts is None:
+            channel = await self._resolve_channel(client, delivery.recipient)
+            response = await self._call(client, 'chat_postMessage', channel=channel, blocks=delivery.blocks, text=delivery.text)
+            delivery.channel, delivery.thread_ts = channel, response.get('ts')
+        for index in range(delivery.pages_sent, len(delivery.continuations)):
+            await self._call(client, 'chat_postMessage', channel=delivery.channel, blocks=delivery.continuations[index],
+                             text=delivery.text, thread_ts=delivery.thread_ts)
+            delivery.pages_sent = index + 1
+        return DeliveryResult(delivery.recipient, True, channel=delivery.channel, ts=delivery.thread_ts)
+
+    async def _call(self, client: AsyncWebClient, method: str, **kwargs):
+        """호출 한도를 지키며 API를 호출하고, ratelimited 응답은 Retry-After만큼 기다린 뒤 재시도합니다."""
+        channel = kwargs.get('channel')
+        for attempt in range(MAX_RATELIMIT_RETRIES + 1):
+            await self.limiter.acquire(method, channel)
+            try:
+                return await getattr(client, method)(**kwargs)
+            except SlackApiError as e:
+                if e.response.get('error') != 'ratelimited':
+                    raise
+                retry_after = get_retry_after(e.response)
+                self.limiter.block(method, retry_after, channel)
+                if attempt == MAX_RATELIMIT_RETRIES or retry_after > MAX_RETRY_WAIT:
+                    raise
+
+    async def _resolve_channel(self, client: AsyncWebClient, recipient: str) -> str:
+        """수신자를 메시지를 보낼 채널 ID로 변환합니다. 해석 결과는 캐시에 저장합니다."""
+        recipient = recipient.strip().lstrip('@')
+
+        # GitHub 로그인이면 매핑된 Slack ID 사용
+        recipient = self.cache.slack_id_for_login(recipient) or recipient
+
+        # 이메일이면 사용자 ID 조회
+        if '@' in recipient:
+            email = recipient
+            recipient = self.cache.user_for_email(email)
+            if not recipient:
+                response = await self._call(client, 'users_lookupByEmail', email=email)
+                recipient = response['user']['id']
+                self.cache.set_user(email, recipient)
+
+        # 채널/DM 채널 ID는 그대로 사용
+        if recipient[:1] in ('C', 'G', 'D'):
+            return recipient
+
+        channel = self.cache.dm_channel_for(recipient)
+        if not channel:
+            response = await self._call(client, 'conversations_open', users=[recipient])
+            channel = response['channel']['id']
+            self.cache.set_dm_channel(recipient, channel)
+        return channel
@@ -4,5 +4,7 @@ Slack 메시지 포맷터 모듈
 from .task import TaskFormatter
 from .proposal import ProposalFormatter
 from .report import ReportFormatter
+from .digest import DigestFormatter
+from .user_digest import UserDigestFormatter
 
-__all__ = ['TaskFormatter', 'ProposalFormatter', 'ReportFormatter'] 
\ No newline at end of file
+__all__ = ['TaskFormatter', 'ProposalFormatter', 'ReportFormatter', 'DigestFormatter', 'UserDigestFormatter'] 
\ No newline at end of file
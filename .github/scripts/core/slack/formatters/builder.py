@@ -0,0 +1,87 @@
+"""
+Block Kit 메시지 빌더
+"""
+import json
+from typing import Dict, List, Optional
+from .base import BaseFormatter
+
+# Slack 메시지/블록 제한
+MAX_BLOCKS = 50
+MAX_HEADER_TEXT = 150
+MAX_SECTION_TEXT = 3000
+MAX_FIELDS = 10
+MAX_FIELD_TEXT = 2000
+# 메시지 하나의 블록 JSON 크기 상한 (바이트, 여유를 두고 설정)
+MAX_MESSAGE_BYTES = 12000
+ELLIPSIS = '…'
+
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - len(ELLIPSIS)] + ELLIPSIS
+
+class MessageBuilder(BaseFormatter):
+    """
+    블록을 쌓으면서 블록 수와 크기를 재고, 제한을 넘으면 다음 메시지로 나눕니다.
+
+    build()는 첫 메시지를 {'blocks', 'text'}로, 나머지는 'continuations'로 반환하며
+    클라이언트가 이어지는 메시지를 첫 메시지의 스레드에 전송합니다.
+    """
+
+    def __init__(self, text: str, max_blocks: int = MAX_BLOCKS, max_bytes: int = MAX_MESSAGE_BYTES):
+        self.text = text
+        self.max_blocks = max_blocks
+        self.max_bytes = max_bytes
+        self.pages: List[List[Dict]] = [[]]
+        self.page_bytes = 0
+
+    def add(self, block: Dict) -> 'MessageBuilder':
+        """블록을 추가합니다. 현재 메시지에 들어가지 않으면 새 메시지를 시작합니다."""
+        size = len(json.dumps(block, ensure_ascii=False).encode('utf-8')) + 1
+        page = self.pages[-1]
+        if page and (len(page) >= self.max_blocks or self.page_bytes + size > self.max_bytes):
+            self.pages.append([])
+            self.page_bytes = 0
+        self.pages[-1].append(block)
+        self.page_bytes += size
+        return self
+
+    def add_header(self, text: str) -> 'MessageBuilder':
+        return self.add(self.create_header(_truncate(text, MAX_HEADER_TEXT)))
+
+    def add_section(self, text: str = None, fields: List[Dict] = None) -> 'MessageBuilder':
+        return self.add(self.create_section(text=_truncate(text, MAX_SECTION_TEXT) if text else None, fields=fields))
+
+    def add_divider(self) -> 'MessageBuilder':
+        return self.add(self.create_divider())
+
+    def add_context(self, text: str) -> 'MessageBuilder':
+        return self.add({"type": "context", "elements": [{"type": "mrkdwn", "text": _truncate(text, MAX_SECTION_TEXT)}]})
+
+    def add_fields(self, fields: List[str]) -> 'MessageBuilder':
+        """mrkdwn 필드를 섹션당 최대 10개씩 묶어 추가합니다. (2열로 표시되므로 짝수 개 권장)"""
+        for start in range(0, len(fields), MAX_FIELDS):
+            self.add_section(fields=[
+                {"type": "mrkdwn", "text": _truncate(field, MAX_FIELD_TEXT)}
+                for field in fields[start:start + MAX_FIELDS]
+            ])
+        return self
+
+    def add_lines(self, lines: List[str], separator: str = '\n') -> 'MessageBuilder':
+        """여러 줄을 섹션 텍스트 제한 안에서 최대한 적은 섹션으로 묶어 추가합니다."""
+        chunk: Optional[str] = None
+        for line in lines:
+            line = _truncate(line, MAX_SECTION_TEXT)
+            if chunk is not None and len(chunk) + len(separator) + len(line) > MAX_SECTION_TEXT:
+                self.add_section(text=chunk)
+                chunk = None
+            chunk = line if chunk is None else chunk + separator + line
+        if chunk:
+            self.add_section(text=chunk)
+        return self
+
+    def build(self) -> Dict:
+        """메시지를 반환합니다. 나뉜 경우 나머지는 'continuations'에 담깁니다."""
+        pages = [page for page in self.pages if page]
+        message = {"blocks": pages[0] if pages else [], "text": self.text}
+        if len(pages) > 1:
+            message["continuations"] = pages[1:]
+        return message
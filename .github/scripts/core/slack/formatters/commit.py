@@ -1,6 +1,7 @@
 """커밋 메시지 포맷터"""
 from typing import Dict, List
 from .base import BaseFormatter
+from .builder import MessageBuilder
 import re
 
 COMMIT_TYPES = {
@@ -29,7 +30,7 @@ class CommitFormatter(BaseFormatter):
                 'title': message.split('\n')[0],
                 'body': '\n'.join(message.split('\n')[1:]).strip()
             }
-            
+        
         commit_type = title_match.group(1).lower()
         title = title_match.group(2)
         
@@ -44,11 +45,11 @@ class CommitFormatter(BaseFormatter):
             line = line.strip()
             if not line:
                 continue
-                
+            
             if line.lower() in ['[body]', '[todo]', '[footer]']:
                 current_section = line.strip('[]').lower()
                 continue
-                
+            
             if current_section == 'body':
                 body.append(line)
         
@@ -61,42 +62,35 @@ class CommitFormatter(BaseFormatter):
     
     @classmethod
     def format_commits(cls, commits: List[Dict], repository: str, branch: str) -> Dict:
-        """커밋 메시지 포맷팅"""
-        blocks = [
-            cls.create_header(f"🔄 새로운 커밋이 푸시되었습니다"),
-            cls.create_section(fields=[
-                {"type": "mrkdwn", "text": f"*저장소:*\n{repository}"},
-                {"type": "mrkdwn", "text": f"*브랜치:*\n{branch}"}
-            ])
-        ]
+        """커밋 메시지 포맷팅 (커밋이 많으면 스레드로 이어지는 메시지로 나눔)"""
+        builder = MessageBuilder(f"🔄 새로운 커밋이 푸시되었습니다 ({len(commits)}개)")
+        builder.add_header(f"🔄 새로운 커밋이 푸시되었습니다")
+        builder.add_fields([f"*저장소:*\n{repository}", f"*브랜치:*\n{branch}"])
         
-        for commit in commits[:5]:  # 최근 5개 커밋만 표시
+        entries = []
+        for commit in commits:
             author = commit.get('author', {}).get('name', 'Unknown')
             parsed = cls.parse_commit_message(commit.get('message', ''))
             url = commit.get('url', '')
             
-            commit_block = cls.create_section(
-                text=f"{parsed['type_info']['emoji']} *{author}* - {parsed['type_info']['description']}\n"
-                     f"*{parsed['title']}*\n"
-                     f"{cls._format_body(parsed['body'])}\n"
-                     f"<{url}|커밋 보기>"
+            entries.append(
+                f"{parsed['type_info']['emoji']} *{author}* - {parsed['type_info']['description']}\n"
+                f"*{parsed['title']}*\n"
+                f"{cls._format_body(parsed['body'])}\n"
+                f"<{url}|커밋 보기>"
             )
-            blocks.append(commit_block)
+        # 여러 커밋을 섹션 하나에 묶어 블록 수를 줄입니다.
+        builder.add_lines(entries, separator='\n\n')
         
-        if len(commits) > 5:
-            blocks.append(cls.create_section(
-                text=f"_이외 {len(commits) - 5}개의 커밋이 더 있습니다._"
-            ))
-        
-        blocks.append(cls.create_divider())
-        return {"blocks": blocks}
+        builder.add_divider()
+        return builder.build()
     
     @staticmethod
     def _format_body(body: str) -> str:
         """커밋 본문을 포맷팅"""
         if not body:
             return ''
-            
+        
         lines = []
         for line in body.strip().split('\n'):
             line = line.strip()
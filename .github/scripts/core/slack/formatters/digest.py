@@ -0,0 +1,64 @@
+"""
+이슈 이벤트 요약 메시지 포맷터
+"""
+import os
+from datetime import datetime
+from typing import Dict, List
+import pytz
+from .base import BaseFormatter
+from .builder import MessageBuilder
+from .proposal import ProposalFormatter
+
+ACTION_LABELS = {
+    'opened': '생성',
+    'closed': '완료',
+    'labeled': '라벨',
+    'assigned': '할당',
+}
+KIND_HEADERS = {
+    'proposal': '📝 제안서',
+    'task': '🎯 태스크',
+}
+
+class DigestFormatter(BaseFormatter):
+    """이슈별로 합친 이벤트를 한 메시지로 포맷팅"""
+
+    @classmethod
+    def format_digest(cls, rows: List[Dict], since: str, until: str) -> Dict:
+        """요약 메시지 포맷팅"""
+        builder = MessageBuilder(f"이슈 변경 요약 ({len(rows)}건)")
+        builder.add_header(f"🗂️ 이슈 변경 요약 ({len(rows)}건)")
+        builder.add_context(f"{cls._format_time(since)} ~ {cls._format_time(until)}")
+
+        for kind, header in KIND_HEADERS.items():
+            kind_rows = [row for row in rows if row['kind'] == kind]
+            if not kind_rows:
+                continue
+            builder.add_section(text=f"*{header}* ({len(kind_rows)}건)")
+            builder.add_lines([cls._format_row(row) for row in kind_rows])
+
+        builder.add_divider()
+        return builder.build()
+
+    @classmethod
+    def _format_row(cls, row: Dict) -> str:
+        """이슈 한 행: 링크, 현재 상태, 이벤트 흐름, 담당자"""
+        actions = ' → '.join(ACTION_LABELS.get(action, action) for action in row['actions'])
+        line = f"• <{row['url']}|#{row['number']} {row['title']}> · *{cls._status(row)}* · {actions}"
+        if row['assignees']:
+            line += f" · 👤 {', '.join(row['assignees'])}"
+        return line
+
+    @staticmethod
+    def _status(row: Dict) -> str:
+        if row['kind'] == 'proposal':
+            for label, (_, status) in ProposalFormatter.STATUS_INFO.items():
+                if label in row['labels']:
+                    return status
+            return ProposalFormatter.STATUS_INFO['⌛ 검토대기'][1]
+        return '완료' if row['state'] == 'closed' else '진행중'
+
+    @staticmethod
+    def _format_time(value: str) -> str:
+        tz = pytz.timezone(os.environ.get('TIMEZONE', 'Asia/Seoul'))
+        return datetime.fromisoformat(value).astimezone(tz).strftime('%m-%d %H:%M')
@@ -3,6 +3,7 @@
 """
 from typing import Dict
 from .base import BaseFormatter
+from .builder import MessageBuilder
 
 class ProposalFormatter(BaseFormatter):
     """제안서 관련 메시지 포맷팅"""
@@ -28,17 +29,9 @@ class ProposalFormatter(BaseFormatter):
         else:
             header, status = cls.STATUS_INFO['⌛ 검토대기']
         
-        return {
-            "blocks": [
-                cls.create_header(header),
-                cls.create_section(fields=[
-                    {"type": "mrkdwn", "text": f"*제목:*\n{title}"},
-                    {"type": "mrkdwn", "text": f"*제안자:*\n{user}"}
-                ]),
-                cls.create_section(fields=[
-                    {"type": "mrkdwn", "text": f"*상태:*\n{status}"}
-                ]),
-                cls.create_section(text=f"👉 <{url}|제안서 보러가기>"),
-                cls.create_divider()
-            ]
-        } 
\ No newline at end of file
+        builder = MessageBuilder(f"{header}: {title}")
+        builder.add_header(header)
+        builder.add_fields([f"*제목:*\n{title}", f"*제안자:*\n{user}", f"*상태:*\n{status}"])
+        builder.add_section(text=f"👉 <{url}|제안서 보러가기>")
+        builder.add_divider()
+        return builder.build()
@@ -3,6 +3,8 @@
 """
 from typing import Dict, List
 from .base import BaseFormatter
+from .builder import MessageBuilder
+from core.task.models.report import ReportData
 
 class ReportFormatter(BaseFormatter):
     """리포트 관련 메시지 포맷팅"""
@@ -23,4 +25,37 @@ class ReportFormatter(BaseFormatter):
                 text=f"*{tasks[0]['title']}*\n\n👉 <{tasks[0]['html_url']}|로그 보러가기>"
             ),
             cls.create_divider()
-        ] 
\ No newline at end of file
+        ]
+    
+    @classmethod
+    def format_project_report(cls, report_data: ReportData) -> Dict:
+        """프로젝트 진행 현황 리포트 메시지 포맷팅 (길면 스레드로 이어지는 메시지로 나눔)"""
+        builder = MessageBuilder("📊 일일 프로젝트 진행 현황 리포트")
+        builder.add_header("📊 일일 프로젝트 진행 현황 리포트")
+        if report_data.report_url:
+            builder.add_section(text=f"👉 <{report_data.report_url}|상세 보고서 보기>")
+        builder.add_fields([
+            f"*전체 태스크:*\n{report_data.total_tasks}개",
+            f"*완료된 태스크:*\n{report_data.completed_tasks}개",
+            f"*진행중 태스크:*\n{report_data.in_progress_tasks}개",
+            f"*진행률:*\n{report_data.completion_rate:.1f}%"
+        ])
+        
+        # 태스크 한 건당 필드 두 개(제목, 시각/담당자)씩, 섹션 하나에 5건을 묶습니다.
+        if report_data.completed_today:
+            builder.add_header(f"✅ 오늘 완료된 태스크 ({len(report_data.completed_today)}개)")
+            fields = []
+            for todo in report_data.completed_today:
+                fields.append(f"*태스크:*\n{todo.title}")
+                fields.append(f"*완료 시각:*\n{todo.completed_at.split()[1]}")  # 시간만 표시
+            builder.add_fields(fields)
+        
+        if report_data.in_progress_today:
+            builder.add_header(f"⏳ 오늘 진행중인 태스크 ({len(report_data.in_progress_today)}개)")
+            fields = []
+            for task in report_data.in_progress_today:
+                fields.append(f"*태스크:*\n{task.title}")
+                fields.append(f"*담당자:*\n{', '.join(task.assignees) or '-'}")
+            builder.add_fields(fields)
+        
+        return builder.build()
@@ -1,15 +1,16 @@
 """
 태스크 메시지 포맷터
 """
-from typing import Dict, List
+from typing import Dict, Optional
 from .base import BaseFormatter
+from .builder import MessageBuilder
 
 class TaskFormatter(BaseFormatter):
     """태스크 관련 메시지 포맷팅"""
     
     @classmethod
-    def format_task(cls, task: Dict, event_type: str) -> Dict:
-        """태스크 메시지 포맷팅"""
+    def format_task(cls, task: Dict, event_type: str, progress: Optional[Dict] = None) -> Dict:
+        """태스크 메시지 포맷팅 (progress: 상위 태스크의 {'task', 'total', 'completed'})"""
         title = task['title']
         url = task['html_url']
         user = task['user']['login']
@@ -23,18 +24,48 @@ class TaskFormatter(BaseFormatter):
             'closed': "✅ 태스크가 완료되었습니다",
         }.get(event_type, "ℹ️ 태스크가 업데이트되었습니다")
         
-        return {
-            "blocks": [
-                cls.create_header(header_text),
-                cls.create_section(fields=[
-                    {"type": "mrkdwn", "text": f"*제목:*\n{title}"},
-                    {"type": "mrkdwn", "text": f"*담당자:*\n{user}"}
-                ]),
-                cls.create_section(fields=[
-                    {"type": "mrkdwn", "text": f"*카테고리:*\n{category}"},
-                    {"type": "mrkdwn", "text": f"*예상 소요 시간:*\n{weight}"}
-                ]),
-                cls.create_section(text=f"👉 <{url}|태스크 보러가기>"),
-                cls.create_divider()
-            ]
-        } 
\ No newline at end of file
+        builder = MessageBuilder(f"{header_text}: {title}")
+        builder.add_header(header_text)
+        builder.add_fields([
+            f"*제목:*\n{title}",
+            f"*담당자:*\n{user}",
+            f"*카테고리:*\n{category}",
+            f"*예상 소요 시간:*\n{weight}"
+        ])
+        
+        if progress and progress['total']:
+            rate = progress['completed'] / progress['total'] * 100
+            builder.add_section(
+                text=f"*상위 태스크 진행률:*\n{progress['task']} — {progress['completed']}/{progress['total']} ({rate:.0f}%)"
+            )
+        
+        builder.add_section(text=f"👉 <{url}|태스크 보러가기>")
+        builder.add_divider()
+        return builder.build()
+    
+    @classmethod
+    def format_assignment(cls, task: Dict, is_todo: bool, parent_task: Optional[Dict] = None) -> Dict:
+        """담당자 할당 DM 포맷팅"""
+        header_text = "📝 새로운 Todo가 할당되었습니다" if is_todo else "🎯 새로운 할일이 할당되었습니다"
+        message_text = f"새로운 Todo가 할당되었습니다: {task['title']}" if is_todo else f"새로운 할일이 할당되었습니다: {task['title']}"
+        
+        builder = MessageBuilder(message_text)
+        builder.add_header(header_text)
+        builder.add_fields([f"*할일:*\n{task['title']}", f"*상태:*\n{task['state']}"])
+        if parent_task:
+            builder.add_section(text=f"*상위 태스크:*\n<{parent_task['url']}|{parent_task['title']}>")
+        builder.add_section(text=f"👉 <{task['html_url']}|할일 보러가기>")
+        builder.add_divider()
+        return builder.build()
+    
+    @classmethod
+    def format_assignment_mention(cls, task: Dict, is_todo: bool, slack_id: str, user_name: str) -> Dict:
+        """DM 전송에 실패했을 때 채널에 보낼 담당자 멘션 포맷팅"""
+        header_text = "📝 새로운 Todo가 할당되었습니다" if is_todo else "🎯 새로운 할일이 할당되었습니다"
+        
+        builder = MessageBuilder(f"{user_name}님에게 새로운 할일이 할당되었습니다: {task['title']}")
+        builder.add_section(text=f"*{header_text}*\n<@{slack_id}> 님에게 새로운 할일이 할당되었습니다.")
+        builder.add_fields([f"*할일:*\n{task['title']}", f"*상태:*\n{task['state']}"])
+        builder.add_section(text=f"👉 <{task['html_url']}|할일 보러가기>")
+        builder.add_divider()
+        return builder.build()
@@ -0,0 +1,43 @@
+"""
+사용자별 일일 요약 메시지 포맷터
+"""
+from typing import Dict, List, TYPE_CHECKING
+from .base import BaseFormatter
+from .builder import MessageBuilder
+
+if TYPE_CHECKING:
+    from ..handlers.user_digest import DigestItem, UserDigest
+
+class UserDigestFormatter(BaseFormatter):
+    """담당 투두 요약 메시지 포맷팅"""
+
+    @classmethod
+    def format_user_digest(cls, digest: 'UserDigest', yesterday: str) -> Dict:
+        """사용자별 요약 메시지 포맷팅"""
+        builder = MessageBuilder(f"{digest.name}님의 오늘 할일 ({len(digest.open_todos)}개)")
+        builder.add_header(f"☀️ {digest.name}님의 일일 요약")
+        builder.add_fields([
+            f"*진행중 투두:*\n{len(digest.open_todos)}개",
+            f"*어제 완료:*\n{len(digest.completed_yesterday)}개"
+        ])
+
+        cls._add_items(builder, "🆕 새로 할당된 투두", digest.newly_assigned)
+        cls._add_items(builder, "📋 진행중인 투두", digest.open_todos)
+        cls._add_items(builder, f"✅ 어제({yesterday}) 완료한 투두", digest.completed_yesterday)
+
+        builder.add_divider()
+        return builder.build()
+
+    @classmethod
+    def _add_items(cls, builder: MessageBuilder, title: str, items: List['DigestItem']):
+        if not items:
+            return
+        builder.add_section(text=f"*{title}* ({len(items)}개)")
+        builder.add_lines([cls._format_item(item) for item in items])
+
+    @staticmethod
+    def _format_item(item: 'DigestItem') -> str:
+        """투두 링크와 상위 태스크 링크"""
+        todo = f"<{item.url}|#{item.number} {item.title}>" if item.url else f"#{item.number} {item.title}"
+        task = f"<{item.task_url}|{item.task}>" if item.task_url else item.task
+        return f"• {todo} · 상위 태스크: {task}"
@@ -4,5 +4,7 @@ Slack 이벤트 핸들러 모듈
 from .task import TaskHandler
 from .proposal import ProposalHandler
 from .report import ReportHandler
+from .digest import DigestHandler
+from .user_digest import UserDigestHandler
 
-__all__ = ['TaskHandler', 'ProposalHandler', 'ReportHandler'] 
\ No newline at end of file
+__all__ = ['TaskHandler', 'ProposalHandler', 'ReportHandler', 'DigestHandler', 'UserDigestHandler'] 
\ No newline at end of file
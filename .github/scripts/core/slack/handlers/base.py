@@ -1,14 +1,19 @@
 """
 기본 이벤트 핸들러
 """
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 from ..client import SlackClient
 
+if TYPE_CHECKING:
+    from .digest import EventDigest
+
 class BaseHandler:
     """기본 Slack 이벤트 핸들러"""
     
-    def __init__(self, client: SlackClient):
+    def __init__(self, client: SlackClient, digest: 'EventDigest' = None):
         self.client = client
+        # 요약 모드에서는 채널 알림을 즉시 보내지 않고 digest에 보관합니다.
+        self.digest = digest
     
     def handle(self, event_data: Dict):
         """이벤트 처리"""
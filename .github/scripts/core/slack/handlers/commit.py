@@ -16,6 +16,6 @@ class CommitHandler(BaseHandler):
             message = CommitFormatter.format_commits(commits, repository, branch)
 
             blocks = message['blocks']
-            text = message['blocks'][0]['text']['text']
+            text = message['text']
             
-            self.client.send_dm(user_id,blocks,text); 
\ No newline at end of file
+            self.client.send_dm(user_id,blocks,text,continuations=message.get('continuations')); 
\ No newline at end of file
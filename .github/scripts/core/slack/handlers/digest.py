@@ -0,0 +1,97 @@
+"""이슈 이벤트 요약(digest) 핸들러"""
+import os
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from .base import BaseHandler
+from ..formatters.digest import DigestFormatter
+from core.utils.state_store import StateStore, SLACK_STATE_NAMESPACE
+
+logger = logging.getLogger(__name__)
+
+DIGEST_STATE = 'slack_digest'
+# 요약 메시지에 포함할 이슈 필드
+ISSUE_FIELDS = ('number', 'title', 'html_url', 'state')
+
+def is_digest_mode() -> bool:
+    """
+    SLACK_DIGEST_MODE가 켜져 있으면 이벤트 실행에서는 할당 DM만 보내고,
+    채널 알림은 slack_digest_flush.py가 이슈 이벤트 API로 모아 요약합니다.
+    """
+    return os.environ.get('SLACK_DIGEST_MODE', '').lower() in ('1', 'true', 'yes')
+
+class EventDigest:
+    """
+    이슈 이벤트를 상태 저장소에 쌓아 두었다가 이슈별로 접어 요약합니다.
+
+    같은 이슈의 이벤트는 한 행으로 합치며, 제목/상태/라벨은 마지막 이벤트 기준입니다.
+    """
+
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or StateStore(DIGEST_STATE, namespace=SLACK_STATE_NAMESPACE)
+        data = self.store.load()
+        self.events: List[Dict] = data.get('events', [])
+        # 마지막으로 이벤트를 수집한 시각 (UTC ISO 8601)
+        self.watermark: Optional[str] = data.get('watermark')
+
+    def append(self, kind: str, event_data: Dict, at: Optional[str] = None) -> None:
+        """이벤트를 보관합니다. kind는 'task' 또는 'proposal'입니다."""
+        issue = event_data['issue']
+        event = {
+            'kind': kind,
+            'action': event_data['action'],
+            'at': at or datetime.now(timezone.utc).isoformat(),
+            'issue': {field: issue.get(field) for field in ISSUE_FIELDS},
+            'user': (issue.get('user') or {}).get('login'),
+            'labels': [label['name'] for label in issue.get('labels', [])],
+        }
+        if event_data.get('assignee'):
+            event['assignee'] = event_data['assignee']['login']
+        self.events.append(event)
+
+    def fold(self) -> List[Dict]:
+        """이슈별로 이벤트를 합친 행 목록을 마지막 이벤트 시각 순으로 반환합니다."""
+        rows: Dict[int, Dict] = {}
+        for event in sorted(self.events, key=lambda event: event['at']):
+            number = event['issue']['number']
+            row = rows.setdefault(number, {'number': number, 'actions': [], 'assignees': []})
+            row.update({
+                'kind': event['kind'],
+                'title': event['issue']['title'],
+                'url': event['issue']['html_url'],
+                'state': event['issue']['state'],
+                'user': event['user'],
+                'labels': event['labels'],
+                'at': event['at'],
+            })
+            if event['action'] not in row['actions']:
+                row['actions'].append(event['action'])
+            if event.get('assignee') and event['assignee'] not in row['assignees']:
+                row['assignees'].append(event['assignee'])
+        return sorted(rows.values(), key=lambda row: row['at'])
+
+    def clear(self) -> None:
+        self.events = []
+
+    def save(self) -> None:
+        self.store.save({'events': self.events, 'watermark': self.watermark})
+
+class DigestHandler(BaseHandler):
+    """보관된 이벤트를 요약 메시지 하나로 채널에 전송합니다."""
+
+    def __init__(self, client, digest: EventDigest):
+        super().__init__(client)
+        self.digest = digest
+
+    def handle(self, event_data: Dict = None):
+        """요약 전송"""
+        rows = self.digest.fold()
+        if not rows:
+            logger.info("요약할 이슈 이벤트가 없습니다.")
+            return
+
+        times = [event['at'] for event in self.digest.events]
+        message = DigestFormatter.format_digest(rows, min(times), max(times))
+        self.client.send_channel_notification(message)
+        logger.info(f"이슈 {len(rows)}개 ({len(self.digest.events)}개 이벤트) 요약 전송")
+        self.digest.clear()
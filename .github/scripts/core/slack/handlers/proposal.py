@@ -3,10 +3,20 @@ from typing import Dict
 from .base import BaseHandler
 from ..formatters.proposal import ProposalFormatter
 
+def is_proposal_event(event_data: Dict) -> bool:
+    """제안서 이벤트 여부 확인"""
+    if 'issue' not in event_data:
+        return False
+    labels = [label['name'] for label in event_data['issue'].get('labels', [])]
+    return any(label in labels for label in ProposalFormatter.STATUS_INFO)
+
 class ProposalHandler(BaseHandler):
     def handle(self, event_data: Dict):
         """제안서 이벤트 처리"""
+        if self.digest is not None:
+            self.digest.append('proposal', event_data, event_data.get('created_at'))
+            return
         proposal_data = event_data['issue']
         event_type = event_data['action']
         message = ProposalFormatter.format_proposal(proposal_data, event_type)
-        self.client.send_channel_notification(id,message) 
\ No newline at end of file
+        self.client.send_channel_notification(message) 
\ No newline at end of file
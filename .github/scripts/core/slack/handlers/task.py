@@ -1,118 +1,99 @@
 """
 태스크 이벤트 핸들러
 """
-from typing import Dict
+import re
+from typing import Dict, Optional, Tuple
 from .base import BaseHandler
 from ..formatters.task import TaskFormatter
+from ..delivery import Delivery, DeliveryResult, PRIORITY_HIGH
+from core.task.handlers.aggregate_handler import TaskAggregator
 from config.user_mappings import GITHUB_USER_MAPPING
 
 class TaskHandler(BaseHandler):
     """태스크 이벤트 처리"""
     
+    def __init__(self, client, digest=None, aggregator: Optional[TaskAggregator] = None):
+        super().__init__(client, digest)
+        # 이벤트 변경분을 반영할 집계 상태 (호출자가 불러오고 저장합니다)
+        self.aggregator = aggregator
+    
     def handle(self, event_data: Dict):
         """태스크 이벤트 처리"""
         task_data = event_data['issue']
         event_type = event_data['action']
         
-        # 채널 알림 전송
-        message = TaskFormatter.format_task(task_data, event_type)
-        self.client.send_channel_notification(message)
+        if self.aggregator is not None:
+            self.aggregator.apply_event(event_data)
         
-        # 할당된 경우 담당자에게 DM 전송
-        if event_type == 'assigned':
-            assignee = event_data['assignee']['login']
-            user_info = GITHUB_USER_MAPPING.get(assignee)
-            if user_info and user_info.get('slack_id'):
-                parent_task = self._get_parent_task_info(task_data)
-                
-                labels = [label['name'] for label in task_data.get('labels', [])]
-                is_todo = any('todo-generated' in label.lower() for label in labels)
-                
-                header_text = "🎯 새로운 할일이 할당되었습니다"
-                if is_todo:
-                    header_text = "📝 새로운 Todo가 할당되었습니다"
-                
-                blocks = [
-                    {
-                        "type": "header",
-                        "text": {"type": "plain_text", "text": header_text}
-                    },
-                    {
-                        "type": "section",
-                        "fields": [
-                            {"type": "mrkdwn", "text": f"*할일:*\n{task_data['title']}"},
-                            {"type": "mrkdwn", "text": f"*상태:*\n{task_data['state']}"}
-                        ]
-                    }
-                ]
-                
-                if parent_task:
-                    blocks.append({
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": f"*상위 태스크:*\n<{parent_task['url']}|{parent_task['title']}>"}
-                    })
-                
-                blocks.extend([
-                    {
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": f"👉 <{task_data['html_url']}|할일 보러가기>"}
-                    },
-                    {"type": "divider"}
-                ])
-                
-                message_text = f"새로운 할일이 할당되었습니다: {task_data['title']}"
-                if is_todo:
-                    message_text = f"새로운 Todo가 할당되었습니다: {task_data['title']}"
-                
-                try:
-                    # DM 전송 시도
-                    self.client.send_dm(
-                        user_info['slack_id'],
-                        blocks,
-                        message_text
-                    )
-                except Exception as e:
-                    print(f"DM 전송 실패, 채널에 멘션으로 대체합니다: {str(e)}")
-                    # DM 전송 실패 시 채널에 멘션으로 대체
-                    self._send_mention_to_channel(user_info, task_data, is_todo)
-    
-    def _send_mention_to_channel(self, user_info: Dict, task_data: Dict, is_todo: bool):
-        """채널에 멘션 전송"""
-        slack_id = user_info['slack_id']
-        user_name = user_info['name']
+        # 요약 모드: 채널 알림은 보관하고, 담당자 DM은 이벤트 실행에서 이미 전송됨 (notify_assignee)
+        if self.digest is not None:
+            self.digest.append('task', event_data, event_data.get('created_at'))
+            return
         
-        # Slack ID에서 '@' 제거
-        if slack_id.startswith('@'):
-            slack_id = slack_id[1:]
+        # 채널 알림 (담당자 DM보다 나중에 전송)
+        message = TaskFormatter.format_task(task_data, event_type, self._task_progress(task_data))
+        deliveries = [self.client.channel_delivery(message)]
         
-        header_text = "🎯 새로운 할일이 할당되었습니다"
-        if is_todo:
-            header_text = "📝 새로운 Todo가 할당되었습니다"
+        # 할당된 경우 담당자에게 DM 전송
+        assignment = self._assignment_delivery(event_data) if event_type == 'assigned' else None
+        if assignment:
+            deliveries.append(assignment[0])
         
-        blocks = [
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*{header_text}*\n<@{slack_id}> 님에게 새로운 할일이 할당되었습니다."}
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*할일:*\n{task_data['title']}"},
-                    {"type": "mrkdwn", "text": f"*상태:*\n{task_data['state']}"}
-                ]
-            },
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"👉 <{task_data['html_url']}|할일 보러가기>"}
-            },
-            {"type": "divider"}
-        ]
+        results = self.client.send_many(deliveries)
+        if assignment:
+            self._check_dm_result(results[-1], *assignment[1:])
+    
+    def _task_progress(self, task_data: Dict) -> Optional[Dict]:
+        """상위 태스크의 완료/전체 투두 수 (전체 스냅샷으로 구축된 집계가 있을 때만)"""
+        if self.aggregator is None or not self.aggregator.snapshot_at:
+            return None
+        match = re.match(r'\[(.*?)\]', task_data.get('title', ''))
+        counts = self.aggregator.get_task_counts(match.group(1)) if match else None
+        if not counts:
+            return None
+        return {'task': match.group(1), **counts}
+    
+    def notify_assignee(self, event_data: Dict):
+        """채널 알림 없이 담당자 DM만 전송합니다. (요약 모드의 할당 이벤트)"""
+        assignment = self._assignment_delivery(event_data)
+        if assignment:
+            results = self.client.send_many([assignment[0]])
+            self._check_dm_result(results[0], *assignment[1:])
+    
+    def _assignment_delivery(self, event_data: Dict) -> Optional[Tuple[Delivery, Dict, Dict, bool]]:
+        """할당 DM 전송 정보 (Slack 사용자가 매핑되지 않은 경우 None)"""
+        task_data = event_data['issue']
+        if not event_data.get('assignee'):
+            return None
+        assignee = event_data['assignee']['login']
+        user_info = GITHUB_USER_MAPPING.get(assignee)
+        if not (user_info and user_info.get('slack_id')):
+            return None
+        
+        parent_task = self._get_parent_task_info(task_data)
         
-        message = {
-            "blocks": blocks,
-            "text": f"{user_name}님에게 새로운 할일이 할당되었습니다: {task_data['title']}"
-        }
+        labels = [label['name'] for label in task_data.get('labels', [])]
+        is_todo = any('todo-generated' in label.lower() for label in labels)
         
+        message = TaskFormatter.format_assignment(task_data, is_todo, parent_task)
+        delivery = Delivery(user_info['slack_id'], message['blocks'], message['text'], priority=PRIORITY_HIGH,
+                            continuations=message.get('continuations', []))
+        return delivery, user_info, task_data, is_todo
+    
+    def _check_dm_result(self, dm_result: DeliveryResult, user_info: Dict, task_data: Dict, is_todo: bool):
+        """DM 전송 결과 확인 (영구 실패 시 채널 멘션으로 대체)"""
+        if dm_result.ok:
+            print(f"DM 전송 성공 ({user_info['slack_id']})")
+        elif not dm_result.transient:
+            print(f"DM 전송 실패, 채널에 멘션으로 대체합니다: {dm_result.error}")
+            # DM 전송 실패 시 채널에 멘션으로 대체
+            self._send_mention_to_channel(user_info, task_data, is_todo)
+    
+    def _send_mention_to_channel(self, user_info: Dict, task_data: Dict, is_todo: bool):
+        """채널에 멘션 전송"""
+        # Slack ID에서 '@' 제거
+        slack_id = user_info['slack_id'].lstrip('@')
+        message = TaskFormatter.format_assignment_mention(task_data, is_todo, slack_id, user_info['name'])
         self.client.send_channel_notification(message)
     
     def _get_parent_task_info(self, task_data: Dict) -> Dict:
@@ -120,7 +101,7 @@ class TaskHandler(BaseHandler):
         body = task_data.get('body', '')
         if not body:
             return None
-            
+        
         # 본문에서 상위 태스크 링크 찾기
         lines = body.split('\n')
         for line in lines:
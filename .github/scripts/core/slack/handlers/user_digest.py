@@ -0,0 +1,104 @@
+"""사용자별 일일 요약 핸들러"""
+import os
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+import pytz
+from .base import BaseHandler
+from ..delivery import Delivery
+from ..formatters.user_digest import UserDigestFormatter
+from core.task.handlers.task_handler import TaskHandler as TaskManager
+from core.task.handlers.index_handler import parse_datetime
+from core.utils.state_store import StateStore, SLACK_STATE_NAMESPACE
+from config.user_mappings import GITHUB_USER_MAPPING
+
+logger = logging.getLogger(__name__)
+
+USER_DIGEST_STATE = 'user_digest'
+
+@dataclass
+class DigestItem:
+    number: int
+    title: str
+    url: Optional[str]
+    task: str
+    task_url: Optional[str]
+
+@dataclass
+class UserDigest:
+    login: str
+    name: str
+    open_todos: List[DigestItem] = field(default_factory=list)
+    completed_yesterday: List[DigestItem] = field(default_factory=list)
+    newly_assigned: List[DigestItem] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.open_todos or self.completed_yesterday)
+
+def build_user_digests(task_manager: TaskManager, start: datetime, end: datetime,
+                       previous_assigned: Optional[Dict[str, Set[int]]] = None) -> Dict[str, UserDigest]:
+    """
+    투두를 한 번 순회하며 매핑된 사용자별 요약을 만듭니다.
+
+    Args:
+        start, end: '어제 완료' 구간 [start, end)
+        previous_assigned: 지난 실행 때 사용자별 열린 투두 번호 (없으면 새 할당을 표시하지 않음)
+    """
+    digests = {
+        login: UserDigest(login, info.get('name', login))
+        for login, info in GITHUB_USER_MAPPING.items() if info.get('slack_id')
+    }
+
+    for todo, task_name, _ in task_manager.iter_todos():
+        assignees = [login for login in todo.assignees if login in digests]
+        if not assignees:
+            continue
+        task_url = task_manager.task_mapping[task_name].get('url')
+        item = DigestItem(todo.number, todo.title, todo.url, task_name, task_url if task_url != '#' else None)
+        closed_at = parse_datetime(todo.closed_at) if todo.status == 'Done' else None
+
+        for login in assignees:
+            digest = digests[login]
+            if closed_at is None:
+                digest.open_todos.append(item)
+                if previous_assigned is not None and todo.number not in previous_assigned.get(login, ()):
+                    digest.newly_assigned.append(item)
+            elif start <= closed_at < end:
+                digest.completed_yesterday.append(item)
+
+    return digests
+
+class UserDigestHandler(BaseHandler):
+    """리포트와 같은 프로젝트 스냅샷으로 사용자별 요약 DM을 동시에 전송합니다."""
+
+    def __init__(self, client, task_manager: TaskManager, store: Optional[StateStore] = None):
+        super().__init__(client)
+        self.task_manager = task_manager
+        self.store = store or StateStore(USER_DIGEST_STATE, namespace=SLACK_STATE_NAMESPACE)
+        self.timezone = pytz.timezone(os.environ.get('TIMEZONE', 'Asia/Seoul'))
+
+    def handle(self, event_data: Dict = None):
+        """사용자별 요약 전송"""
+
+        today = datetime.now(self.timezone).replace(hour=0, minute=0, second=0, microsecond=0)
+        yesterday = today - timedelta(days=1)
+        saved = self.store.load()
+        previous = {login: set(numbers) for login, numbers in saved['assigned'].items()} if 'assigned' in saved else None
+        digests = build_user_digests(self.task_manager, yesterday, today, previous)
+
+        deliveries = []
+        for digest in digests.values():
+            if digest.is_empty:
+                continue
+            message = UserDigestFormatter.format_user_digest(digest, yesterday.strftime('%Y-%m-%d'))
+            deliveries.append(Delivery(digest.login, message['blocks'], message['text'],
+                                       continuations=message.get('continuations', [])))
+
+        results = self.client.send_many(deliveries)
+        logger.info(f"사용자별 요약 {sum(result.ok for result in results)}/{len(deliveries)}건 전송")
+
+        self.store.save({
+            'assigned': {login: sorted(item.number for item in digest.open_todos) for login, digest in digests.items()}
+        })
@@ -0,0 +1,75 @@
+"""Slack API 메서드별 호출 한도 관리"""
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# Slack Web API 티어별 분당 호출 한도
+TIER_LIMITS = {1: 1, 2: 20, 3: 50, 4: 100}
+METHOD_TIERS = {
+    'users_lookupByEmail': 3,
+    'conversations_open': 3,
+}
+# chat.postMessage는 티어 대신 채널당 초당 1회 한도가 적용됩니다.
+POST_MESSAGE_METHOD = 'chat_postMessage'
+POST_MESSAGE_INTERVAL = 1.0
+DEFAULT_TIER = 3
+DEFAULT_RETRY_AFTER = 1.0
+
+def get_retry_after(response, default: float = DEFAULT_RETRY_AFTER) -> float:
+    """ratelimited 응답의 Retry-After 헤더(초)를 반환합니다."""
+    headers = getattr(response, 'headers', None) or {}
+    for key, value in headers.items():
+        if key.lower() == 'retry-after':
+            try:
+                return max(float(value[0] if isinstance(value, list) else value), 0.0)
+            except (TypeError, ValueError):
+                break
+    return default
+
+class RateLimiter:
+    """
+    메서드(또는 메서드+채널)별 슬라이딩 윈도우로 호출 시점을 예약합니다.
+
+    이벤트 루프 안에서 예약과 대기를 분리하므로 동시에 실행 중인 전송도 한도를 함께 나눠 씁니다.
+    ratelimited 응답을 받으면 해당 메서드를 Retry-After 동안 막습니다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.windows: Dict[Hashable, deque] = {}
+        self.blocked_until: Dict[Hashable, float] = {}
+
+    @staticmethod
+    def bucket_for(method: str, channel: Optional[str] = None) -> Tuple[Hashable, int, float]:
+        """(버킷 키, 윈도우 내 허용 횟수, 윈도우 길이 초)를 반환합니다."""
+        if method == POST_MESSAGE_METHOD:
+            return (method, channel), 1, POST_MESSAGE_INTERVAL
+        return method, TIER_LIMITS[METHOD_TIERS.get(method, DEFAULT_TIER)], 60.0
+
+    def reserve(self, method: str, channel: Optional[str] = None) -> float:
+        """다음 호출 가능 시점을 예약하고, 그때까지 기다려야 하는 시간(초)을 반환합니다."""
+        bucket, limit, period = self.bucket_for(method, channel)
+        window = self.windows.setdefault(bucket, deque())
+        now = self.clock()
+        while window and window[0] <= now - period:
+            window.popleft()
+
+        at = max(now, self.blocked_until.get(bucket, 0.0))
+        if window:
+            at = max(at, window[-1])
+        if len(window) >= limit:
+            at = max(at, window[-limit] + period)
+        window.append(at)
+        return at - now
+
+    async def acquire(self, method: str, channel: Optional[str] = None) -> None:
+        delay = self.reserve(method, channel)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def block(self, method: str, retry_after: float, channel: Optional[str] = None) -> None:
+        """ratelimited 응답 이후 Retry-After 동안 해당 버킷의 호출을 막습니다."""
+        bucket, _, _ = self.bucket_for(method, channel)
+        until = self.clock() + retry_after
+        self.blocked_until[bucket] = max(self.blocked_until.get(bucket, 0.0), until)
@@ -0,0 +1,66 @@
+"""Slack 수신자 해석 캐시"""
+from typing import Dict, Optional
+from config.user_mappings import GITHUB_USER_MAPPING
+from core.utils.state_store import StateStore, SLACK_STATE_NAMESPACE
+
+SLACK_RESOLUTION_STATE = 'slack_resolution'
+# 캐시된 ID가 더 이상 유효하지 않음을 뜻하는 Slack 오류
+STALE_ERRORS = ('channel_not_found', 'user_not_found', 'users_not_found', 'is_archived')
+
+class ResolutionCache:
+    """
+    이메일 -> 사용자 ID, 사용자 ID -> DM 채널 ID, GitHub 로그인 -> Slack ID 매핑을 실행 간에 보존합니다.
+
+    DM 채널 ID는 사용자별로 바뀌지 않으므로, 한 번 해석한 뒤에는 chat.postMessage 한 번으로 전송합니다.
+    """
+
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or StateStore(SLACK_RESOLUTION_STATE, namespace=SLACK_STATE_NAMESPACE)
+        data = self.store.load()
+        self.users: Dict[str, str] = data.get('users', {})
+        self.dm_channels: Dict[str, str] = data.get('dm_channels', {})
+        # GitHub 로그인 매핑은 설정 파일이 기준입니다.
+        self.logins: Dict[str, str] = {
+            login: info['slack_id'].lstrip('@')
+            for login, info in GITHUB_USER_MAPPING.items() if info.get('slack_id')
+        }
+        self.dirty = self.logins != data.get('logins')
+
+    def slack_id_for_login(self, login: str) -> Optional[str]:
+        return self.logins.get(login)
+
+    def user_for_email(self, email: str) -> Optional[str]:
+        return self.users.get(email.lower())
+
+    def set_user(self, email: str, user_id: str) -> None:
+        if self.users.get(email.lower()) != user_id:
+            self.users[email.lower()] = user_id
+            self.dirty = True
+
+    def dm_channel_for(self, user_id: str) -> Optional[str]:
+        return self.dm_channels.get(user_id)
+
+    def set_dm_channel(self, user_id: str, channel_id: str) -> None:
+        if self.dm_channels.get(user_id) != channel_id:
+            self.dm_channels[user_id] = channel_id
+            self.dirty = True
+
+    def invalidate(self, recipient: str) -> bool:
+        """수신자(이메일 또는 사용자 ID)에 대한 캐시 항목을 제거하고, 제거한 항목이 있었는지 반환합니다."""
+        recipient = recipient.strip().lstrip('@')
+        removed = False
+        if '@' in recipient:
+            user_id = self.users.pop(recipient.lower(), None)
+            removed = user_id is not None
+            recipient = user_id or recipient
+        if self.dm_channels.pop(self.logins.get(recipient, recipient), None) is not None:
+            removed = True
+        self.dirty = self.dirty or removed
+        return removed
+
+    def save(self) -> None:
+        """변경된 경우에만 저장합니다."""
+        if not self.dirty:
+            return
+        self.store.save({'users': self.users, 'dm_channels': self.dm_channels, 'logins': self.logins})
+        self.dirty = False
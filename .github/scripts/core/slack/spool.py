@@ -0,0 +1,42 @@
+"""전송하지 못한 Slack 메시지 보관함"""
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from core.utils.state_store import StateStore, SLACK_STATE_NAMESPACE
+from .delivery import Delivery
+
+SLACK_SPOOL_STATE = 'slack_spool'
+# 보관 기간과 최대 재시도 횟수를 넘긴 메시지는 버립니다.
+SPOOL_MAX_AGE = timedelta(hours=24)
+SPOOL_MAX_ATTEMPTS = 5
+
+class DeliverySpool:
+    """일시적인 오류(ratelimited, 네트워크 오류 등)로 전송하지 못한 메시지를 다음 실행까지 보관합니다."""
+
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or StateStore(SLACK_SPOOL_STATE, namespace=SLACK_STATE_NAMESPACE)
+        self.pending: List[Delivery] = [Delivery(**item) for item in self.store.load().get('deliveries', [])]
+        self.dirty = False
+
+    def add(self, delivery: Delivery) -> bool:
+        """메시지를 보관하고, 보관 한도를 넘겨 버린 경우 False를 반환합니다."""
+        now = datetime.now(timezone.utc)
+        delivery.attempts += 1
+        delivery.queued_at = delivery.queued_at or now.isoformat()
+        self.dirty = True
+        if delivery.attempts >= SPOOL_MAX_ATTEMPTS or now - datetime.fromisoformat(delivery.queued_at) > SPOOL_MAX_AGE:
+            return False
+        self.pending.append(delivery)
+        return True
+
+    def take(self) -> List[Delivery]:
+        """보관 중인 메시지를 모두 꺼냅니다."""
+        deliveries, self.pending = self.pending, []
+        self.dirty = self.dirty or bool(deliveries)
+        return deliveries
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.store.save({'deliveries': [asdict(delivery) for delivery in self.pending]})
+        self.dirty = False
@@ -0,0 +1,112 @@
+"""
+Mermaid 차트 데이터 축소 모듈
+"""
+import os
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Sequence, TypeVar
+
+# 일 단위로 표시하는 최근 기간(일). 이보다 오래된 날짜는 주 단위로 묶습니다.
+DEFAULT_DAILY_HORIZON_DAYS = 14
+# 주 단위로 표시하는 최근 기간(일). 이보다 오래된 날짜는 월 단위로 묶습니다.
+DEFAULT_WEEKLY_HORIZON_DAYS = 91
+# 차트 하나에 그리는 최대 항목 수
+DEFAULT_MAX_CHART_ELEMENTS = 30
+# 파이 차트에 개별 표시하는 최대 카테고리 수
+DEFAULT_TOP_CATEGORIES = 5
+
+OTHER_LABEL = "기타"
+
+T = TypeVar('T')
+
+@dataclass
+class ChartOptions:
+    daily_horizon_days: int = DEFAULT_DAILY_HORIZON_DAYS
+    weekly_horizon_days: int = DEFAULT_WEEKLY_HORIZON_DAYS
+    max_elements: int = DEFAULT_MAX_CHART_ELEMENTS
+    top_categories: int = DEFAULT_TOP_CATEGORIES
+
+    @classmethod
+    def from_env(cls) -> 'ChartOptions':
+        """환경 변수(CHART_*)로 설정을 덮어씁니다."""
+        return cls(
+            daily_horizon_days=int(os.environ.get('CHART_DAILY_HORIZON_DAYS', DEFAULT_DAILY_HORIZON_DAYS)),
+            weekly_horizon_days=int(os.environ.get('CHART_WEEKLY_HORIZON_DAYS', DEFAULT_WEEKLY_HORIZON_DAYS)),
+            max_elements=int(os.environ.get('CHART_MAX_ELEMENTS', DEFAULT_MAX_CHART_ELEMENTS)),
+            top_categories=int(os.environ.get('CHART_TOP_CATEGORIES', DEFAULT_TOP_CATEGORIES))
+        )
+
+@dataclass
+class Bucket:
+    """차트 한 구간 (일/주/월)"""
+    label: str
+    start: date
+    days: int
+    completed: int = 0
+    in_progress: int = 0
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=self.days)
+
+def bucket_daily_stats(daily_stats: Dict[str, Dict[str, int]], today: date, options: ChartOptions) -> List[Bucket]:
+    """
+    일자별 통계를 최근은 일 단위, 그 이전은 주/월 단위 구간으로 묶어 최신순으로 반환합니다.
+
+    값이 없는 구간은 제외하며, 구간 수가 max_elements를 넘으면 가장 오래된 구간들을 하나로 합칩니다.
+    """
+    daily_start = today - timedelta(days=options.daily_horizon_days - 1)
+    weekly_point = today - timedelta(days=max(options.weekly_horizon_days, options.daily_horizon_days) - 1)
+    # 주 구간이 월요일에 시작하도록 맞춥니다.
+    weekly_start = min(weekly_point - timedelta(days=weekly_point.weekday()), daily_start)
+
+    buckets: Dict[date, Bucket] = {}
+    for date_str, stats in daily_stats.items():
+        day = date.fromisoformat(date_str)
+        if day >= daily_start:
+            start, end, label = day, day + timedelta(days=1), date_str
+        elif day >= weekly_start:
+            start = day - timedelta(days=day.weekday())
+            end = min(start + timedelta(days=7), daily_start)
+            label = f"{start.isoformat()} 주간"
+        else:
+            start = day.replace(day=1)
+            end = min((start + timedelta(days=32)).replace(day=1), weekly_start)
+            label = f"{start.strftime('%Y-%m')} 월간"
+
+        bucket = buckets.get(start)
+        if bucket is None:
+            bucket = buckets[start] = Bucket(label, start, (end - start).days)
+        bucket.completed += stats['completed']
+        bucket.in_progress += stats['in_progress']
+
+    ordered = [
+        bucket for bucket in sorted(buckets.values(), key=lambda bucket: bucket.start, reverse=True)
+        if bucket.completed or bucket.in_progress
+    ]
+    return cap_buckets(ordered, options.max_elements)
+
+def cap_buckets(buckets: List[Bucket], max_elements: int) -> List[Bucket]:
+    """최신순 구간 목록을 max_elements개 이하로 줄입니다. 넘치는 오래된 구간은 하나로 합칩니다."""
+    max_elements = max(max_elements, 1)
+    if len(buckets) <= max_elements:
+        return buckets
+
+    kept, rest = buckets[:max_elements - 1], buckets[max_elements - 1:]
+    start = min(bucket.start for bucket in rest)
+    end = max(bucket.end for bucket in rest)
+    merged = Bucket(
+        label=f"{start.isoformat()} ~ {(end - timedelta(days=1)).isoformat()}",
+        start=start,
+        days=(end - start).days,
+        completed=sum(bucket.completed for bucket in rest),
+        in_progress=sum(bucket.in_progress for bucket in rest)
+    )
+    return kept + [merged]
+
+def top_n_with_other(items: Sequence[T], limit: int, merge: Callable[[List[T]], T]) -> List[T]:
+    """정렬된 항목 중 상위 limit개만 남기고 나머지는 merge 결과('기타') 하나로 합칩니다."""
+    limit = max(limit, 1)
+    if len(items) <= limit:
+        return list(items)
+    return list(items[:limit - 1]) + [merge(list(items[limit - 1:]))]
@@ -0,0 +1,112 @@
+"""
+처리량 추이와 완료 예측을 계산하는 모듈
+"""
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# 예측에 사용하는 최근 일별 처리량 표본 기간(일)
+DEFAULT_FORECAST_WINDOW_DAYS = 28
+# 몬테카를로 시뮬레이션 횟수와 최대 예측 기간(일)
+FORECAST_TRIALS = 2000
+FORECAST_HORIZON_DAYS = 365
+# 실행마다 같은 입력이면 같은 결과가 나오도록 고정된 시드를 사용합니다.
+FORECAST_SEED = 7
+# 표에 표시하는 주간 처리량/번다운 구간 수
+THROUGHPUT_WEEKS = 8
+BURNDOWN_WEEKS = 4
+# 예상 완료일 백분위 (낙관, 기준, 보수)
+ETA_PERCENTILES = (10, 50, 90)
+
+# (생성일, 완료일, 카테고리)
+TodoRecord = Tuple[Optional[str], Optional[str], str]
+
+@dataclass
+class Forecast:
+    """완료 예측 결과"""
+    today: str
+    remaining: int = 0
+    daily_rate: float = 0.0
+    weekly_rate: float = 0.0
+    # (주 시작일, 완료 수, 주 마지막 날 기준 7일 이동평균)
+    weekly_throughput: List[Tuple[str, int, float]] = field(default_factory=list)
+    burndown_dates: List[str] = field(default_factory=list)
+    # 카테고리 -> 시점별 잔여 투두 수
+    burndown: Dict[str, List[int]] = field(default_factory=dict)
+    # 백분위 -> 예상 완료일 (예측 기간을 넘으면 None), 처리량이 없어 예측할 수 없으면 빈 딕셔너리
+    eta: Dict[int, Optional[str]] = field(default_factory=dict)
+
+def calculate_forecast(records: Iterable[TodoRecord], categories: Iterable[str], timezone: str,
+                       today: date, window_days: int = DEFAULT_FORECAST_WINDOW_DAYS) -> Forecast:
+    """
+    투두 생성/완료 시계열로 처리량 추이, 카테고리별 번다운, 예상 완료일을 계산합니다.
+
+    모든 집계는 일 단위 시계열에 대한 벡터 연산으로 처리하며, 예상 완료일은 최근
+    window_days일의 일별 처리량을 재표본추출한 시뮬레이션의 백분위로 구합니다.
+    """
+    frame = pd.DataFrame.from_records(list(records), columns=['created', 'closed', 'category'])
+    forecast = Forecast(today=today.isoformat())
+    if frame.empty:
+        return forecast
+
+    created = _to_local_dates(frame['created'], timezone)
+    closed = _to_local_dates(frame['closed'], timezone)
+    # 생성일이 없으면 완료일로 대신합니다.
+    created = created.fillna(closed)
+
+    today_ts = pd.Timestamp(today)
+    start = min(value for value in (created.min(), closed.min(), today_ts) if not pd.isna(value))
+    days = pd.date_range(start, today_ts, freq='D')
+    created = created.fillna(days[0])
+
+    daily_closed = closed.value_counts().reindex(days, fill_value=0).astype('int64')
+    rolling = daily_closed.rolling(7, min_periods=1).mean()
+
+    forecast.remaining = int(frame['closed'].isna().sum())
+    forecast.daily_rate = float(daily_closed.iloc[-7:].sum() / 7)
+    forecast.weekly_rate = float(daily_closed.iloc[-28:].sum() / 4)
+
+    # 주간 처리량 (월요일 시작)
+    weekly = daily_closed.resample('W-SUN').sum().iloc[-THROUGHPUT_WEEKS:]
+    weekly_rolling = rolling.resample('W-SUN').last().iloc[-THROUGHPUT_WEEKS:]
+    forecast.weekly_throughput = [
+        ((week_end - pd.Timedelta(days=6)).strftime('%Y-%m-%d'), int(count), float(mean))
+        for week_end, count, mean in zip(weekly.index, weekly.to_numpy(), weekly_rolling.to_numpy())
+    ]
+
+    # 카테고리별 잔여 투두 = 누적 생성 - 누적 완료
+    category_order = [category for category in categories if category in set(frame['category'])]
+    opened = pd.crosstab(created, frame['category']).reindex(index=days, columns=category_order, fill_value=0).cumsum()
+    done = pd.crosstab(closed, frame['category']).reindex(index=days, columns=category_order, fill_value=0).cumsum()
+    open_counts = opened - done
+    points = [today_ts - pd.Timedelta(weeks=weeks) for weeks in range(BURNDOWN_WEEKS, -1, -1)]
+    points = [point for point in points if point >= days[0]]
+    sampled = open_counts.loc[points]
+    forecast.burndown_dates = [point.strftime('%m-%d') for point in points]
+    forecast.burndown = {category: sampled[category].astype(int).tolist() for category in category_order}
+
+    forecast.eta = _simulate_eta(daily_closed.iloc[-window_days:].to_numpy(), forecast.remaining, today)
+    return forecast
+
+def _to_local_dates(values: pd.Series, timezone: str) -> pd.Series:
+    """ISO 시각 문자열을 팀 시간대 기준 날짜(자정)로 변환합니다."""
+    timestamps = pd.to_datetime(values, utc=True, errors='coerce')
+    return timestamps.dt.tz_convert(timezone).dt.tz_localize(None).dt.normalize()
+
+def _simulate_eta(samples: np.ndarray, remaining: int, today: date) -> Dict[int, Optional[str]]:
+    """일별 처리량 표본으로 남은 투두를 모두 완료하는 날짜의 백분위를 계산합니다."""
+    if remaining == 0 or samples.sum() == 0:
+        return {}
+
+    rng = np.random.default_rng(FORECAST_SEED)
+    cumulative = rng.choice(samples, size=(FORECAST_TRIALS, FORECAST_HORIZON_DAYS)).cumsum(axis=1)
+    reached = cumulative >= remaining
+    days_needed = np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, FORECAST_HORIZON_DAYS + 1)
+
+    eta = {}
+    for percentile, value in zip(ETA_PERCENTILES, np.percentile(days_needed, ETA_PERCENTILES, method='higher')):
+        value = int(value)
+        eta[percentile] = (today + timedelta(days=value)).isoformat() if value <= FORECAST_HORIZON_DAYS else None
+    return eta
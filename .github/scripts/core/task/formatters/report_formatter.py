@@ -1,34 +1,164 @@
 """
 보고서 포맷팅을 담당하는 모듈
 """
-from datetime import datetime
-from typing import Dict, Set
+import io
+import os
+import hashlib
+import pytz
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 from ...task.models.status import TaskState, ReportSection
 from ...task.models.constants import TASK_CATEGORIES
+from ...task.models.report import ReportData, CategorySummary, TodoSummary, TaskSummary
+from .section_cache import SectionCache
+from .chart_reducer import ChartOptions, OTHER_LABEL, bucket_daily_stats, top_n_with_other
+from .forecast import Forecast, calculate_forecast, DEFAULT_FORECAST_WINDOW_DAYS, FORECAST_TRIALS, ETA_PERCENTILES
 from config.user_mappings import GITHUB_USER_MAPPING
 
+# 섹션 템플릿이 바뀌면 올려서 저장된 섹션 캐시를 무효화합니다.
+SECTION_TEMPLATE_VERSION = 2
+
+# 메인 보고서에 유지하는 완료 히스토리 기간(일). 이보다 오래된 달은 월별 아카이브로 이동합니다.
+DEFAULT_HISTORY_WINDOW_DAYS = 30
+
 class ReportFormatter:
-    def __init__(self, project_name: str, task_manager):
+    def __init__(self, project_name: str, task_manager, section_cache: Optional[SectionCache] = None,
+                 history_window_days: Optional[int] = None, commit_index=None):
         self.project_name = project_name
         self.task_manager = task_manager
+        self.section_cache = section_cache
+        # 이슈 번호 -> 커밋 참조 인덱스 (core.workflow.handlers.commit_index_handler.CommitIndex)
+        self.commit_index = commit_index
+        self.section_hashes: Dict[str, str] = {}
         self.current_date = datetime.now().strftime('%Y-%m-%d')
+        self.timezone = os.environ.get('TIMEZONE', 'Asia/Seoul')
+        self.history_window_days = history_window_days or int(
+            os.environ.get('REPORT_HISTORY_DAYS', DEFAULT_HISTORY_WINDOW_DAYS)
+        )
+        # 아카이브된 월('YYYY-MM') -> 아카이브 이슈 URL
+        self.archive_links: Dict[str, str] = {}
+        # 본문 크기 초과 시 히스토리 표시 기간을 줄이기 위한 값 (None이면 제한 없음)
+        self.history_display_days: Optional[int] = None
+        self.chart_options = ChartOptions.from_env()
+        self.forecast_window_days = int(os.environ.get('FORECAST_WINDOW_DAYS', DEFAULT_FORECAST_WINDOW_DAYS))
+        self._report_data: Optional[ReportData] = None
+
+    @staticmethod
+    def cache_context() -> Dict[str, Any]:
+        """모든 섹션 렌더링에 공통으로 영향을 주는 값을 반환합니다."""
+        return {
+            'version': SECTION_TEMPLATE_VERSION,
+            'repository': os.environ.get('GITHUB_REPOSITORY'),
+            'users': GITHUB_USER_MAPPING
+        }
+
+    def get_report_data(self) -> ReportData:
+        """현재 스냅샷의 보고서 데이터를 한 번만 계산해 반환합니다."""
+        if self._report_data is None:
+            self._report_data = self._build_report_data()
+        return self._report_data
+
+    def _build_report_data(self) -> ReportData:
+        overall = self.task_manager.get_overall_stats()
+        categories = []
+        for category, info in TASK_CATEGORIES.items():
+            stat = self.task_manager.get_category_stats(category)
+            categories.append(CategorySummary(
+                name=category,
+                emoji=info['emoji'],
+                total=stat['total'],
+                completed=stat['completed'],
+                in_progress=stat['in_progress'],
+                waiting=stat['total'] - stat['completed'] - stat['in_progress'],
+                progress_rate=stat['progress_rate']
+            ))
+
+        # 오늘 완료 여부는 팀 시간대 기준 자정부터 판단합니다.
+        tz = pytz.timezone(self.timezone)
+        now = datetime.now(tz)
+        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        completed_today = [
+            TodoSummary(
+                number=todo.number,
+                title=todo.title,
+                task=task_name,
+                assignees=sorted(todo.assignees),
+                completed_at=closed_at.astimezone(tz).strftime('%Y-%m-%d %H:%M')
+            )
+            for closed_at, todo, task_name in self.task_manager.completed_between(start_of_day)
+        ]
+        in_progress_today = [
+            TaskSummary(
+                number=task.number,
+                title=task.title,
+                category=task.category,
+                assignees=sorted(task.assignees),
+                progress=round(task.status.progress, 1),
+                url=task.url
+            )
+            for task in self.task_manager.get_tasks_by_state(TaskState.IN_PROGRESS)
+        ]
+
+        return ReportData(
+            project_name=self.project_name,
+            generated_at=now.isoformat(timespec='seconds'),
+            report_date=self.current_date,
+            total_tasks=overall['total'],
+            completed_tasks=overall['completed'],
+            in_progress_tasks=overall['in_progress'],
+            categories=categories,
+            completed_today=completed_today,
+            in_progress_today=in_progress_today
+        )
 
     def format_report(self) -> str:
         """전체 보고서를 포맷팅합니다."""
-        return f"""<div align="center">\n
-{self._format_header()}
-</div>
-
-{self._format_basic_info()}
-{self._format_team_info()}
-{self._format_task_details()}
-{self._format_progress_section()}
-{self._format_task_history()}
-{self._format_risks()}
-
----
-> 이 보고서는 자동으로 생성되었으며, 담당자가 지속적으로 업데이트할 예정입니다.
-"""
+        buffer = io.StringIO()
+        self.write_report(buffer)
+        return buffer.getvalue()
+
+    def write_report(self, stream: TextIO) -> None:
+        """보고서를 청크 단위로 스트림에 기록합니다."""
+        for chunk in self.iter_report():
+            stream.write(chunk)
+
+    def iter_report(self) -> Iterator[str]:
+        """보고서를 섹션 순서대로 청크 단위로 생성합니다."""
+        yield '<div align="center">\n\n'
+        yield self._format_header()
+        yield '\n</div>\n\n'
+
+        sections = (
+            ('basic_info', self._iter_basic_info),
+            ('team_info', self._iter_team_info),
+            ('task_details', self._iter_task_details),
+            ('progress', self._iter_progress_section),
+            ('forecast', self._iter_forecast),
+            ('task_history', self._iter_task_history),
+            ('risks', self._iter_risks)
+        )
+        for index, (name, section) in enumerate(sections):
+            if index:
+                yield '\n'
+            yield from self._hashed(name, section())
+
+        yield "\n\n---\n> 이 보고서는 자동으로 생성되었으며, 담당자가 지속적으로 업데이트할 예정입니다.\n"
+
+    def _hashed(self, name: str, chunks: Iterable[str]) -> Iterator[str]:
+        """청크를 그대로 전달하면서 섹션 본문의 해시를 기록합니다."""
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk.encode('utf-8'))
+            yield chunk
+        self.section_hashes[name] = digest.hexdigest()[:16]
+
+    def _cached(self, name: str, inputs: Callable[[], Any], render: Callable[[], Iterable[str]]) -> Iterator[str]:
+        """섹션 캐시가 있으면 입력 해시가 바뀐 경우에만 렌더링합니다."""
+        if self.section_cache is None:
+            yield from render()
+            return
+        yield self.section_cache.render(name, inputs(), render)
 
     def _format_header(self) -> str:
         """보고서 헤더를 생성합니다."""
@@ -38,67 +168,127 @@ class ReportFormatter:
 
 """
 
-    def _format_basic_info(self) -> str:
+    def _iter_basic_info(self) -> Iterator[str]:
         """기본 정보 섹션을 생성합니다."""
-        return f"""## 📌 기본 정보
+        yield f"""## 📌 기본 정보
 
 **프로젝트명**: {self.project_name}  
 **보고서 최종 업데이트**: {self.current_date}  
 **프로젝트 기간**: 진행중"""
 
-    def _format_team_info(self) -> str:
+    def _iter_team_info(self) -> Iterator[str]:
         """팀원 정보 섹션을 생성합니다."""
-        team_section = """## 👥 팀원 정보
+        # 팀원 정보는 사용자 매핑(캐시 컨텍스트)에만 의존합니다.
+        yield from self._cached('team_info', lambda: None, self._render_team_info)
+
+    def _render_team_info(self) -> Iterator[str]:
+        yield """## 👥 팀원 정보
 
 | 깃허브 | 이름 | 역할 |
 |--------|------|------|"""
-        
+
         for username, info in GITHUB_USER_MAPPING.items():
-            team_section += f"\n| @{username} | {info['name']} | {info['role']} |"
-        
-        return team_section
+            yield f"\n| @{username} | {info['name']} | {info['role']} |"
 
-    def _format_task_details(self) -> str:
+    def _iter_task_details(self) -> Iterator[str]:
         """태스크 상세 내역을 포맷팅합니다."""
-        details = "## 📋 태스크 상세 내역\n\n"
-        
+        yield "## 📋 태스크 상세 내역\n\n"
+
         # 각 카테고리별로 섹션 생성
-        for category, info in TASK_CATEGORIES.items():
-            details += f"""<details>
+        for index, (category, info) in enumerate(TASK_CATEGORIES.items()):
+            if index:
+                yield "\n"
+            tasks = self.task_manager.get_tasks_by_category(category)
+            yield from self._cached(
+                f'task_details:{category}',
+                lambda: [self._task_key(task) for task in tasks],
+                lambda: self._render_category_details(category, info, tasks)
+            )
+
+    def _render_category_details(self, category: str, info: Dict, tasks: list) -> Iterator[str]:
+        """카테고리 하나의 태스크 표를 생성합니다."""
+        yield f"""<details>
 <summary><h3>{info['emoji']} {category}</h3></summary>
 
-| 태스크 ID | 태스크명 | 담당자 | 예상 시간 | 실제 시간 | 진행 상태 | 우선순위 |
-| --------- | -------- | ------ | --------- | --------- | --------- | -------- |"""
-            
-            tasks = self.task_manager.get_tasks_by_category(category)
-            if tasks:
-                for task in tasks:
-                    assignees_str = self._format_assignees(task.assignees)
-                    status_text = f"{task.status.state.icon} ({task.status.progress:.1f}%)"
-                    details += f"\n| [TSK-{task.number}]({task.url}) | {task.title} | {assignees_str} | {task.expected_time} | - | {status_text} | {task.priority} |"
-            
-            details += "\n</details>\n"
-        
-        return details.rstrip()
-
-    def _format_progress_section(self) -> str:
+| 태스크 ID | 태스크명 | 담당자 | 예상 시간 | 실제 시간 | 커밋 | 최근 활동 | 진행 상태 | 우선순위 |
+| --------- | -------- | ------ | --------- | --------- | ---- | --------- | --------- | -------- |"""
+
+        for task in tasks:
+            assignees_str = self._format_assignees(task.assignees)
+            status_text = f"{task.status.state.icon} ({task.status.progress:.1f}%)"
+            actual_time = self._format_work_time(task.work_time)
+            commit_count, last_activity = self._commit_activity(task)
+            yield f"\n| [TSK-{task.number}]({task.url}) | {task.title} | {assignees_str} | {task.expected_time} | {actual_time} | {commit_count} | {last_activity} | {status_text} | {task.priority} |"
+
+        yield "\n</details>"
+
+    def _commit_activity(self, task) -> Tuple[str, str]:
+        """태스크와 하위 투두를 참조한 커밋 수와 마지막 커밋 날짜를 반환합니다."""
+        if self.commit_index is None:
+            return "-", "-"
+        count, last_activity = self.commit_index.summarize([task.number, *(todo.number for todo in task.todos)])
+        if not count:
+            return "0", "-"
+        local_time = datetime.fromisoformat(last_activity).astimezone(pytz.timezone(self.timezone))
+        return str(count), local_time.strftime('%Y-%m-%d')
+
+    def _task_key(self, task) -> tuple:
+        """태스크 행 렌더링에 쓰이는 값을 튜플로 반환합니다."""
+        return (
+            task.number,
+            task.url,
+            task.title,
+            sorted(task.assignees),
+            task.expected_time,
+            task.status.state.name,
+            round(task.status.progress, 1),
+            task.priority,
+            self._format_work_time(task.work_time),
+            self._commit_activity(task)
+        )
+
+    @staticmethod
+    def _format_work_time(work_time) -> str:
+        """작업 시간을 '3일 4시간' 형식으로 표시합니다. 진행중이면 경과 중임을 표시합니다."""
+        if not work_time:
+            return "-"
+        hours = int(work_time.active // 3600)
+        if hours >= 24:
+            text = f"{hours // 24}일 {hours % 24}시간" if hours % 24 else f"{hours // 24}일"
+        elif hours:
+            text = f"{hours}시간"
+        else:
+            text = "1시간 미만"
+        return text if work_time.finished else f"{text} (진행중)"
+
+    def _iter_progress_section(self) -> Iterator[str]:
         """진행 현황 섹션을 생성합니다."""
-        return f"""\n## 📊 진행 현황 요약\n
-
-### 전체 진행률
-
-{self._format_overall_progress()}
-
-{self._format_category_progress()}
-
-{self._format_daily_status()}"""
+        data = self.get_report_data()
+        yield from self._cached(
+            'progress',
+            lambda: {
+                'overall': [data.total_tasks, data.completed_tasks, data.in_progress_tasks],
+                'categories': [vars(category) for category in data.categories],
+                'daily': self._calculate_daily_stats(),
+                'charts': vars(self.chart_options)
+            },
+            self._render_progress_section
+        )
+
+    def _render_progress_section(self) -> Iterator[str]:
+        yield "\n## 📊 진행 현황 요약\n\n\n### 전체 진행률\n\n"
+        yield self._format_overall_progress()
+        yield "\n\n"
+        yield from self._iter_category_progress()
+        yield "\n\n"
+        yield from self._iter_daily_status()
 
     def _format_overall_progress(self) -> str:
         """전체 진행률 섹션을 생성합니다."""
-        stats = self._calculate_overall_stats()
-        total = stats['total']
-        completed = stats['completed']
-        in_progress = stats['in_progress']
+        data = self.get_report_data()
+        total = data.total_tasks
+        completed = data.completed_tasks
+        in_progress = data.in_progress_tasks
 
         progress = (completed / total * 100) if total > 0 else 0
         in_progress_rate = (in_progress / total * 100) if total > 0 else 0
@@ -113,110 +303,189 @@ pie title 전체 진행 현황
     "대기중" : {waiting_rate:.1f}
 ```"""
 
-    def _format_category_progress(self) -> str:
+    def _iter_category_progress(self) -> Iterator[str]:
         """카테고리별 진행 현황을 생성합니다."""
-        stats = {}
-        for category in TASK_CATEGORIES:
-            tasks = self.task_manager.get_tasks_by_category(category)
-            completed = sum(1 for task in tasks if task.status.state == TaskState.COMPLETED)
-            in_progress = sum(1 for task in tasks if task.status.state == TaskState.IN_PROGRESS)
-            total = len(tasks)
-            
-            if total > 0:
-                progress_rate = (completed / total) * 100
-            else:
-                progress_rate = 0.0
-            
-            stats[category] = {
-                'total': total,
-                'completed': completed,
-                'in_progress': in_progress,
-                'progress_rate': progress_rate
-            }
-        
+        categories = self.get_report_data().categories
+
         # 테이블 형식으로 출력
-        progress = """### 📊 카테고리별 진행 현황
+        yield """### 📊 카테고리별 진행 현황
 
 | 카테고리 | 완료 | 진행중 | 대기중 | 진행률 |
 | -------- | ---- | ------ | ------ | ------ |"""
-        
+
         # 진행률 기준으로 정렬
-        sorted_categories = sorted(stats.items(), key=lambda x: (-x[1]['progress_rate'], x[0]))
-        
-        for category, stat in sorted_categories:
-            waiting = stat['total'] - stat['completed'] - stat['in_progress']
-            progress += f"\n| {TASK_CATEGORIES[category]['emoji']} {category} | {stat['completed']} | {stat['in_progress']} | {waiting} | {stat['progress_rate']:.1f}% |"
-        
-        # 진행률 차트 추가
-        progress += "\n\n```mermaid\npie title 카테고리별 진행률\n"
-        has_progress = False
-        for category, stat in sorted_categories:
-            if stat['progress_rate'] > 0:
-                has_progress = True
-                progress += f"    \"{TASK_CATEGORIES[category]['emoji']} {category}\" : {stat['progress_rate']:.1f}\n"
-        if not has_progress:
-            progress += "    \"진행중인 카테고리 없음\" : 100\n"
-        progress += "```"
-        
-        return progress
-
-    def _format_daily_status(self) -> str:
+        sorted_categories = sorted(categories, key=lambda x: (-x.progress_rate, x.name))
+
+        for stat in sorted_categories:
+            yield f"\n| {stat.emoji} {stat.name} | {stat.completed} | {stat.in_progress} | {stat.waiting} | {stat.progress_rate:.1f}% |"
+
+        # 진행률 차트 추가 (상위 카테고리 외에는 '기타'로 묶음)
+        yield "\n\n```mermaid\npie title 카테고리별 진행률\n"
+        slices = top_n_with_other(
+            [(f"{stat.emoji} {stat.name}", stat.completed, stat.total, stat.progress_rate)
+             for stat in sorted_categories if stat.progress_rate > 0],
+            self.chart_options.top_categories,
+            self._merge_category_slices
+        )
+        for label, _, _, progress_rate in slices:
+            yield f"    \"{label}\" : {progress_rate:.1f}\n"
+        if not slices:
+            yield "    \"진행중인 카테고리 없음\" : 100\n"
+        yield "```"
+
+    @staticmethod
+    def _merge_category_slices(slices: list) -> tuple:
+        """파이 차트에서 제외된 카테고리들을 '기타' 조각 하나로 합칩니다."""
+        completed = sum(item[1] for item in slices)
+        total = sum(item[2] for item in slices)
+        return (OTHER_LABEL, completed, total, (completed / total * 100) if total > 0 else 0)
+
+    def _iter_daily_status(self) -> Iterator[str]:
         """일자별 상세 현황을 생성합니다."""
         daily_stats = self._calculate_daily_stats()
-        
-        status = """### 📅 일자별 상세 현황
+
+        yield """### 📅 일자별 상세 현황
 
 | 날짜 | 완료된 태스크 | 신규 태스크 | 진행중 태스크 |
 | ---- | ------------- | ----------- | ------------- |"""
-        
+
         sorted_dates = sorted(daily_stats.items(), reverse=True)
         for date, stats in sorted_dates:
-            status += f"\n| {date} | {stats['completed']} | {stats['new']} | {stats['in_progress']} |"
-        
-        # 일자별 추이 차트 추가
-        status += "\n\n```mermaid\ngantt\n    title 일자별 태스크 현황\n"
-        status += "    dateFormat YYYY-MM-DD\n"
-        
-        for date, stats in sorted_dates:
-            if stats['completed'] > 0:
-                status += f"    section {date}\n"
-                status += f"    완료된 태스크 ({stats['completed']}) : done, {date}, 1d\n"
-            if stats['in_progress'] > 0:
-                status += f"    진행중 태스크 ({stats['in_progress']}) : active, {date}, 1d\n"
-        
-        status += "```"
-        return status
-
-    def _format_task_history(self) -> str:
+            yield f"\n| {date} | {stats['completed']} | {stats['new']} | {stats['in_progress']} |"
+
+        # 일자별 추이 차트 추가 (오래된 날짜는 주/월 단위로 묶고 항목 수를 제한)
+        yield "\n\n```mermaid\ngantt\n    title 일자별 태스크 현황\n"
+        yield "    dateFormat YYYY-MM-DD\n"
+
+        today = datetime.strptime(self.current_date, '%Y-%m-%d').date()
+        for bucket in bucket_daily_stats(daily_stats, today, self.chart_options):
+            start = bucket.start.isoformat()
+            if bucket.completed > 0:
+                yield f"    section {bucket.label}\n"
+                yield f"    완료된 태스크 ({bucket.completed}) : done, {start}, {bucket.days}d\n"
+            if bucket.in_progress > 0:
+                yield f"    진행중 태스크 ({bucket.in_progress}) : active, {start}, {bucket.days}d\n"
+
+        yield "```"
+
+    def _iter_forecast(self) -> Iterator[str]:
+        """처리량 추이와 완료 예측 섹션을 생성합니다."""
+        records = sorted(
+            ((todo.created_at, todo.closed_at if todo.status == 'Done' else None, category)
+             for todo, _, category in self.task_manager.iter_todos()),
+            key=lambda record: (record[0] or '', record[1] or '', record[2])
+        )
+        today = datetime.now(pytz.timezone(self.timezone)).date()
+        # 입력 시계열이 같으면 예측 계산 자체를 건너뜁니다.
+        yield from self._cached(
+            'forecast',
+            lambda: {
+                'records': records,
+                'today': today.isoformat(),
+                'timezone': self.timezone,
+                'window': self.forecast_window_days
+            },
+            lambda: self._render_forecast(
+                calculate_forecast(records, TASK_CATEGORIES, self.timezone, today, self.forecast_window_days)
+            )
+        )
+
+    def _render_forecast(self, forecast: Forecast) -> Iterator[str]:
+        yield "\n## 📈 처리량 및 완료 예측\n\n"
+        if not forecast.weekly_throughput:
+            yield "아직 집계할 투두가 없습니다.\n"
+            return
+
+        yield f"""| 지표 | 값 |
+| ---- | -- |
+| 남은 투두 | {forecast.remaining}개 |
+| 최근 7일 일평균 완료 | {forecast.daily_rate:.1f}개 |
+| 최근 4주 주평균 완료 | {forecast.weekly_rate:.1f}개 |
+
+### 📊 주간 처리량
+
+| 주 시작일 | 완료 | 7일 이동평균 |
+| --------- | ---- | ------------ |"""
+        for week_start, count, mean in reversed(forecast.weekly_throughput):
+            yield f"\n| {week_start} | {count} | {mean:.1f} |"
+
+        yield "\n\n### 📉 카테고리별 잔여 투두\n\n"
+        yield f"| 카테고리 | {' | '.join(forecast.burndown_dates)} |\n"
+        yield f"| -------- |{' ---- |' * len(forecast.burndown_dates)}\n"
+        for category, counts in forecast.burndown.items():
+            yield f"| {TASK_CATEGORIES[category]['emoji']} {category} | {' | '.join(map(str, counts))} |\n"
+
+        yield "\n### 🎯 예상 완료일\n\n"
+        if forecast.remaining == 0:
+            yield "모든 투두가 완료되었습니다.\n"
+            return
+        if not forecast.eta:
+            yield f"최근 {self.forecast_window_days}일 동안 완료된 투두가 없어 예상 완료일을 계산할 수 없습니다.\n"
+            return
+
+        labels = dict(zip(ETA_PERCENTILES, ("낙관", "기준", "보수")))
+        yield "| 구분 | 예상 완료일 |\n| ---- | ----------- |\n"
+        for percentile, eta in forecast.eta.items():
+            yield f"| {labels[percentile]} (P{percentile}) | {eta or '1년 이후'} |\n"
+        yield f"\n> 최근 {self.forecast_window_days}일의 일별 완료 수를 {FORECAST_TRIALS:,}회 재표본추출한 시뮬레이션 결과입니다.\n"
+
+    def _iter_task_history(self) -> Iterator[str]:
         """태스크 완료 히스토리를 생성합니다."""
-        completed_todos = self.task_manager.get_all_completed_todos()
-        
-        history = "## 📅 태스크 완료 히스토리\n\n"
-        if not completed_todos:
-            return history + "아직 완료된 태스크가 없습니다."
-        
-        current_date = None
-        for date, todo, task_name in completed_todos:
-            date_str = date.strftime('%Y-%m-%d')
-            if date_str != current_date:
-                if current_date:
-                    history += "</details>\n\n"
-                count = sum(1 for d, _, _ in completed_todos if d.strftime('%Y-%m-%d') == date_str)
-                history += f'<details>\n<summary><h3 style="display: inline;">📆 {date_str} ({count}개)</h3></summary>\n\n'
-                history += "| 투두 ID | 투두명 | 상위 태스크 | 담당자 |\n|---------|--------|-------------|--------|\n"
-                current_date = date_str
-            
-            assignees_str = self._format_assignees(todo.assignees)
-            history += f"| #{todo.number} | {todo.title} | {task_name} | {assignees_str} |\n"
-        
-        if current_date:
-            history += "</details>\n"
-        
-        return history
-
-    def _format_risks(self) -> str:
+        completed_todos, hidden_count = self._visible_completed_todos()
+        yield from self._cached(
+            'task_history',
+            lambda: {
+                'todos': [
+                    (date.isoformat(), todo.number, todo.title, task_name, sorted(todo.assignees))
+                    for date, todo, task_name in completed_todos
+                ],
+                'hidden': hidden_count,
+                'days': self.history_display_days,
+                'archives': self.archive_links
+            },
+            lambda: self._render_task_history(completed_todos, hidden_count)
+        )
+
+    def _render_task_history(self, completed_todos: list, hidden_count: int = 0) -> Iterator[str]:
+        """메인 보고서의 완료 히스토리와 아카이브 목차를 생성합니다."""
+        yield "## 📅 태스크 완료 히스토리\n\n"
+        if not completed_todos and (self.archive_links or hidden_count):
+            yield "최근 완료된 태스크가 없습니다. 이전 기록은 아카이브를 참고하세요."
+        elif not completed_todos:
+            yield "아직 완료된 태스크가 없습니다."
+        else:
+            yield from self._render_history_groups(completed_todos)
+
+        if hidden_count:
+            yield f"\n\n> 보고서 크기 제한으로 {self.history_display_days}일 이전 완료 기록 {hidden_count}건은 생략되었습니다. 해당 월이 지나면 아카이브에 기록됩니다.\n"
+
+        if self.archive_links:
+            yield "\n\n### 📦 히스토리 아카이브\n\n"
+            for month in sorted(self.archive_links, reverse=True):
+                yield f"- [{month}]({self.archive_links[month]})\n"
+
+    def _render_history_groups(self, completed_todos: list) -> Iterator[str]:
+        """완료 투두를 일자별 details 블록으로 생성합니다."""
+        # 완료일 기준으로 한 번만 순회하며 그룹화합니다 (목록은 이미 최신순 정렬).
+        for index, (day, group) in enumerate(groupby(completed_todos, key=lambda entry: entry[0].date())):
+            rows = [
+                f"| #{todo.number} | {todo.title} | {task_name} | {self._format_assignees(todo.assignees)} |\n"
+                for _, todo, task_name in group
+            ]
+            if index:
+                yield "</details>\n\n"
+            yield f'<details>\n<summary><h3 style="display: inline;">📆 {day.isoformat()} ({len(rows)}개)</h3></summary>\n\n'
+            yield "| 투두 ID | 투두명 | 상위 태스크 | 담당자 |\n|---------|--------|-------------|--------|\n"
+            yield from rows
+
+        yield "</details>\n"
+
+    def _iter_risks(self) -> Iterator[str]:
         """특이사항 및 리스크 섹션을 생성합니다."""
-        return """## 📝 특이사항 및 리스크
+        yield from self._cached('risks', lambda: None, self._render_risks)
+
+    def _render_risks(self) -> Iterator[str]:
+        yield """## 📝 특이사항 및 리스크
 
 | 구분 | 내용 | 대응 방안 |
 | ---- | ---- | --------- |
@@ -226,7 +495,7 @@ pie title 전체 진행 현황
         """담당자 목록을 포맷팅합니다."""
         if not assignees:
             return "-"
-        
+
         formatted = []
         for username in sorted(assignees):
             if username in GITHUB_USER_MAPPING:
@@ -235,38 +504,87 @@ pie title 전체 진행 현황
                 formatted.append(f"[{user_info['name']}]({branch_url})")
                 continue
             formatted.append(f"@{username}")
-        
-        return ", ".join(formatted)
 
-    def _calculate_overall_stats(self) -> Dict:
-        """전체 통계를 계산합니다."""
-        total_stats = {'total': 0, 'completed': 0, 'in_progress': 0}
-        
-        for category in TASK_CATEGORIES:
-            tasks = self.task_manager.get_tasks_by_category(category)
-            total_stats['total'] += len(tasks)
-            total_stats['completed'] += sum(1 for task in tasks if task.status.state == TaskState.COMPLETED)
-            total_stats['in_progress'] += sum(1 for task in tasks if task.status.state == TaskState.IN_PROGRESS)
-        
-        return total_stats
+        return ", ".join(formatted)
 
     def _calculate_daily_stats(self) -> Dict:
         """일자별 통계를 계산합니다."""
         stats = {}
         today = datetime.now().strftime('%Y-%m-%d')
         stats[today] = {'completed': 0, 'new': 0, 'in_progress': 0}
-        
+
         # 완료된 투두 카운트
-        completed_todos = self.task_manager.get_all_completed_todos()
-        for date, _, _ in completed_todos:
-            date_str = date.strftime('%Y-%m-%d')
+        for date_str, count in self.task_manager.get_daily_completed_counts().items():
             if date_str not in stats:
                 stats[date_str] = {'completed': 0, 'new': 0, 'in_progress': 0}
-            stats[date_str]['completed'] += 1
-        
+            stats[date_str]['completed'] += count
+
+        # 아카이브된 월의 통계는 아카이브 이슈에서 확인합니다.
+        for date_str in [date_str for date_str in stats if date_str[:7] in self.archive_links]:
+            del stats[date_str]
+        stats.setdefault(today, {'completed': 0, 'new': 0, 'in_progress': 0})
+
         # 진행중인 투두 카운트
-        for category in TASK_CATEGORIES:
-            tasks = self.task_manager.get_tasks_by_category(category)
-            stats[today]['in_progress'] += sum(1 for task in tasks if task.status.state == TaskState.IN_PROGRESS)
-        
-        return stats 
\ No newline at end of file
+        stats[today]['in_progress'] += self.get_report_data().in_progress_tasks
+
+        return stats
+
+    # ------------------------------------------------------------------
+    # 히스토리 아카이브
+    # ------------------------------------------------------------------
+    def _history_cutoff(self) -> str:
+        """메인 보고서 유지 기간의 시작일(YYYY-MM-DD)을 반환합니다."""
+        return (datetime.now() - timedelta(days=self.history_window_days)).strftime('%Y-%m-%d')
+
+    def get_archivable_months(self) -> List[str]:
+        """유지 기간보다 완전히 오래된, 완료 기록이 있는 월 목록을 반환합니다."""
+        cutoff_month = self._history_cutoff()[:7]
+        return sorted(
+            month for month in {date_str[:7] for date_str in self.task_manager.get_daily_completed_counts()}
+            if month < cutoff_month
+        )
+
+    def set_archive_links(self, archive_links: Dict[str, str]) -> None:
+        """아카이브 이슈가 존재하는 월을 설정합니다. 해당 월은 메인 보고서에서 제외됩니다."""
+        self.archive_links = dict(archive_links)
+
+    def format_archive(self, month: str) -> str:
+        """특정 월('YYYY-MM')의 완료 히스토리 아카이브 본문을 생성합니다."""
+        year, month_number = map(int, month.split('-'))
+        start = datetime(year, month_number, 1)
+        end = datetime(year + month_number // 12, month_number % 12 + 1, 1)
+        completed_todos = self.task_manager.completed_between(start, end)[::-1]
+
+        daily_counts = sorted(
+            ((date_str, count) for date_str, count in self.task_manager.get_daily_completed_counts().items()
+             if date_str.startswith(month)),
+            reverse=True
+        )
+
+        buffer = io.StringIO()
+        buffer.write(f"# 📦 {self.project_name} 완료 히스토리 ({month})\n\n")
+        buffer.write(f"> {month} 완료 기록을 보존하는 아카이브입니다. 이 이슈는 생성 후 다시 갱신되지 않습니다.\n\n")
+        buffer.write("| 날짜 | 완료된 태스크 |\n| ---- | ------------- |\n")
+        for date_str, count in daily_counts:
+            buffer.write(f"| {date_str} | {count} |\n")
+        buffer.write("\n")
+        for chunk in self._render_history_groups(completed_todos):
+            buffer.write(chunk)
+        return buffer.getvalue()
+
+    def _visible_completed_todos(self) -> Tuple[list, int]:
+        """아카이브된 월과 표시 기간 밖의 항목을 제외한 완료 투두 목록과 생략된 항목 수를 반환합니다."""
+        completed_todos = self.task_manager.get_all_completed_todos()
+        if self.archive_links:
+            archived = {tuple(map(int, month.split('-'))) for month in self.archive_links}
+            completed_todos = [
+                entry for entry in completed_todos
+                if (entry[0].year, entry[0].month) not in archived
+            ]
+
+        if not self.history_display_days:
+            return completed_todos, 0
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.history_display_days)
+        visible = [entry for entry in completed_todos if entry[0] >= cutoff]
+        return visible, len(completed_todos) - len(visible)
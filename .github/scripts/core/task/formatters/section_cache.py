@@ -0,0 +1,66 @@
+"""
+보고서 섹션 렌더링 캐시
+"""
+import json
+import hashlib
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional
+from core.utils.state_store import StateStore
+
+logger = logging.getLogger(__name__)
+
+class SectionCache:
+    """
+    섹션 입력 데이터의 해시를 키로 렌더링 결과를 재사용하는 캐시
+
+    입력이 바뀐 섹션만 다시 렌더링하며, StateStore를 통해 실행 간에 유지됩니다.
+    context에는 모든 섹션 렌더링에 영향을 주는 값(템플릿 버전, 사용자 매핑 등)을 전달합니다.
+    """
+
+    def __init__(self, store: Optional[StateStore] = None, context: Any = None):
+        self.store = store
+        self.context_hash = self.fingerprint(context)
+        data = store.load() if store else {}
+        if data.get('context') == self.context_hash:
+            self.entries: Dict[str, Dict[str, str]] = data.get('sections', {})
+        else:
+            self.entries = {}
+        self.fingerprints: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(inputs: Any) -> str:
+        """입력 데이터의 해시를 계산합니다."""
+        payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def render(self, name: str, inputs: Any, render: Callable[[], Iterable[str]]) -> str:
+        """입력이 바뀐 경우에만 섹션을 렌더링합니다."""
+        key = self.fingerprint(inputs)
+        self.fingerprints[name] = key
+
+        entry = self.entries.get(name)
+        if entry and entry.get('hash') == key:
+            self.hits += 1
+            return entry['content']
+
+        self.misses += 1
+        content = ''.join(render())
+        self.entries[name] = {'hash': key, 'content': content}
+        return content
+
+    def save(self) -> None:
+        """이번 실행에서 사용된 섹션만 남기고 캐시를 저장합니다."""
+        logger.info(f"섹션 캐시: {self.hits}개 재사용, {self.misses}개 렌더링")
+        if not self.store:
+            return
+
+        self.store.save({
+            'context': self.context_hash,
+            'sections': {
+                name: entry
+                for name, entry in self.entries.items()
+                if name in self.fingerprints
+            }
+        })
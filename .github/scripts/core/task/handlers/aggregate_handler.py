@@ -0,0 +1,389 @@
+"""
+태스크 진행 집계 핸들러
+"""
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+from ..models.status import TaskStatus, TaskState
+from ..models.constants import TASK_CATEGORIES
+from core.utils.state_store import StateStore, SLACK_STATE_NAMESPACE
+
+DEFAULT_CATEGORY = "기능 개발"
+# 이벤트 알림 실행 간에 보존하는 집계 상태 (일일 리포트의 전체 스냅샷으로 다시 맞춥니다)
+TASK_AGGREGATE_STATE = 'task_aggregate'
+
+class TaskAggregator:
+    """
+    태스크/카테고리/담당자/일자별 카운터를 유지하는 집계 엔진
+
+    아이템(투두) 단위 변경분(생성, 완료, 재오픈, 담당자 변경, 카테고리 변경)을
+    받아 관련 카운터만 O(1)로 갱신하므로, 전체 프로젝트를 다시 계산하지 않고도
+    상태를 최신으로 유지할 수 있습니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        # 투두 번호 -> {'task', 'assignees', 'closed', 'closed_on'}
+        self.items: Dict[int, Dict] = {}
+        # 태스크명 -> {'total', 'completed'}
+        self.task_counts: Dict[str, Dict[str, int]] = {}
+        self.task_categories: Dict[str, str] = {}
+        # 카테고리 -> {'total', 'completed', 'in_progress', 'waiting'} (태스크 단위)
+        self.category_counts: Dict[str, Dict[str, int]] = {
+            category: self._empty_category_counts()
+            for category in TASK_CATEGORIES
+        }
+        self.overall_counts = self._empty_category_counts()
+        # 담당자 -> {'open', 'closed'} (투두 단위)
+        self.assignee_counts: Dict[str, Dict[str, int]] = {}
+        # 'YYYY-MM-DD' -> 완료된 투두 수
+        self.daily_closed: Dict[str, int] = {}
+        # 마지막으로 전체 프로젝트 스냅샷에서 구축한 시각 (없으면 이벤트만 반영된 부분 상태)
+        self.snapshot_at: Optional[str] = None
+
+    @classmethod
+    def from_task_mapping(cls, task_mapping: Dict[str, Dict], task_categories: Dict[str, str]) -> 'TaskAggregator':
+        """TaskHandler의 태스크 매핑으로부터 집계 상태를 구축합니다."""
+        aggregator = cls()
+        for task_name, task_data in task_mapping.items():
+            category = task_categories.get(task_name, DEFAULT_CATEGORY)
+            for todo in task_data['todos']:
+                aggregator.add_item(
+                    todo.number,
+                    task_name,
+                    todo.assignees,
+                    todo.closed_at if todo.status == 'Done' else None,
+                    closed=todo.status == 'Done',
+                    category=category
+                )
+        aggregator.snapshot_at = datetime.now(timezone.utc).isoformat()
+        return aggregator
+
+    @classmethod
+    def load(cls, store: Optional[StateStore] = None) -> 'TaskAggregator':
+        """저장된 집계 상태를 불러옵니다."""
+        store = store or StateStore(TASK_AGGREGATE_STATE, namespace=SLACK_STATE_NAMESPACE)
+        return cls.from_dict(store.load())
+
+    def save(self, store: Optional[StateStore] = None) -> None:
+        store = store or StateStore(TASK_AGGREGATE_STATE, namespace=SLACK_STATE_NAMESPACE)
+        store.save(self.to_dict())
+
+    # ------------------------------------------------------------------
+    # 변경분(delta) 적용
+    # ------------------------------------------------------------------
+    def add_item(self, number: int, task_name: str, assignees: Iterable[str] = (),
+                 closed_at: Optional[str] = None, closed: bool = False,
+                 category: Optional[str] = None, closed_on: Optional[str] = None) -> None:
+        """투두 아이템을 추가합니다. 이미 존재하면 기존 항목을 대체합니다."""
+        if number in self.items:
+            self.remove_item(number)
+
+        if task_name not in self.task_counts:
+            self._add_task(task_name, category or DEFAULT_CATEGORY)
+
+        closed = closed or bool(closed_at)
+        item = {
+            'task': task_name,
+            'assignees': set(assignees),
+            'closed': closed,
+            'closed_on': (closed_on or self._to_date_string(closed_at)) if closed else None
+        }
+        self.items[number] = item
+
+        before = self._task_state(task_name)
+        self.task_counts[task_name]['total'] += 1
+        if closed:
+            self.task_counts[task_name]['completed'] += 1
+        self._move_task_state(task_name, before)
+
+        self._count_assignees(item, 1)
+        self._count_daily(item, 1)
+
+    def item_opened(self, number: int, task_name: str, assignees: Iterable[str] = (),
+                    category: Optional[str] = None) -> None:
+        """새 투두가 열렸을 때 카운터를 갱신합니다."""
+        self.add_item(number, task_name, assignees, category=category)
+
+    def item_closed(self, number: int, closed_at: Optional[str] = None) -> None:
+        """투두가 완료되었을 때 카운터를 갱신합니다."""
+        item = self.items.get(number)
+        if not item or item['closed']:
+            return
+
+        task_name = item['task']
+        before = self._task_state(task_name)
+        self._count_assignees(item, -1)
+        item['closed'] = True
+        item['closed_on'] = self._to_date_string(closed_at)
+        self._count_assignees(item, 1)
+        self._count_daily(item, 1)
+
+        self.task_counts[task_name]['completed'] += 1
+        self._move_task_state(task_name, before)
+
+    def item_reopened(self, number: int) -> None:
+        """완료된 투두가 다시 열렸을 때 카운터를 갱신합니다."""
+        item = self.items.get(number)
+        if not item or not item['closed']:
+            return
+
+        task_name = item['task']
+        before = self._task_state(task_name)
+        self._count_assignees(item, -1)
+        self._count_daily(item, -1)
+        item['closed'] = False
+        item['closed_on'] = None
+        self._count_assignees(item, 1)
+
+        self.task_counts[task_name]['completed'] -= 1
+        self._move_task_state(task_name, before)
+
+    def item_reassigned(self, number: int, assignees: Iterable[str]) -> None:
+        """투두 담당자가 변경되었을 때 카운터를 갱신합니다."""
+        item = self.items.get(number)
+        if not item:
+            return
+
+        self._count_assignees(item, -1)
+        item['assignees'] = set(assignees)
+        self._count_assignees(item, 1)
+
+    def task_recategorized(self, task_name: str, category: str) -> None:
+        """태스크 카테고리가 변경되었을 때 카운터를 옮깁니다."""
+        current = self.task_categories.get(task_name)
+        if current is None or current == category:
+            return
+
+        state_key = self._state_key(self._task_state(task_name))
+        self._category(current)['total'] -= 1
+        self._category(current)[state_key] -= 1
+        self._category(category)['total'] += 1
+        self._category(category)[state_key] += 1
+        self.task_categories[task_name] = category
+
+    def remove_item(self, number: int) -> None:
+        """투두를 집계에서 제거합니다."""
+        item = self.items.pop(number, None)
+        if not item:
+            return
+
+        task_name = item['task']
+        before = self._task_state(task_name)
+        self._count_assignees(item, -1)
+        self._count_daily(item, -1)
+
+        self.task_counts[task_name]['total'] -= 1
+        if item['closed']:
+            self.task_counts[task_name]['completed'] -= 1
+
+        if self.task_counts[task_name]['total'] == 0:
+            self._remove_task(task_name, before)
+        else:
+            self._move_task_state(task_name, before)
+
+    def apply_event(self, event_data: Dict) -> bool:
+        """GitHub issues 웹훅 이벤트를 변경분으로 변환하여 적용합니다."""
+        issue = event_data.get('issue')
+        action = event_data.get('action')
+        if not issue or not action:
+            return False
+
+        match = re.match(r'\[(.*?)\]', issue.get('title', ''))
+        if not match:
+            return False
+
+        task_name = match.group(1)
+        number = issue['number']
+        assignees = [a['login'] for a in issue.get('assignees', [])]
+        labels = [label['name'] for label in issue.get('labels', [])]
+        category = self._category_from_labels(labels)
+
+        if action == 'opened' or (number not in self.items and action != 'deleted'):
+            self.add_item(
+                number,
+                task_name,
+                assignees,
+                issue.get('closed_at'),
+                closed=issue.get('state') == 'closed',
+                category=category
+            )
+        elif action == 'closed':
+            self.item_closed(number, issue.get('closed_at'))
+        elif action == 'reopened':
+            self.item_reopened(number)
+        elif action in ('assigned', 'unassigned'):
+            self.item_reassigned(number, assignees)
+        elif action in ('labeled', 'unlabeled'):
+            if category:
+                self.task_recategorized(self.items[number]['task'], category)
+        elif action in ('deleted', 'transferred'):
+            self.remove_item(number)
+        else:
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_task_status(self, task_name: str) -> TaskStatus:
+        """태스크의 상태를 카운터로부터 계산합니다."""
+        counts = self.task_counts.get(task_name)
+        if not counts or counts['total'] == 0:
+            return TaskStatus(TaskState.WAITING, 0.0)
+
+        state = self._task_state(task_name)
+        if state == TaskState.WAITING:
+            return TaskStatus(state, 0.0)
+        return TaskStatus(state, (counts['completed'] / counts['total']) * 100)
+
+    def get_task_counts(self, task_name: str) -> Optional[Dict[str, int]]:
+        """태스크의 전체/완료 투두 수를 반환합니다. (집계에 없으면 None)"""
+        counts = self.task_counts.get(task_name)
+        return dict(counts) if counts else None
+
+    def get_category_stats(self, category: str) -> Dict:
+        """카테고리별 태스크 통계를 반환합니다."""
+        counts = self.category_counts.get(category, self._empty_category_counts())
+        return self._with_progress_rate(counts)
+
+    def get_overall_stats(self) -> Dict:
+        """전체 태스크 통계를 반환합니다."""
+        return self._with_progress_rate(self.overall_counts)
+
+    def get_assignee_counts(self, username: str) -> Dict[str, int]:
+        """담당자별 열린/완료 투두 수를 반환합니다."""
+        return dict(self.assignee_counts.get(username, {'open': 0, 'closed': 0}))
+
+    def get_daily_closed(self) -> Dict[str, int]:
+        """일자별 완료 투두 수를 반환합니다."""
+        return dict(self.daily_closed)
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict:
+        """집계 상태를 JSON 직렬화 가능한 딕셔너리로 변환합니다."""
+        return {
+            'version': self.VERSION,
+            'items': {
+                str(number): {
+                    'task': item['task'],
+                    'assignees': sorted(item['assignees']),
+                    'closed': item['closed'],
+                    'closed_on': item['closed_on']
+                }
+                for number, item in self.items.items()
+            },
+            'task_categories': dict(self.task_categories),
+            'snapshot_at': self.snapshot_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TaskAggregator':
+        """직렬화된 상태로부터 집계 엔진을 복원합니다."""
+        aggregator = cls()
+        if not data or data.get('version') != cls.VERSION:
+            return aggregator
+
+        task_categories = data.get('task_categories', {})
+        for number, item in data.get('items', {}).items():
+            aggregator.add_item(
+                int(number),
+                item['task'],
+                item.get('assignees', []),
+                closed=item.get('closed', False),
+                category=task_categories.get(item['task']),
+                closed_on=item.get('closed_on')
+            )
+        aggregator.snapshot_at = data.get('snapshot_at')
+        return aggregator
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _empty_category_counts() -> Dict[str, int]:
+        return {'total': 0, 'completed': 0, 'in_progress': 0, 'waiting': 0}
+
+    @staticmethod
+    def _with_progress_rate(counts: Dict[str, int]) -> Dict:
+        stats = dict(counts)
+        total = stats['total']
+        stats['progress_rate'] = (stats['completed'] / total) * 100 if total > 0 else 0.0
+        return stats
+
+    @staticmethod
+    def _state_key(state: TaskState) -> str:
+        return {
+            TaskState.COMPLETED: 'completed',
+            TaskState.IN_PROGRESS: 'in_progress'
+        }.get(state, 'waiting')
+
+    @staticmethod
+    def _to_date_string(closed_at: Optional[str]) -> Optional[str]:
+        if not closed_at:
+            return None
+        return datetime.fromisoformat(closed_at.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+
+    @staticmethod
+    def _category_from_labels(labels: Iterable[str]) -> Optional[str]:
+        for label in labels:
+            if label.startswith('category:'):
+                cat_name = label.replace('category:', '').strip()
+                if cat_name in TASK_CATEGORIES:
+                    return cat_name
+        return None
+
+    def _category(self, category: str) -> Dict[str, int]:
+        if category not in self.category_counts:
+            self.category_counts[category] = self._empty_category_counts()
+        return self.category_counts[category]
+
+    def _task_state(self, task_name: str) -> TaskState:
+        counts = self.task_counts.get(task_name)
+        if not counts or counts['total'] == 0 or counts['completed'] == 0:
+            return TaskState.WAITING
+        if counts['completed'] == counts['total']:
+            return TaskState.COMPLETED
+        return TaskState.IN_PROGRESS
+
+    def _add_task(self, task_name: str, category: str) -> None:
+        self.task_counts[task_name] = {'total': 0, 'completed': 0}
+        self.task_categories[task_name] = category
+        for counts in (self._category(category), self.overall_counts):
+            counts['total'] += 1
+            counts['waiting'] += 1
+
+    def _remove_task(self, task_name: str, state: TaskState) -> None:
+        category = self.task_categories.pop(task_name)
+        del self.task_counts[task_name]
+        state_key = self._state_key(state)
+        for counts in (self._category(category), self.overall_counts):
+            counts['total'] -= 1
+            counts[state_key] -= 1
+
+    def _move_task_state(self, task_name: str, before: TaskState) -> None:
+        after = self._task_state(task_name)
+        if before == after:
+            return
+
+        category = self.task_categories[task_name]
+        for counts in (self._category(category), self.overall_counts):
+            counts[self._state_key(before)] -= 1
+            counts[self._state_key(after)] += 1
+
+    def _count_assignees(self, item: Dict, delta: int) -> None:
+        key = 'closed' if item['closed'] else 'open'
+        for username in item['assignees']:
+            counts = self.assignee_counts.setdefault(username, {'open': 0, 'closed': 0})
+            counts[key] += delta
+
+    def _count_daily(self, item: Dict, delta: int) -> None:
+        date_str = item['closed_on']
+        if not date_str:
+            return
+        self.daily_closed[date_str] = self.daily_closed.get(date_str, 0) + delta
+        if self.daily_closed[date_str] <= 0:
+            del self.daily_closed[date_str]
@@ -0,0 +1,160 @@
+"""
+태스크/투두 보조 인덱스 핸들러
+"""
+from bisect import bisect_left
+from datetime import datetime, date, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from ..models.task import TodoInfo, TaskInfo
+from ..models.status import TaskState
+
+DateLike = Union[datetime, date, str]
+
+def parse_datetime(value: Optional[DateLike]) -> Optional[datetime]:
+    """ISO 문자열, date, datetime을 UTC 기준 aware datetime으로 변환합니다."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+class TaskIndex:
+    """
+    담당자/상태/완료일 기준 보조 인덱스
+
+    - 담당자 -> 투두: 활동일(완료일 또는 생성일) 순으로 정렬된 목록
+    - 상태 -> 태스크: 상태별 태스크 딕셔너리
+    - 완료일 -> 투두: bisect 범위 조회가 가능한 정렬 목록
+    """
+
+    def __init__(self):
+        self._sequence = 0
+        self._todo_keys: Dict[int, Tuple] = {}
+        self._todo_assignees: Dict[int, List[str]] = {}
+        # 담당자 -> (키 목록, 항목 목록)
+        self._by_assignee: Dict[str, Tuple[List[Tuple], List[Tuple[TodoInfo, str]]]] = {}
+        # 상태 -> {태스크명: TaskInfo}
+        self._by_state: Dict[TaskState, Dict[str, TaskInfo]] = {state: {} for state in TaskState}
+        self._task_states: Dict[str, TaskState] = {}
+        # 완료일 정렬 (키 목록, (완료일, 투두, 태스크명) 목록)
+        self._closed_keys: List[Tuple] = []
+        self._closed_entries: List[Tuple[datetime, TodoInfo, str]] = []
+
+    # ------------------------------------------------------------------
+    # 인덱스 갱신
+    # ------------------------------------------------------------------
+    def add_todo(self, todo: TodoInfo, task_name: str) -> None:
+        """투두를 담당자/완료일 인덱스에 추가합니다. (이벤트 단위 갱신용, 목록마다 O(n) 삽입)"""
+        if todo.number in self._todo_keys:
+            self.remove_todo(todo.number)
+
+        key, closed_at = self._register(todo)
+        for username in todo.assignees:
+            keys, entries = self._by_assignee.setdefault(username, ([], []))
+            position = bisect_left(keys, key)
+            keys.insert(position, key)
+            entries.insert(position, (todo, task_name))
+
+        if closed_at:
+            position = bisect_left(self._closed_keys, key)
+            self._closed_keys.insert(position, key)
+            self._closed_entries.insert(position, (closed_at, todo, task_name))
+
+    def add_todos(self, todos: Iterable[Tuple[TodoInfo, str]]) -> None:
+        """여러 투두를 한 번에 추가합니다. 항목을 모은 뒤 목록마다 한 번만 정렬하므로 O(n log n)입니다."""
+        # 같은 번호가 여러 번 나오면 마지막 항목을 사용합니다.
+        batch = {todo.number: (todo, task_name) for todo, task_name in todos}
+        for number in batch:
+            if number in self._todo_keys:
+                self.remove_todo(number)
+
+        touched = set()
+        for todo, task_name in batch.values():
+            key, closed_at = self._register(todo)
+            for username in todo.assignees:
+                keys, entries = self._by_assignee.setdefault(username, ([], []))
+                keys.append(key)
+                entries.append((todo, task_name))
+                touched.add(username)
+            if closed_at:
+                self._closed_keys.append(key)
+                self._closed_entries.append((closed_at, todo, task_name))
+
+        for username in touched:
+            self._sort_together(*self._by_assignee[username])
+        self._sort_together(self._closed_keys, self._closed_entries)
+
+    def remove_todo(self, number: int) -> None:
+        """투두를 인덱스에서 제거합니다."""
+        key = self._todo_keys.pop(number, None)
+        if key is None:
+            return
+
+        for username in self._todo_assignees.pop(number, []):
+            keys, entries = self._by_assignee[username]
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+                del entries[position]
+
+        position = bisect_left(self._closed_keys, key)
+        if position < len(self._closed_keys) and self._closed_keys[position] == key:
+            del self._closed_keys[position]
+            del self._closed_entries[position]
+
+    def set_task(self, task: TaskInfo) -> None:
+        """태스크를 현재 상태의 인덱스로 옮깁니다."""
+        previous = self._task_states.get(task.title)
+        if previous is not None:
+            self._by_state[previous].pop(task.title, None)
+        self._task_states[task.title] = task.status.state
+        self._by_state[task.status.state][task.title] = task
+
+    def _register(self, todo: TodoInfo) -> Tuple[Tuple, Optional[datetime]]:
+        """투두의 정렬 키를 만들어 기록하고 (키, 완료일)을 반환합니다."""
+        self._sequence += 1
+        closed_at = parse_datetime(todo.closed_at) if todo.status == 'Done' else None
+        activity = closed_at or parse_datetime(todo.created_at) or datetime.min.replace(tzinfo=timezone.utc)
+        # 동일 시각에서는 먼저 추가된 항목이 내림차순 조회 시 앞에 오도록 순번을 음수로 둡니다.
+        key = (activity, -self._sequence, todo.number)
+        self._todo_keys[todo.number] = key
+        self._todo_assignees[todo.number] = sorted(todo.assignees)
+        return key, closed_at
+
+    @staticmethod
+    def _sort_together(keys: List[Tuple], entries: List) -> None:
+        """키 목록 기준으로 두 목록을 함께 정렬합니다. (키는 순번을 포함하므로 중복되지 않습니다)"""
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        keys[:] = [keys[i] for i in order]
+        entries[:] = [entries[i] for i in order]
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def todos_for(self, assignee: str, since: Optional[DateLike] = None) -> List[Tuple[TodoInfo, str]]:
+        """담당자의 투두 목록을 활동일 오름차순으로 반환합니다. since 이후 활동만 필터링할 수 있습니다."""
+        keys, entries = self._by_assignee.get(assignee, ([], []))
+        if since is None:
+            return list(entries)
+        start = bisect_left(keys, (parse_datetime(since),))
+        return entries[start:]
+
+    def tasks_in_state(self, state: TaskState) -> List[TaskInfo]:
+        """특정 상태의 태스크 목록을 반환합니다."""
+        return list(self._by_state[state].values())
+
+    def completed_between(self, start: Optional[DateLike] = None,
+                          end: Optional[DateLike] = None) -> List[Tuple[datetime, TodoInfo, str]]:
+        """[start, end) 구간에 완료된 투두를 완료일 오름차순으로 반환합니다."""
+        low = bisect_left(self._closed_keys, (parse_datetime(start),)) if start is not None else 0
+        high = bisect_left(self._closed_keys, (parse_datetime(end),)) if end is not None else len(self._closed_keys)
+        return self._closed_entries[low:high]
+
+    def completed_todos(self, reverse: bool = False) -> List[Tuple[datetime, TodoInfo, str]]:
+        """완료된 모든 투두를 완료일 순으로 반환합니다."""
+        if reverse:
+            return self._closed_entries[::-1]
+        return list(self._closed_entries)
@@ -1,54 +1,320 @@
 """
 태스크 리포트 관리 핸들러
 """
+import re
 import logging
+import hashlib
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from core.utils.markers import embed_marker, extract_marker
+from .report_registry import ReportRegistry
 
 logger = logging.getLogger(__name__)
 
+FINGERPRINT_MARKER = 'report-fingerprint'
+ARCHIVE_LABEL = 'report-archive'
+
+# GitHub 이슈 본문 최대 길이와 마커 등을 위한 여유분
+MAX_BODY_LENGTH = 65536
+BODY_LENGTH_MARGIN = 2048
+
 class ReportHandler:
-    def __init__(self, github_client, project_name: str):
+    def __init__(self, github_client, project_name: str, registry: Optional[ReportRegistry] = None):
         """
         태스크 리포트 핸들러 초기화
         
         Args:
             github_client: GitHub API 클라이언트
             project_name: 프로젝트 이름
+            registry: 저장소/라벨/보고서 이슈 ID 레지스트리
         """
         self.client = github_client
         self.project_name = project_name
+        self.registry = registry or ReportRegistry(project_name)
 
-    def create_or_update_report(self, report_formatter) -> None:
-        """프로젝트 보고서를 생성하거나 업데이트합니다."""
-        logger.info("프로젝트 보고서 생성/업데이트 시작")
+    def create_or_update_report(self, report_formatter) -> List[str]:
+        """
+        프로젝트 보고서를 생성하거나 업데이트합니다.
         
-        # 저장소 ID와 라벨 ID 가져오기
-        repo_id, labels = self._get_repository_id()
-        if not repo_id:
-            logger.error("저장소 ID를 가져오는데 실패했습니다.")
-            return
+        본문 해시를 숨김 마커로 함께 저장하고, 게시된 보고서와 해시가 같으면
+        업데이트를 건너뜁니다. 보고서 이슈 ID를 레지스트리에 보관하므로 정상 상태에서는
+        업데이트 뮤테이션 한 번으로 게시하며, 뮤테이션이 NOT_FOUND로 실패하거나
+        닫힌 이슈를 가리킬 때만 보고서를 다시 찾습니다.
         
-        # report 라벨이 없으면 생성
-        if 'report' not in labels:
-            logger.info("'report' 라벨이 없어 새로 생성합니다...")
-            label_id = self._create_report_label(repo_id)
-            if label_id:
-                labels['report'] = label_id
+        Returns:
+            List[str]: 변경된 섹션 이름 목록 (변경이 없으면 빈 목록)
+        """
+        logger.info("프로젝트 보고서 생성/업데이트 시작")
         
         # 보고서 제목 생성
         report_title = f"📊 프로젝트 진행보고서 - {self.project_name}"
         
-        # 보고서 본문 생성
-        report_body = report_formatter.format_report()
+        try:
+            # 오래된 히스토리를 월별 아카이브로 옮긴 뒤 보고서 본문 생성
+            report_formatter.set_archive_links(self._sync_archives(report_formatter))
+            report_body = self._render_within_limit(report_formatter)
+            fingerprint = {
+                'body': hashlib.sha256(report_body.encode('utf-8')).hexdigest(),
+                'sections': dict(report_formatter.section_hashes)
+            }
+            return self._publish(report_title, report_body, fingerprint)
+        finally:
+            self.registry.save()
+
+    def _publish(self, report_title: str, report_body: str, fingerprint: Dict) -> List[str]:
+        """보고서를 게시하고 변경된 섹션 목록을 반환합니다."""
+        body = embed_marker(report_body, FINGERPRINT_MARKER, fingerprint)
+        
+        # 저장된 보고서 이슈 ID를 먼저 사용 (삭제되었거나 닫힌 경우에만 다시 조회)
+        known_report = self.registry.report
+        if known_report.get('id'):
+            previous = known_report.get('fingerprint') or {}
+            unchanged = previous.get('body') == fingerprint['body'] and known_report.get('title') == report_title
+            # 내용이 같을 때만 이슈가 닫히거나 직접 수정되지 않았는지 조회하고, 바뀐 경우는 업데이트 결과로 판단
+            status = self._check_report(known_report) if unchanged else 'edited'
+            if status == 'unchanged':
+                logger.info(f"보고서 #{known_report.get('number')} 내용이 변경되지 않아 업데이트를 건너뜁니다.")
+                return []
+            
+            if status:
+                updated_report = self._update_report(known_report, report_title, body)
+                if updated_report and updated_report.get('state') == 'OPEN':
+                    return self._record_update(updated_report, report_title, fingerprint, previous)
+                if not updated_report and not self.client.is_not_found():
+                    return []
+            logger.warning(f"저장된 보고서 #{known_report.get('number')}를 사용할 수 없어 다시 조회합니다.")
+            self.registry.forget_report()
         
         # 기존 보고서 찾기
         existing_report = self._find_existing_report()
         
         if existing_report:
-            self._update_report(existing_report, report_title, report_body)
-        else:
-            self._create_report(repo_id, labels, report_title, report_body)
+            previous = extract_marker(existing_report.get('body'), FINGERPRINT_MARKER) or {}
+            if previous.get('body') == fingerprint['body'] and existing_report['title'] == report_title:
+                logger.info(f"보고서 #{existing_report['number']} 내용이 변경되지 않아 업데이트를 건너뜁니다.")
+                self.registry.set_report(existing_report, report_title, previous)
+                return []
+            
+            updated_report = self._update_report(existing_report, report_title, body)
+            if updated_report:
+                return self._record_update(updated_report, report_title, fingerprint, previous)
+            return []
+        
+        created_report = self._create_new_report(report_title, body)
+        if not created_report:
+            return []
+        self.registry.set_report(created_report, report_title, fingerprint)
+        return list(fingerprint['sections'])
+
+    def _check_report(self, known_report: Dict) -> Optional[str]:
+        """
+        저장된 보고서 이슈의 상태를 노드 조회 한 번으로 확인합니다.
+        
+        Returns:
+            Optional[str]: 'unchanged', 마지막 게시 이후 다른 곳에서 수정되었으면 'edited',
+            닫히거나 삭제되었으면 None
+        """
+        query = """
+        query($id: ID!) {
+            node(id: $id) {
+                ... on Issue {
+                    state
+                    updatedAt
+                }
+            }
+        }
+        """
+        
+        result = self.client._execute_graphql(query, {"id": known_report['id']})
+        if result is None:
+            # 일시적인 조회 실패는 저장된 보고서를 그대로 사용합니다.
+            return None if self.client.is_not_found() else 'unchanged'
+        node = result.get('node')
+        if not node or node.get('state') != 'OPEN':
+            return None
+        return 'unchanged' if node.get('updatedAt') == known_report.get('updated_at') else 'edited'
+    
+    def _record_update(self, report: Dict, title: str, fingerprint: Dict, previous: Dict) -> List[str]:
+        """업데이트된 보고서를 레지스트리에 기록하고 변경된 섹션 목록을 반환합니다."""
+        self.registry.set_report(report, title, fingerprint)
+        changed_sections = self._diff_sections(previous.get('sections', {}), fingerprint['sections'])
+        logger.info(f"변경된 섹션: {', '.join(changed_sections) or '(제목)'}")
+        return changed_sections
+
+    def _create_new_report(self, title: str, body: str) -> Optional[Dict]:
+        """새 보고서 이슈를 생성합니다. 저장된 ID가 유효하지 않으면 한 번 다시 조회해 재시도합니다."""
+        for _ in range(2):
+            repo_id, labels = self._get_repository()
+            if not repo_id:
+                logger.error("저장소 ID를 가져오는데 실패했습니다.")
+                return None
+            
+            # report 라벨이 없으면 생성
+            if 'report' not in labels:
+                logger.info("'report' 라벨이 없어 새로 생성합니다...")
+                label_id = self._create_report_label(repo_id)
+                if label_id:
+                    labels['report'] = label_id
+            
+            created_report = self._create_report(repo_id, labels, title, body)
+            if created_report or not self.client.is_not_found():
+                return created_report
+            logger.warning("저장된 저장소/라벨 ID가 유효하지 않아 다시 조회합니다.")
+            self.registry.forget_repository()
+        return None
+
+    def _get_repository(self) -> Tuple[Optional[str], Dict[str, str]]:
+        """레지스트리의 저장소/라벨 ID를 반환하고, 없으면 조회해 저장합니다."""
+        if not self.registry.repository_id:
+            repo_id, labels = self._get_repository_id()
+            if not repo_id:
+                return None, {}
+            self.registry.set_repository(repo_id, labels)
+        return self.registry.repository_id, self.registry.labels
+
+    def _render_within_limit(self, report_formatter) -> str:
+        """본문이 이슈 길이 제한을 넘으면 히스토리 표시 기간을 줄여 다시 렌더링합니다."""
+        body = report_formatter.format_report()
+        days = report_formatter.history_window_days
+        while len(body) > MAX_BODY_LENGTH - BODY_LENGTH_MARGIN and days > 1:
+            days //= 2
+            logger.warning(f"보고서 본문이 {len(body)}자로 제한을 넘어 히스토리 표시 기간을 {days}일로 줄입니다.")
+            report_formatter.history_display_days = days
+            body = report_formatter.format_report()
+        if len(body) > MAX_BODY_LENGTH - BODY_LENGTH_MARGIN:
+            logger.error(f"히스토리를 줄여도 보고서 본문이 {len(body)}자로 길이 제한을 초과합니다.")
+        return body
+
+    def _sync_archives(self, report_formatter) -> Dict[str, str]:
+        """
+        유지 기간이 지난 월의 히스토리를 아카이브 이슈로 한 번만 기록합니다.
+        
+        Returns:
+            Dict[str, str]: 월('YYYY-MM') -> 아카이브 이슈 URL
+        """
+        months = report_formatter.get_archivable_months()
+        if not months:
+            return {}
+        
+        # 레지스트리에 없는 월이 있을 때만 아카이브 이슈를 조회
+        archives = self.registry.archives
+        if any(month not in archives for month in months):
+            archives.update(self._find_archives())
+        missing = [month for month in months if month not in archives]
+        if not missing:
+            return dict(archives)
+        
+        repo_id, labels = self._get_repository()
+        if not repo_id:
+            logger.error("저장소 ID를 가져오지 못해 아카이브를 생성하지 않습니다.")
+            return dict(archives)
+        
+        if ARCHIVE_LABEL not in labels:
+            label_id = self._create_label(repo_id, ARCHIVE_LABEL, "프로젝트 보고서 히스토리 아카이브", "BFD4F2")
+            if label_id:
+                labels[ARCHIVE_LABEL] = label_id
+        for month in missing:
+            url = self._create_archive(repo_id, labels.get(ARCHIVE_LABEL), month, report_formatter.format_archive(month))
+            if url:
+                archives[month] = url
+            elif self.client.is_not_found():
+                logger.warning("저장된 저장소/라벨 ID가 유효하지 않아 다음 실행에서 다시 조회합니다.")
+                self.registry.forget_repository()
+                break
+        
+        return dict(archives)
+
+    def _archive_title(self, month: str) -> str:
+        return f"📦 프로젝트 진행보고서 아카이브 ({month}) - {self.project_name}"
+
+    def _find_archives(self) -> Dict[str, str]:
+        """기존 아카이브 이슈를 찾습니다."""
+        query = """
+        query($org: String!, $name: String!, $label: String!) {
+            organization(login: $org) {
+                repository(name: $name) {
+                    issues(first: 100, states: [OPEN, CLOSED], labels: [$label], orderBy: {field: CREATED_AT, direction: DESC}) {
+                        nodes {
+                            title
+                            url
+                        }
+                    }
+                }
+            }
+        }
+        """
+        
+        variables = {
+            "org": self.client.org,
+            "name": self.project_name,
+            "label": ARCHIVE_LABEL
+        }
+        
+        result = self.client._execute_graphql(query, variables)
+        archives = {}
+        if result and 'organization' in result and 'repository' in result['organization']:
+            for issue in result['organization']['repository']['issues']['nodes']:
+                match = re.search(r'\((\d{4}-\d{2})\)', issue['title'])
+                if match:
+                    archives.setdefault(match.group(1), issue['url'])
+        return archives
+
+    def _create_archive(self, repo_id: str, label_id: Optional[str], month: str, body: str) -> Optional[str]:
+        """월별 아카이브 이슈를 생성하고 닫힌 상태로 보관합니다."""
+        create_query = """
+        mutation($repositoryId: ID!, $title: String!, $body: String!, $labelIds: [ID!]) {
+            createIssue(input: {
+                repositoryId: $repositoryId,
+                title: $title,
+                body: $body,
+                labelIds: $labelIds
+            }) {
+                issue {
+                    id
+                    number
+                    url
+                }
+            }
+        }
+        """
+        
+        if len(body) > MAX_BODY_LENGTH:
+            logger.warning(f"{month} 아카이브가 길이 제한을 넘어 잘라서 기록합니다.")
+            body = body[:MAX_BODY_LENGTH - BODY_LENGTH_MARGIN] + "\n\n> 길이 제한으로 이후 기록이 생략되었습니다.\n"
+        
+        variables = {
+            "repositoryId": repo_id,
+            "title": self._archive_title(month),
+            "body": body,
+            "labelIds": [label_id] if label_id else []
+        }
+        
+        result = self.client._execute_graphql(create_query, variables)
+        if not result or 'createIssue' not in result:
+            logger.error(f"{month} 아카이브 생성 실패: {result}")
+            return None
+        
+        issue = result['createIssue']['issue']
+        close_query = """
+        mutation($id: ID!) {
+            closeIssue(input: {issueId: $id}) {
+                issue {
+                    number
+                }
+            }
+        }
+        """
+        self.client._execute_graphql(close_query, {"id": issue['id']})
+        logger.info(f"{month} 히스토리 아카이브 #{issue['number']} 생성 완료")
+        return issue['url']
+
+    @staticmethod
+    def _diff_sections(previous: Dict[str, str], current: Dict[str, str]) -> List[str]:
+        """이전 게시본과 해시가 다른 섹션 이름을 반환합니다."""
+        return [
+            name for name, section_hash in current.items()
+            if previous.get(name) != section_hash
+        ]
 
     def _get_repository_id(self) -> Tuple[Optional[str], Dict[str, str]]:
         """저장소의 ID를 가져옵니다."""
@@ -85,6 +351,10 @@ class ReportHandler:
 
     def _create_report_label(self, repo_id: str) -> Optional[str]:
         """report 라벨을 생성합니다."""
+        return self._create_label(repo_id, "report", "프로젝트 보고서 관련 이슈", "0E8A16")  # 초록색
+
+    def _create_label(self, repo_id: str, name: str, description: str, color: str) -> Optional[str]:
+        """라벨을 생성합니다."""
         create_label_mutation = """
         mutation($repositoryId: ID!, $name: String!, $description: String!, $color: String!) {
             createLabel(input: {
@@ -102,18 +372,18 @@ class ReportHandler:
         
         variables = {
             "repositoryId": repo_id,
-            "name": "report",
-            "description": "프로젝트 보고서 관련 이슈",
-            "color": "0E8A16"  # 초록색
+            "name": name,
+            "description": description,
+            "color": color
         }
         
         result = self.client._execute_graphql(create_label_mutation, variables)
         if result and 'createLabel' in result:
             label_id = result['createLabel']['label']['id']
-            logger.info("'report' 라벨이 성공적으로 생성되었습니다.")
+            logger.info(f"'{name}' 라벨이 성공적으로 생성되었습니다.")
             return label_id
         else:
-            logger.error("'report' 라벨 생성 실패")
+            logger.error(f"'{name}' 라벨 생성 실패")
             return None
 
     def _find_existing_report(self) -> Optional[Dict]:
@@ -127,7 +397,10 @@ class ReportHandler:
                             id
                             number
                             title
+                            body
+                            url
                             createdAt
+                            updatedAt
                         }
                     }
                 }
@@ -152,13 +425,15 @@ class ReportHandler:
         
         return None
 
-    def _update_report(self, existing_report: Dict, title: str, body: str) -> None:
-        """기존 보고서를 업데이트합니다."""
+    def _update_report(self, existing_report: Dict, title: str, body: str) -> Optional[Dict]:
+        """기존 보고서를 업데이트하고, 갱신된 이슈 정보를 반환합니다."""
         update_query = """
         mutation($id: ID!, $title: String!, $body: String!) {
             updateIssue(input: {id: $id, title: $title, body: $body}) {
                 issue {
                     number
+                    state
+                    updatedAt
                 }
             }
         }
@@ -173,10 +448,11 @@ class ReportHandler:
         result = self.client._execute_graphql(update_query, variables)
         if result:
             logger.info(f"보고서 #{existing_report['number']} 업데이트 완료")
-        else:
-            logger.error("보고서 업데이트 실패")
+            return {**existing_report, **result['updateIssue']['issue']}
+        logger.error("보고서 업데이트 실패")
+        return None
 
-    def _create_report(self, repo_id: str, labels: Dict[str, str], title: str, body: str) -> None:
+    def _create_report(self, repo_id: str, labels: Dict[str, str], title: str, body: str) -> Optional[Dict]:
         """새 보고서를 생성합니다."""
         create_query = """
         mutation($repositoryId: ID!, $title: String!, $body: String!, $labelIds: [ID!]) {
@@ -187,7 +463,10 @@ class ReportHandler:
                 labelIds: $labelIds
             }) {
                 issue {
+                    id
                     number
+                    url
+                    updatedAt
                 }
             }
         }
@@ -208,7 +487,8 @@ class ReportHandler:
         
         result = self.client._execute_graphql(create_query, variables)
         if result and 'createIssue' in result:
-            issue_number = result['createIssue']['issue']['number']
-            logger.info(f"새 보고서 #{issue_number} 생성 완료")
-        else:
-            logger.error(f"보고서 생성 실패: {result}") 
\ No newline at end of file
+            issue = result['createIssue']['issue']
+            logger.info(f"새 보고서 #{issue['number']} 생성 완료")
+            return issue
+        logger.error(f"보고서 생성 실패: {result}")
+        return None 
\ No newline at end of file
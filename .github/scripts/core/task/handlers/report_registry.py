@@ -0,0 +1,57 @@
+"""
+보고서 게시용 노드 ID 레지스트리
+"""
+from typing import Any, Dict, Optional
+from core.utils.state_store import StateStore
+
+REGISTRY_STATE = 'report_registry'
+
+class ReportRegistry:
+    """
+    저장소 ID, 라벨 ID, 현재 보고서 이슈, 월별 아카이브 URL을 실행 간에 보존합니다.
+
+    저장된 값을 먼저 사용하고, 뮤테이션이 NOT_FOUND로 실패했을 때만 해당 항목을 비우고 다시 조회합니다.
+    """
+
+    def __init__(self, project_name: str, store: Optional[StateStore] = None):
+        self.project_name = project_name
+        self.store = store or StateStore(REGISTRY_STATE)
+        data = self.store.load()
+        if data.get('project') != project_name:
+            data = {}
+        self.repository_id: Optional[str] = data.get('repository_id')
+        self.labels: Dict[str, str] = data.get('labels', {})
+        # 보고서 이슈: id, number, url, title, updated_at, fingerprint
+        self.report: Dict[str, Any] = data.get('report', {})
+        self.archives: Dict[str, str] = data.get('archives', {})
+
+    def set_repository(self, repository_id: str, labels: Dict[str, str]) -> None:
+        self.repository_id = repository_id
+        self.labels = dict(labels)
+
+    def forget_repository(self) -> None:
+        """저장소/라벨 ID를 비워 다음 요청에서 다시 조회하게 합니다."""
+        self.repository_id = None
+        self.labels = {}
+
+    def set_report(self, issue: Dict[str, Any], title: str, fingerprint: Dict[str, Any]) -> None:
+        self.report = {
+            'id': issue['id'],
+            'number': issue.get('number'),
+            'url': issue.get('url'),
+            'title': title,
+            'updated_at': issue.get('updatedAt'),
+            'fingerprint': fingerprint
+        }
+
+    def forget_report(self) -> None:
+        self.report = {}
+
+    def save(self) -> None:
+        self.store.save({
+            'project': self.project_name,
+            'repository_id': self.repository_id,
+            'labels': self.labels,
+            'report': self.report,
+            'archives': self.archives
+        })
@@ -1,21 +1,50 @@
 """
 태스크 관리 핸들러
 """
+import gc
 import os
 import re
-from datetime import datetime
-from typing import Dict, List, Set, Tuple, Optional
-from ..models.task import TodoInfo, TaskInfo
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Set, Tuple, Optional
+from ..models.task import TodoInfo, TaskInfo, WorkTime
 from ..models.status import TaskStatus, TaskState
 from ..models.constants import TASK_CATEGORIES
+from .aggregate_handler import TaskAggregator, DEFAULT_CATEGORY
+from .index_handler import TaskIndex, DateLike
 from config.user_mappings import get_user_info
 
+@contextmanager
+def _gc_paused():
+    """
+    대량 구축 중에는 순환 GC를 멈춥니다.
+
+    구축 중 만드는 객체에는 순환 참조가 없지만, 할당이 이어지는 동안 세대 GC가 살아 있는
+    객체 전체를 반복해서 순회하여 아이템 수에 대해 선형보다 빠르게 느려집니다.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 class TaskHandler:
-    def __init__(self, project_items: Dict, task_issues: Dict):
+    def __init__(self, project_items: Dict, task_issues: Dict, work_times: Optional[Dict[int, WorkTime]] = None):
         self.project_items = project_items
         self.task_issues = task_issues
-        self.task_mapping = self._build_task_mapping()
-        self.category_mapping = self._build_category_mapping()
+        # 이슈 번호 -> 타임라인 기반 작업 시간
+        self.work_times = work_times or {}
+        with _gc_paused():
+            self.task_mapping = self._build_task_mapping()
+            self.task_categories = {
+                task_name: self._resolve_category(task_data)
+                for task_name, task_data in self.task_mapping.items()
+            }
+            self.aggregator = TaskAggregator.from_task_mapping(self.task_mapping, self.task_categories)
+            self.category_mapping = self._build_category_mapping()
+            self.index = self._build_index()
 
     def _build_task_mapping(self) -> Dict[str, Dict]:
         """상위 태스크와 하위 투두 아이템 매핑을 구축"""
@@ -56,7 +85,10 @@ class TaskHandler:
                     status='Done' if item_data['state'] == 'CLOSED' else 'In Progress',
                     weight=1,
                     assignees=set(a['login'] for a in item_data['assignees']),
-                    closed_at=item_data['closed_at']
+                    closed_at=item_data['closed_at'],
+                    created_at=item_data.get('created_at'),
+                    work_time=self.work_times.get(item_data['number']),
+                    url=item_data.get('url')
                 )
                 
                 mapping[task_name]['todos'].append(todo_info)
@@ -67,6 +99,16 @@ class TaskHandler:
         
         return mapping
 
+    def _resolve_category(self, task_data: Dict) -> str:
+        """태스크 카테고리를 결정합니다. (기본값: "기능 개발")"""
+        for label in task_data.get('labels', []):
+            if label.startswith('category:'):
+                cat_name = label.replace('category:', '').strip()
+                # 카테고리가 TASK_CATEGORIES에 있는지 확인
+                if cat_name in TASK_CATEGORIES:
+                    return cat_name
+        return DEFAULT_CATEGORY
+
     def _build_category_mapping(self) -> Dict[str, List[TaskInfo]]:
         """카테고리별 태스크 매핑을 구축"""
         # 모든 카테고리 초기화
@@ -78,15 +120,7 @@ class TaskHandler:
         repo_name = os.environ.get('GITHUB_REPOSITORY')
         
         for task_name, task_data in self.task_mapping.items():
-            # 태스크 카테고리 결정 (기본값: "기능 개발")
-            category = "기능 개발"
-            for label in task_data.get('labels', []):
-                if label.startswith('category:'):
-                    cat_name = label.replace('category:', '').strip()
-                    # 카테고리가 TASK_CATEGORIES에 있는지 확인
-                    if cat_name in TASK_CATEGORIES:
-                        category = cat_name
-                        break
+            category = self.task_categories[task_name]
             
             task_info = TaskInfo(
                 number=task_data['number'] or 0,
@@ -97,47 +131,84 @@ class TaskHandler:
                 expected_time=task_data['expected_time'],
                 todos=task_data['todos'],
                 category=category,
-                url=f"https://github.com/{repo_name}/issues/{task_data['number']}"
+                url=f"https://github.com/{repo_name}/issues/{task_data['number']}",
+                work_time=self._aggregate_work_time(task_data['todos'])
             )
             mapping[category].append(task_info)
         
         return mapping
 
+    @staticmethod
+    def _aggregate_work_time(todos: List[TodoInfo]) -> Optional[WorkTime]:
+        """투두 작업 시간을 합산합니다. 경과 시간은 가장 이른 시작부터 가장 늦은 종료까지입니다."""
+        work_times = [todo.work_time for todo in todos if todo.work_time]
+        if not work_times:
+            return None
+
+        starts = [datetime.fromisoformat(work_time.started_at) for work_time in work_times]
+        ends = [start + timedelta(seconds=work_time.elapsed) for start, work_time in zip(starts, work_times)]
+        return WorkTime(
+            started_at=min(starts).isoformat(),
+            elapsed=(max(ends) - min(starts)).total_seconds(),
+            active=sum(work_time.active for work_time in work_times),
+            finished=all(work_time.finished for work_time in work_times) and len(work_times) == len(todos)
+        )
+
+    def _build_index(self) -> TaskIndex:
+        """담당자/상태/완료일 보조 인덱스를 구축"""
+        index = TaskIndex()
+        index.add_todos(
+            (todo, task_name)
+            for task_name, task_data in self.task_mapping.items()
+            for todo in task_data['todos']
+        )
+        for tasks in self.category_mapping.values():
+            for task in tasks:
+                index.set_task(task)
+        return index
+
     def get_task_status(self, task_name: str) -> TaskStatus:
-        """태스크의 상태를 계산합니다."""
-        task_data = self.task_mapping.get(task_name)
-        if not task_data:
-            return TaskStatus(TaskState.WAITING, 0.0)
-        
-        total = task_data['total_todos']
-        completed = task_data['completed_todos']
-        
-        if total == 0:
-            return TaskStatus(TaskState.WAITING, 0.0)
-        
-        progress = (completed / total) * 100
-        
-        if progress == 100:
-            return TaskStatus(TaskState.COMPLETED, progress)
-        elif progress > 0:
-            return TaskStatus(TaskState.IN_PROGRESS, progress)
-        return TaskStatus(TaskState.WAITING, 0.0)
+        """태스크의 상태를 집계 카운터로부터 반환합니다."""
+        return self.aggregator.get_task_status(task_name)
+
+    def get_category_stats(self, category: str) -> Dict:
+        """카테고리별 태스크 통계(total, completed, in_progress, waiting, progress_rate)를 반환합니다."""
+        return self.aggregator.get_category_stats(category)
+
+    def get_overall_stats(self) -> Dict:
+        """전체 태스크 통계를 반환합니다."""
+        return self.aggregator.get_overall_stats()
+
+    def get_daily_completed_counts(self) -> Dict[str, int]:
+        """일자별 완료된 투두 수를 반환합니다."""
+        return self.aggregator.get_daily_closed()
 
     def get_tasks_by_category(self, category: str) -> List[TaskInfo]:
         """카테고리별 태스크 목록 반환"""
         return self.category_mapping.get(category, [])
 
     def get_all_completed_todos(self) -> List[Tuple[datetime, TodoInfo, str]]:
-        """완료된 모든 투두 목록을 날짜순으로 반환"""
-        completed_todos = []
-        
+        """완료된 모든 투두 목록을 날짜순(최신순)으로 반환"""
+        return self.index.completed_todos(reverse=True)
+
+    def iter_todos(self) -> Iterator[Tuple[TodoInfo, str, str]]:
+        """모든 투두를 (투두, 상위 태스크명, 카테고리)로 순회합니다."""
         for task_name, task_data in self.task_mapping.items():
+            category = self.task_categories[task_name]
             for todo in task_data['todos']:
-                if todo.status == 'Done' and todo.closed_at:
-                    date = datetime.fromisoformat(todo.closed_at.replace('Z', '+00:00'))
-                    completed_todos.append((date, todo, task_name))
-        
-        return sorted(completed_todos, key=lambda x: x[0], reverse=True)
+                yield todo, task_name, category
+
+    def todos_for(self, assignee: str, since: Optional[DateLike] = None) -> List[Tuple[TodoInfo, str]]:
+        """담당자의 (투두, 상위 태스크명) 목록을 반환합니다. since 이후 생성/완료된 항목만 조회할 수 있습니다."""
+        return self.index.todos_for(assignee, since)
+
+    def completed_between(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> List[Tuple[datetime, TodoInfo, str]]:
+        """[start, end) 구간에 완료된 투두 목록을 날짜순으로 반환합니다."""
+        return self.index.completed_between(start, end)
+
+    def get_tasks_by_state(self, state: TaskState) -> List[TaskInfo]:
+        """상태별 태스크 목록 반환"""
+        return self.index.tasks_in_state(state)
 
     def get_user_branch_url(self, username: str) -> str:
         """사용자의 개발 브랜치 URL을 생성합니다."""
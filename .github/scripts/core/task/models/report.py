@@ -0,0 +1,58 @@
+"""
+보고서 데이터 모델
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass
+class CategorySummary:
+    name: str
+    emoji: str
+    total: int
+    completed: int
+    in_progress: int
+    waiting: int
+    progress_rate: float
+
+@dataclass
+class TodoSummary:
+    number: int
+    title: str
+    task: str
+    assignees: List[str]
+    completed_at: Optional[str] = None
+
+@dataclass
+class TaskSummary:
+    number: int
+    title: str
+    category: str
+    assignees: List[str]
+    progress: float
+    url: str
+
+@dataclass
+class ReportData:
+    """
+    스냅샷 한 번에 대해 계산한 보고서 데이터
+
+    GitHub 마크다운 보고서와 Slack 리포트가 같은 값을 사용합니다.
+    """
+    project_name: str
+    generated_at: str
+    report_date: str
+    total_tasks: int
+    completed_tasks: int
+    in_progress_tasks: int
+    categories: List[CategorySummary] = field(default_factory=list)
+    completed_today: List[TodoSummary] = field(default_factory=list)
+    in_progress_today: List[TaskSummary] = field(default_factory=list)
+    report_url: Optional[str] = None
+
+    @property
+    def waiting_tasks(self) -> int:
+        return self.total_tasks - self.completed_tasks - self.in_progress_tasks
+
+    @property
+    def completion_rate(self) -> float:
+        return (self.completed_tasks / self.total_tasks * 100) if self.total_tasks > 0 else 0
@@ -5,6 +5,13 @@ from dataclasses import dataclass
 from typing import List, Set, Optional
 from .status import TaskState, TaskStatus
 
+@dataclass
+class WorkTime:
+    started_at: str  # 작업 시작 시각 (ISO 8601)
+    elapsed: float  # 작업 시작부터 완료(또는 현재)까지 경과 시간(초)
+    active: float  # 작업 시작 이후 이슈가 열려 있던 시간(초)
+    finished: bool
+
 @dataclass
 class TodoInfo:
     title: str
@@ -13,6 +20,9 @@ class TodoInfo:
     weight: int
     assignees: Set[str]
     closed_at: Optional[str]
+    created_at: Optional[str] = None
+    work_time: Optional[WorkTime] = None
+    url: Optional[str] = None
 
 @dataclass
 class TaskInfo:
@@ -24,4 +34,5 @@ class TaskInfo:
     expected_time: str
     todos: List[TodoInfo]
     category: str
-    url: str 
\ No newline at end of file
+    url: str
+    work_time: Optional[WorkTime] = None 
\ No newline at end of file
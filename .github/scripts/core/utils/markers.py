@@ -0,0 +1,34 @@
+"""
+이슈 본문에 숨김 HTML 주석으로 메타데이터를 저장하는 유틸리티
+"""
+import re
+import json
+from typing import Any, Optional
+
+def _marker_pattern(name: str) -> re.Pattern:
+    return re.compile(rf'\n*<!-- {re.escape(name)}: (.*?) -->', re.DOTALL)
+
+def extract_marker(body: Optional[str], name: str) -> Optional[Any]:
+    """본문에서 이름이 name인 마커의 JSON 데이터를 읽습니다."""
+    if not body:
+        return None
+    match = _marker_pattern(name).search(body)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+def strip_marker(body: Optional[str], name: str) -> str:
+    """본문에서 이름이 name인 마커를 제거합니다."""
+    if not body:
+        return ''
+    return _marker_pattern(name).sub('', body)
+
+def embed_marker(body: str, name: str, data: Any) -> str:
+    """기존 마커를 교체하여 본문 끝에 마커를 추가합니다."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    # 주석 종료 시퀀스가 데이터에 포함되지 않도록 이스케이프합니다.
+    payload = payload.replace('-->', '--\\u003e')
+    return f"{strip_marker(body, name).rstrip()}\n\n<!-- {name}: {payload} -->\n"
@@ -0,0 +1,53 @@
+"""
+워크플로우 실행 간 상태를 보존하는 JSON 저장소
+"""
+import os
+import json
+import logging
+import tempfile
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = '.state'
+# Slack 알림 상태(수신자 캐시, 보관함, 요약)는 보고서 상태와 별도의 캐시 키로 저장합니다.
+SLACK_STATE_NAMESPACE = 'slack'
+
+class StateStore:
+    """
+    이름별 JSON 파일로 상태를 저장하는 저장소
+
+    GitHub Actions의 actions/cache로 STATE_DIR 디렉토리를 복원/저장하여
+    실행 간에 상태를 유지합니다. 파일이 없거나 손상된 경우 빈 상태로 시작합니다.
+    namespace를 지정하면 STATE_DIR 아래 하위 디렉토리에 저장하여 별도 캐시로 분리할 수 있습니다.
+    """
+
+    def __init__(self, name: str, state_dir: Optional[str] = None, namespace: Optional[str] = None):
+        self.name = name
+        self.state_dir = state_dir or os.environ.get('STATE_DIR', DEFAULT_STATE_DIR)
+        if namespace:
+            self.state_dir = os.path.join(self.state_dir, namespace)
+        self.path = os.path.join(self.state_dir, f"{name}.json")
+
+    def load(self) -> Dict[str, Any]:
+        """저장된 상태를 불러옵니다."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"상태 파일을 읽을 수 없어 초기화합니다 ({self.path}): {str(e)}")
+            return {}
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """상태를 원자적으로 저장합니다."""
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, prefix=f".{self.name}.", suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"상태 파일 저장 실패 ({self.path}): {str(e)}")
@@ -3,19 +3,65 @@
 """
 import os
 import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 from github.Repository import Repository
 import pytz
 from ..models.commit import parse_commit_message
 from ..utils.logger import logger
 from ..utils.github_utils import retry_api_call
+from core.github.client import GitHubClient
+
+ISSUE_REFERENCE_PATTERN = re.compile(r'#(\d+)')
+# 한 번의 GraphQL 요청에서 조회하는 이슈 수
+ISSUE_BATCH_SIZE = 100
+# 댓글을 동시에 작성하는 최대 스레드 수
+COMMENT_CONCURRENCY = 4
+BRANCH_SECTION_PATTERN = re.compile(
+    r'<details>\n<summary><h3 style="display: inline;">✨ (.+?)</h3></summary>\n\n(.*?)\n</details>',
+    re.DOTALL
+)
+
+def section_hash(content: str) -> str:
+    """렌더링된 브랜치 섹션 내용의 해시"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+def wrap_branch_section(branch_name: str, content: str) -> str:
+    """브랜치별 섹션을 details로 감쌉니다."""
+    return f'''<details>
+<summary><h3 style="display: inline;">✨ {branch_name}</h3></summary>
+
+{content}
+</details>'''
+
+def parse_branch_sections(body: Optional[str]) -> Dict[str, str]:
+    """DSR 이슈 본문에서 브랜치별 섹션 내용을 읽습니다."""
+    if not body:
+        return {}
+    return {match.group(1): match.group(2) for match in BRANCH_SECTION_PATTERN.finditer(body)}
 
 class CommitSectionBuilder:
-    def __init__(self, repo: Repository, timezone: str):
+    def __init__(self, repo: Repository, timezone: str, github_client: Optional[GitHubClient] = None,
+                 comment_ledger: Optional[Dict[str, List[str]]] = None, watermark: Optional[Dict[str, Dict]] = None):
         self.repo = repo
         self.tz = pytz.timezone(timezone)
         self.current_date = datetime.now(self.tz).strftime('%Y-%m-%d')
+        self.github_client = github_client
+        # 실행 동안 유지하는 이슈 캐시 (번호 -> 이슈 정보, 없는 이슈는 None)
+        self.issue_cache: Dict[int, Optional[Dict]] = {}
+        self._current_dsr: Optional[Dict] = None
+        self._current_dsr_loaded = False
+        # 이슈 번호 -> 이미 댓글로 알린 커밋 SHA (push마다 같은 댓글이 중복되지 않도록)
+        self.announced: Dict[int, set] = {int(number): set(shas) for number, shas in (comment_ledger or {}).items()}
+        # 이번 실행에서 작성할 댓글 (이슈 번호, 커밋 SHA, 본문)
+        self.pending_comments: List[Tuple[int, str, str]] = []
+        self._pending_keys = set()
+        # 브랜치 -> {'sha': 마지막 처리 커밋, 'shas': 처리한 커밋, 'hash': 섹션 해시}
+        self.watermark: Dict[str, Dict] = dict(watermark or {})
+        # 이번 실행에서 새로 처리한 커밋 수
+        self.new_commits = 0
     
     def _format_body(self, body: str) -> str:
         """커밋 본문을 포맷팅합니다."""
@@ -32,39 +78,133 @@ class CommitSectionBuilder:
         
         return '\n'.join(body_lines)
     
-    def _get_related_issues(self, message: str, commit_data: dict) -> List[str]:
-        """관련된 이슈 참조를 찾습니다."""
-        issue_numbers = set(re.findall(r'#(\d+)', message))
-        related_issues = []
+    def _get_current_dsr(self) -> Optional[Dict]:
+        """오늘의 DSR 이슈를 한 번만 조회해 캐시합니다."""
+        if not self._current_dsr_loaded:
+            self._current_dsr_loaded = True
+            dsr_issues = retry_api_call(lambda: list(self.repo.get_issues(state='open', labels=[os.environ.get('ISSUE_LABEL', 'dsr')])))
+            current_dsr = next((issue for issue in dsr_issues or [] if f"Daily Development Log ({self.current_date})" in issue.title), None)
+            if current_dsr:
+                self._current_dsr = {'number': current_dsr.number, 'issue': current_dsr}
+                self.issue_cache[current_dsr.number] = self._current_dsr
+        return self._current_dsr
+    
+    def resolve_issues(self, numbers: Iterable[int]) -> None:
+        """
+        캐시에 없는 이슈 번호의 존재 여부를 한 번에 확인합니다.
         
-        dsr_issues = retry_api_call(lambda: list(self.repo.get_issues(state='open', labels=[os.environ.get('ISSUE_LABEL', 'dsr')])))
-        current_dsr = next((issue for issue in dsr_issues if f"Daily Development Log ({self.current_date})" in issue.title), None)
+        GraphQL 클라이언트가 있으면 별칭(alias)을 붙인 issueOrPullRequest(number:) 필드를
+        100개씩 묶어 조회하고, 없으면 번호마다 REST로 조회합니다.
+        """
+        missing = sorted({number for number in numbers if number not in self.issue_cache})
+        if not missing:
+            return
         
-        if current_dsr:
-            issue_numbers.add(str(current_dsr.number))
+        if not self.github_client:
+            for number in missing:
+                try:
+                    issue = retry_api_call(lambda: self.repo.get_issue(number))
+                    self.issue_cache[number] = {'number': number, 'issue': issue} if issue else None
+                except Exception as e:
+                    logger.debug(f"Failed to get issue #{number}: {str(e)}")
+                    self.issue_cache[number] = None
+            return
+        
+        owner, name = self.repo.full_name.split('/', 1)
+        for start in range(0, len(missing), ISSUE_BATCH_SIZE):
+            batch = missing[start:start + ISSUE_BATCH_SIZE]
+            fields = '\n'.join(
+                f"i{number}: issueOrPullRequest(number: {number}) {{ ... on Issue {{ id number }} ... on PullRequest {{ id number }} }}"
+                for number in batch
+            )
+            query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            # 존재하지 않는 번호는 NOT_FOUND 오류와 함께 null로 반환됩니다.
+            result = self.github_client._execute_graphql(query, {"owner": owner, "name": name}, allow_partial=True)
+            repository = (result or {}).get('repository') or {}
+            for number in batch:
+                node = repository.get(f"i{number}")
+                self.issue_cache[number] = {'number': number, 'id': node['id']} if node else None
+        logger.debug(f"이슈 {len(missing)}개 존재 여부 확인")
+    
+    def _create_comment(self, issue: Dict, body: str) -> None:
+        """캐시된 이슈 정보로 댓글을 작성합니다. (이슈를 다시 조회하지 않음)"""
+        if 'issue' in issue:
+            issue['issue'].create_comment(body)
+        elif self.github_client and self.github_client._execute_graphql(
+            "mutation($id: ID!, $body: String!) { addComment(input: {subjectId: $id, body: $body}) { clientMutationId } }",
+            {"id": issue['id'], "body": body}
+        ) is None:
+            raise Exception(self.github_client.last_errors)
+    
+    def _queue_comment(self, issue_num: int, commit_sha: str, body: str) -> None:
+        """아직 알리지 않은 (이슈, 커밋) 쌍만 댓글 대기열에 추가합니다."""
+        key = (issue_num, commit_sha)
+        if commit_sha in self.announced.get(issue_num, ()) or key in self._pending_keys:
+            return
+        self._pending_keys.add(key)
+        self.pending_comments.append((issue_num, commit_sha, body))
+    
+    def flush_comments(self) -> int:
+        """대기 중인 댓글을 동시에 작성하고, 성공한 쌍을 장부에 기록합니다."""
+        if not self.pending_comments:
+            return 0
         
-        for issue_num in issue_numbers:
+        def post(comment: Tuple[int, str, str]) -> bool:
+            issue_num, _, body = comment
             try:
-                issue = retry_api_call(lambda: self.repo.get_issue(int(issue_num)))
-                if issue:
-                    if current_dsr and str(issue.number) == str(current_dsr.number):
-                        issue.create_comment(f"커밋이 추가되었습니다: {commit_data['title']}")
-                    else:
-                        issue.create_comment(f"Referenced in commit {commit_data['title']}")
-                    related_issues.append(f"Related to #{issue_num}")
+                self._create_comment(self.issue_cache[issue_num], body)
+                return True
             except Exception as e:
                 logger.debug(f"Failed to add comment to issue #{issue_num}: {str(e)}")
+                return False
+        
+        with ThreadPoolExecutor(max_workers=min(COMMENT_CONCURRENCY, len(self.pending_comments))) as executor:
+            results = list(executor.map(post, self.pending_comments))
+        
+        for (issue_num, commit_sha, _), ok in zip(self.pending_comments, results):
+            if ok:
+                self.announced.setdefault(issue_num, set()).add(commit_sha)
+        posted = sum(results)
+        logger.debug(f"커밋 참조 댓글 {posted}/{len(self.pending_comments)}개 작성")
+        self.pending_comments = []
+        self._pending_keys = set()
+        return posted
+    
+    def comment_ledger(self) -> Dict[str, List[str]]:
+        """DSR 이슈 메타데이터에 저장할 (이슈, 커밋) 장부"""
+        return {str(number): sorted(shas) for number, shas in sorted(self.announced.items()) if shas}
+    
+    def _get_related_issues(self, message: str, commit_data: dict, commit_sha: str = '') -> List[str]:
+        """관련된 이슈 참조를 찾고, 새로운 참조만 댓글 대기열에 추가합니다."""
+        issue_numbers = {int(number) for number in ISSUE_REFERENCE_PATTERN.findall(message)}
+        related_issues = []
+        
+        current_dsr = self._get_current_dsr()
+        if current_dsr:
+            issue_numbers.add(current_dsr['number'])
+        self.resolve_issues(issue_numbers)
+        
+        for issue_num in sorted(issue_numbers):
+            if not self.issue_cache.get(issue_num):
                 continue
+            if current_dsr and issue_num == current_dsr['number']:
+                self._queue_comment(issue_num, commit_sha, f"커밋이 추가되었습니다: {commit_data['title']}")
+            else:
+                self._queue_comment(issue_num, commit_sha, f"Referenced in commit {commit_data['title']}")
+            related_issues.append(f"Related to #{issue_num}")
         
         return related_issues
     
+    @staticmethod
+    def _full_message(commit_data: dict) -> str:
+        return f"{commit_data['title']}\n{commit_data.get('body', '')}\n{commit_data.get('footer', '')}"
+    
     def create_section(self, commit_data: dict, branch: str, commit_sha: str, author: str, time_string: str) -> str:
         """커밋 섹션을 생성합니다."""
         logger.debug(f"Creating commit section for {commit_sha[:7]}")
         
         body = self._format_body(commit_data.get('body', ''))
-        full_message = f"{commit_data['title']}\n{commit_data.get('body', '')}\n{commit_data.get('footer', '')}"
-        related_issues = self._get_related_issues(full_message, commit_data)
+        related_issues = self._get_related_issues(self._full_message(commit_data), commit_data, commit_sha)
         
         if related_issues:
             body += "\n> \n> Related Issues:\n> " + "\n> ".join(related_issues)
@@ -79,12 +219,42 @@ class CommitSectionBuilder:
 {body}
 > </details>'''
 
+    def _validate_watermark(self, branches_content: Dict[str, str]) -> Dict[str, str]:
+        """워터마크의 해시와 일치하는 기존 섹션만 남깁니다. (직접 수정된 섹션은 다시 렌더링)"""
+        self.watermark = {
+            branch_name: mark for branch_name, mark in self.watermark.items()
+            if branch_name in branches_content and mark.get('hash') == section_hash(branches_content[branch_name])
+        }
+        return {branch_name: content for branch_name, content in branches_content.items() if branch_name in self.watermark}
+    
     def create_branch_sections(self, branches_commits: dict, existing_content: dict = None) -> List[str]:
-        """브랜치별 섹션을 생성합니다."""
-        branches_content = existing_content.get('branches', {}) if existing_content else {}
+        """
+        브랜치별 섹션을 생성합니다.
+        
+        워터마크에 기록된 커밋은 다시 렌더링하지 않고 새 커밋 섹션만 기존 섹션 위에 붙입니다.
+        """
+        branches_content = self._validate_watermark(existing_content.get('branches', {}) if existing_content else {})
         result = []
         
-        for branch_name, commits in branches_commits.items():
+        new_commits = {
+            branch_name: [commit for commit in commits if commit.sha not in self.watermark.get(branch_name, {}).get('shas', ())]
+            for branch_name, commits in branches_commits.items()
+        }
+        self.new_commits = sum(len(commits) for commits in new_commits.values())
+        logger.debug(f"새 커밋 {self.new_commits}개 (워터마크 이후)")
+        
+        # 새 커밋이 참조하는 이슈를 먼저 한 번에 확인합니다.
+        referenced = set()
+        for commits in new_commits.values():
+            for commit in commits:
+                commit_data = parse_commit_message(commit.commit.message)
+                if commit_data:
+                    referenced.update(int(number) for number in ISSUE_REFERENCE_PATTERN.findall(self._full_message(commit_data)))
+        self.resolve_issues(referenced)
+        
+        branch_names = list(branches_content) + [name for name in new_commits if name not in branches_content]
+        for branch_name in branch_names:
+            commits = new_commits.get(branch_name, [])
             logger.debug(f"\n{branch_name} 브랜치 섹션 생성 중...")
             branch_sections = []
             
@@ -105,18 +275,25 @@ class CommitSectionBuilder:
                 )
                 branch_sections.append(section)
             
-            if branch_sections:
-                branch_content = '\n\n'.join(branch_sections)
-                if branch_name in branches_content:
-                    branch_content = branch_content + "\n\n" + branches_content[branch_name]
-                
-                # 브랜치별 섹션을 details로 감싸기
-                branch_section = f'''<details>
-<summary><h3 style="display: inline;">✨ {branch_name}</h3></summary>
-
-{branch_content}
-</details>'''
-                result.append(branch_section)
+            # 새 커밋 섹션을 기존 섹션 위에 붙입니다.
+            branch_content = '\n\n'.join(filter(None, branch_sections + [branches_content.get(branch_name)]))
+            
+            if commits:
+                self._advance_watermark(branch_name, commits, branch_content)
+            
+            if branch_content:
+                result.append(wrap_branch_section(branch_name, branch_content))
                 logger.debug(f"브랜치 '{branch_name}' 섹션 생성됨")
         
-        return result 
\ No newline at end of file
+        self.flush_comments()
+        return result
+    
+    def _advance_watermark(self, branch_name: str, commits: List, branch_content: str) -> None:
+        """브랜치의 워터마크를 새로 처리한 커밋과 섹션 해시로 갱신합니다."""
+        mark = self.watermark.get(branch_name, {})
+        latest = max(commits, key=lambda commit: commit.commit.author.date)
+        self.watermark[branch_name] = {
+            'sha': latest.sha,
+            'shas': sorted(set(mark.get('shas', [])) | {commit.sha for commit in commits}),
+            'hash': section_hash(branch_content),
+        } 
\ No newline at end of file
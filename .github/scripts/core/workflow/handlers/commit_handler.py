@@ -1,21 +1,65 @@
 """
 커밋 처리를 담당하는 핸들러
 """
+import os
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
 from typing import Dict, List, Tuple, Optional
 from github.Repository import Repository
 import pytz
-from ...workflow.models.commit import parse_commit_message, is_merge_commit_message
+from ...workflow.models.commit import (
+    parse_commit_message, is_merge_commit_message, LocalCommit, CommitDetails, CommitSignature
+)
 from ..utils.logger import logger
+from ..utils.git_utils import GitError, run_git, iter_commits
 from ..utils.github_utils import retry_api_call
+from core.github.client import GitHubClient
+
+BRANCH_HEADS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+    repository(owner: $owner, name: $name) {
+        refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                name
+                target {
+                    ... on Commit {
+                        oid
+                        committedDate
+                        authoredDate
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# 브랜치 히스토리를 동시에 조회하는 최대 스레드 수
+DEFAULT_FETCH_CONCURRENCY = 4
+
+@dataclass
+class BranchHead:
+    name: str
+    sha: str
+    updated_at: datetime  # 최신 커밋의 커밋/작성 시각 중 늦은 쪽 (UTC)
 
 class CommitProcessor:
-    def __init__(self, repo: Repository, timezone: str):
+    def __init__(self, repo: Repository, timezone: str, github_client: Optional[GitHubClient] = None,
+                 cwd: Optional[str] = None):
         self.repo = repo
         self.timezone = timezone
         self.tz = pytz.timezone(timezone)
         self.today = datetime.now(self.tz).date()
+        self.github_client = github_client
+        # 커밋 조회 방식: 'git'(로컬 clone 우선, 실패 시 API) 또는 'api'
+        self.commit_source = os.environ.get('COMMIT_SOURCE', 'git').lower()
+        self.cwd = cwd
         self.commit_history = {}
         self.author_branches = {}
     
@@ -52,73 +96,174 @@ class CommitProcessor:
         logger.debug(f"커밋 추가: [{commit.sha[:7]}] by {author_name}")
         return True
 
+    def scan_branch_heads(self) -> Optional[List[BranchHead]]:
+        """
+        모든 브랜치의 최신 커밋 시각을 GraphQL refs 조회 한 번(100개 단위 페이지)으로 가져옵니다.
+        
+        Returns:
+            최신순으로 정렬된 브랜치 목록, 조회 실패 시 None
+        """
+        if not self.github_client:
+            return None
+        
+        owner, name = self.repo.full_name.split('/', 1)
+        heads = []
+        cursor = None
+        while True:
+            result = self.github_client._execute_graphql(
+                BRANCH_HEADS_QUERY, {"owner": owner, "name": name, "cursor": cursor}
+            )
+            if not result or not result.get('repository'):
+                logger.debug("브랜치 목록 GraphQL 조회 실패, REST 조회로 대체합니다")
+                return None
+            
+            refs = result['repository']['refs']
+            for node in refs['nodes']:
+                target = node.get('target') or {}
+                if not target.get('oid'):
+                    continue
+                updated_at = max(
+                    datetime.fromisoformat(target[key].replace('Z', '+00:00'))
+                    for key in ('committedDate', 'authoredDate') if target.get(key)
+                )
+                heads.append(BranchHead(node['name'], target['oid'], updated_at))
+            
+            if not refs['pageInfo']['hasNextPage']:
+                break
+            cursor = refs['pageInfo']['endCursor']
+        
+        heads.sort(key=lambda head: head.updated_at, reverse=True)
+        return heads
+    
+    def _list_branch_heads(self) -> List[BranchHead]:
+        """REST로 브랜치마다 최신 커밋을 조회합니다. (GraphQL 조회 실패 시 사용)"""
+        heads = []
+        for branch in self.repo.get_branches():
+            latest_commit = self.repo.get_commit(branch.commit.sha)
+            heads.append(BranchHead(branch.name, branch.commit.sha, latest_commit.commit.author.date.replace(tzinfo=pytz.UTC)))
+        heads.sort(key=lambda head: head.updated_at, reverse=True)
+        return heads
+    
     def get_todays_commits(self) -> Dict[str, List]:
-        """오늘의 커밋을 작성자별로 가져옵니다."""
+        """
+        오늘의 커밋을 작성자별로 가져옵니다.
+        
+        전체 히스토리를 가진 로컬 clone이 있으면 git log 한 번으로 읽고,
+        그렇지 않으면 GitHub API로 브랜치별 히스토리를 조회합니다.
+        """
         logger.section("Getting Today's Unique Commits by Authors")
+        author_commits = None
+        if self.commit_source != 'api':
+            author_commits = self.get_local_commits()
+        if author_commits is None:
+            author_commits = self._get_api_commits()
+        
+        # 작성자별 커밋 통계
+        total_commits = sum(len(commits) for commits in author_commits.values())
+        logger.debug(f"\n총 {len(author_commits)}명의 작성자, {total_commits}개의 고유 커밋 발견")
+        
+        for author_branch, commits in author_commits.items():
+            author_name = author_branch.replace("Author_", "")
+            logger.debug(f"{author_name}: {len(commits)}개의 커밋")
+        
+        return author_commits
+    
+    def _add_commit(self, author_commits: Dict[str, List], commit, branch_name: str) -> None:
+        """유효한 커밋을 작성자의 가상 브랜치에 추가합니다."""
+        if self.process_commit(commit, branch_name):
+            author_branch = self.get_author_branch(commit.commit.author.name)
+            author_commits.setdefault(author_branch, []).append(commit)
+    
+    def _today_window(self) -> Tuple[datetime, datetime]:
+        """오늘(설정된 타임존 기준) 0시부터 다음 날 0시까지의 구간"""
+        start = self.tz.localize(datetime.combine(self.today, time.min))
+        return start, start + timedelta(days=1)
+    
+    def get_local_commits(self) -> Optional[Dict[str, List]]:
+        """
+        로컬 clone의 모든 브랜치에서 오늘 커밋을 git log 한 번으로 읽습니다.
+        
+        Returns:
+            작성자별 커밋, 로컬 히스토리를 사용할 수 없으면 None
+        """
+        if run_git(['rev-parse', '--is-shallow-repository'], self.cwd) != 'false\n':
+            logger.debug("전체 히스토리가 있는 로컬 저장소가 아니므로 API로 조회합니다")
+            return None
+        
+        start, end = self._today_window()
+        author_commits = {}
+        count = 0
+        
+        # --all은 원격 브랜치를 포함하며, 커밋은 SHA당 한 번만 출력됩니다.
+        try:
+            commits = list(iter_commits(['--all'], cwd=self.cwd, since=start, until=end, no_merges=True))
+        except GitError as e:
+            logger.debug(f"로컬 git log를 읽지 못해 API로 조회합니다: {str(e)}")
+            return None
+        
+        for sha, author, date, message in commits:
+            authored_at = datetime.fromisoformat(date).astimezone(pytz.UTC)
+            if authored_at.astimezone(self.tz).date() != self.today:
+                continue
+            count += 1
+            commit = LocalCommit(sha, CommitDetails(message, CommitSignature(author, authored_at.replace(tzinfo=None))))
+            self._add_commit(author_commits, commit, 'local')
+        
+        logger.debug(f"로컬 git에서 오늘 커밋 {count}개 확인")
+        return author_commits
+    
+    def _fetch_window(self, sha: str, start: datetime, end: datetime) -> List:
+        """브랜치 끝(sha)에서 [start, end) 구간의 커밋만 조회합니다."""
+        # since/until은 커밋 시각 기준이므로 작성 시각은 호출하는 쪽에서 다시 확인합니다.
+        return list(self.repo.get_commits(sha=sha, since=start.astimezone(pytz.UTC), until=end.astimezone(pytz.UTC)))
+    
+    def _get_api_commits(self) -> Dict[str, List]:
+        """GitHub API로 오늘 갱신된 브랜치의 오늘 커밋만 구간 조회합니다."""
         author_commits = {}
         processed_shas = set()
         
         try:
-            branches = list(self.repo.get_branches())
+            branches = self.scan_branch_heads()
+            if branches is None:
+                branches = self._list_branch_heads()
             logger.debug(f"총 {len(branches)}개의 브랜치 발견")
             
-            branches.sort(
-                key=lambda b: self.repo.get_commit(b.commit.sha).commit.author.date,
-                reverse=True
-            )
+            # 오늘 커밋이 있는 브랜치만, 같은 커밋을 가리키는 브랜치는 한 번만 조회
+            heads = {}
+            for head in branches:
+                if head.updated_at.astimezone(self.tz).date() >= self.today:
+                    heads.setdefault(head.sha, head)
+            logger.debug(f"오늘 갱신된 브랜치 {len(heads)}개 (중복 제외)")
             
-            for branch in branches:
-                branch_name = branch.name
-                latest_commit = self.repo.get_commit(branch.commit.sha)
-                latest_date = latest_commit.commit.author.date.replace(tzinfo=pytz.UTC).astimezone(self.tz).date()
-                
-                if latest_date < self.today:
-                    logger.debug(f"브랜치 {branch_name}의 최신 커밋이 오늘 이전입니다. 나머지 브랜치 검사 중단")
-                    break
-                
+            start, end = self._today_window()
+            concurrency = int(os.environ.get('COMMIT_FETCH_CONCURRENCY', DEFAULT_FETCH_CONCURRENCY))
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(heads) or 1))) as executor:
+                futures = {sha: executor.submit(self._fetch_window, sha, start, end) for sha in heads}
+            
+            for sha, head in heads.items():
+                branch_name = head.name
                 logger.debug(f"\n브랜치 확인 중: {branch_name}")
                 try:
-                    commits = self.repo.get_commits(sha=branch.commit.sha)
-                    
-                    for commit in commits:
-                        commit_date = commit.commit.author.date.replace(tzinfo=pytz.UTC).astimezone(self.tz).date()
-                        
-                        # 오늘 날짜가 아니면 다음 브랜치로
-                        if commit_date != self.today:
-                            if commit_date < self.today:
-                                break
-                            continue
-                        
-                        # 이미 처리된 SHA면 건너뜁니다
-                        if commit.sha in processed_shas:
-                            continue
-                        
-                        # 머지 커밋이거나 머지 결과물이면 건너뜁니다
-                        if is_merge_commit_message(commit.commit.message) or len(commit.parents) > 1:
-                            continue
-                        
-                        # 작성자 정보 확인
-                        author_name = commit.commit.author.name
-                        author_branch = self.get_author_branch(author_name)
-                        
-                        # 유효한 커밋이면 추가
-                        if self.process_commit(commit, branch_name):
-                            if author_branch not in author_commits:
-                                author_commits[author_branch] = []
-                            author_commits[author_branch].append(commit)
-                            processed_shas.add(commit.sha)
-                    
+                    commits = futures[sha].result()
                 except Exception as e:
                     logger.error(f"{branch_name} 브랜치 처리 중 오류 발생: {str(e)}")
                     continue
-            
-            # 작성자별 커밋 통계
-            total_commits = sum(len(commits) for commits in author_commits.values())
-            logger.debug(f"\n총 {len(author_commits)}명의 작성자, {total_commits}개의 고유 커밋 발견")
-            
-            for author_branch, commits in author_commits.items():
-                author_name = author_branch.replace("Author_", "")
-                logger.debug(f"{author_name}: {len(commits)}개의 커밋")
+                
+                for commit in commits:
+                    # 이미 처리된 SHA면 건너뜁니다 (브랜치 간 공유 히스토리)
+                    if commit.sha in processed_shas:
+                        continue
+                    processed_shas.add(commit.sha)
+                    
+                    commit_date = commit.commit.author.date.replace(tzinfo=pytz.UTC).astimezone(self.tz).date()
+                    if commit_date != self.today:
+                        continue
+                    
+                    # 머지 커밋이거나 머지 결과물이면 건너뜁니다
+                    if is_merge_commit_message(commit.commit.message) or len(commit.parents) > 1:
+                        continue
+                    
+                    self._add_commit(author_commits, commit, branch_name)
             
             return author_commits
             
@@ -0,0 +1,146 @@
+"""
+이슈 번호 -> 커밋 참조 인덱스 핸들러
+"""
+import re
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.commit import CommitMessage, is_merge_commit_message
+from ..utils.git_utils import GitError, iter_commits, list_ref_tips, rev_list, run_git
+from ..utils.logger import logger
+from core.utils.state_store import StateStore
+
+COMMIT_INDEX_STATE = 'commit_index'
+ISSUE_REFERENCE_PATTERN = re.compile(r'(?<![\w/])#(\d+)\b')
+
+# (sha, 작성자, 작성일 ISO 8601, 제목)
+CommitRef = Tuple[str, str, str, str]
+
+class CommitIndex:
+    """
+    로컬 git 히스토리에서 커밋 메시지의 #이슈번호 참조를 색인합니다.
+
+    마지막으로 색인한 브랜치 끝(SHA) 이후의 새 커밋만 읽어 갱신하며,
+    이슈별 커밋 수와 마지막 활동 시각은 미리 계산해 두어 O(1)로 조회합니다.
+    force push 등으로 히스토리가 재작성되면 더 이상 도달할 수 없는 커밋을 인덱스에서 제거합니다.
+    """
+
+    def __init__(self, store: Optional[StateStore] = None, cwd: Optional[str] = None):
+        self.store = store or StateStore(COMMIT_INDEX_STATE)
+        self.cwd = cwd
+        data = self.store.load()
+        self.tips: Dict[str, str] = data.get('tips', {})
+        self.issues: Dict[int, List[CommitRef]] = {
+            int(number): [tuple(ref) for ref in refs] for number, refs in data.get('issues', {}).items()
+        }
+        self._reindex()
+    
+    def _reindex(self) -> None:
+        """이슈별 SHA 집합과 마지막 활동 시각을 다시 계산합니다."""
+        self._shas: Dict[int, set] = {number: {ref[0] for ref in refs} for number, refs in self.issues.items()}
+        self._last_activity: Dict[int, str] = {
+            number: max(ref[2] for ref in refs) for number, refs in self.issues.items() if refs
+        }
+
+    def update(self) -> int:
+        """마지막 색인 이후의 커밋을 읽어 인덱스를 갱신하고, 새로 색인한 커밋 수를 반환합니다."""
+        tips = list_ref_tips(self.cwd)
+        if not tips:
+            logger.debug("git 브랜치 정보를 읽을 수 없어 커밋 인덱스를 갱신하지 않습니다.")
+            return 0
+
+        new_revisions = sorted({sha for ref, sha in tips.items() if self.tips.get(ref) != sha})
+        if not new_revisions:
+            return 0
+
+        if self._history_rewritten(tips):
+            self.prune(tips)
+
+        count = 0
+        try:
+            for sha, author, date, message in iter_commits(new_revisions, set(self.tips.values()), self.cwd):
+                count += 1
+                self.add_commit(sha, author, date, message)
+        except GitError as e:
+            # 읽지 못한 구간을 색인한 것으로 기록하지 않도록 브랜치 끝은 그대로 둡니다.
+            logger.debug(f"커밋 인덱스를 갱신하지 못했습니다: {str(e)}")
+            return count
+
+        self.tips = tips
+        logger.debug(f"커밋 인덱스 갱신: 새 커밋 {count}개")
+        return count
+
+    def _history_rewritten(self, tips: Dict[str, str]) -> bool:
+        """이전 브랜치 끝 중 현재 브랜치에서 도달할 수 없는 것이 있는지 확인합니다. (없는 커밋이면 재작성으로 간주)"""
+        previous = set(self.tips.values()) - set(tips.values())
+        if not previous:
+            return False
+        unreachable = rev_list(previous, tips.values(), self.cwd, limit=1)
+        return unreachable is None or bool(unreachable)
+
+    def prune(self, tips: Dict[str, str]) -> int:
+        """현재 브랜치에서 도달할 수 없는 커밋을 인덱스에서 제거하고, 제거한 참조 수를 반환합니다."""
+        # 얕은 clone에서는 전체 히스토리를 볼 수 없으므로 제거하지 않습니다.
+        if run_git(['rev-parse', '--is-shallow-repository'], self.cwd) != 'false\n':
+            return 0
+        reachable = rev_list(tips.values(), cwd=self.cwd)
+        if reachable is None:
+            return 0
+        reachable = set(reachable)
+
+        removed = 0
+        for number in list(self.issues):
+            refs = [ref for ref in self.issues[number] if ref[0] in reachable]
+            removed += len(self.issues[number]) - len(refs)
+            if refs:
+                self.issues[number] = refs
+            else:
+                del self.issues[number]
+        if removed:
+            self._reindex()
+            logger.debug(f"히스토리 재작성으로 사라진 커밋 참조 {removed}개 제거")
+        return removed
+
+    def add_commit(self, sha: str, author: str, date: str, message: str) -> None:
+        """커밋 메시지에서 이슈 참조를 찾아 인덱스에 추가합니다."""
+        if is_merge_commit_message(message):
+            return
+
+        # 시간대가 섞여도 문자열 비교가 가능하도록 UTC로 정규화합니다.
+        date = datetime.fromisoformat(date).astimezone(timezone.utc).isoformat()
+        commit = CommitMessage.parse(message)
+        title = commit.title if commit else message.split('\n', 1)[0].strip()
+        for number in {int(match) for match in ISSUE_REFERENCE_PATTERN.findall(message)}:
+            shas = self._shas.setdefault(number, set())
+            if sha in shas:
+                continue
+            shas.add(sha)
+            self.issues.setdefault(number, []).append((sha, author, date, title))
+            if date > self._last_activity.get(number, ''):
+                self._last_activity[number] = date
+
+    def commits_for(self, number: int) -> List[CommitRef]:
+        """이슈를 참조한 커밋 목록을 반환합니다."""
+        return self.issues.get(number, [])
+
+    def commit_count(self, number: int) -> int:
+        return len(self._shas.get(number, ()))
+
+    def last_activity(self, number: int) -> Optional[str]:
+        """이슈를 참조한 가장 최근 커밋의 작성일(ISO 8601)을 반환합니다."""
+        return self._last_activity.get(number)
+
+    def summarize(self, numbers: Iterable[int]) -> Tuple[int, Optional[str]]:
+        """여러 이슈(태스크와 하위 투두)를 합친 고유 커밋 수와 마지막 활동 시각을 반환합니다."""
+        numbers = [number for number in numbers if number in self._shas]
+        if not numbers:
+            return 0, None
+        if len(numbers) == 1:
+            return self.commit_count(numbers[0]), self.last_activity(numbers[0])
+        shas = set().union(*(self._shas[number] for number in numbers))
+        return len(shas), max(self._last_activity[number] for number in numbers)
+
+    def save(self) -> None:
+        self.store.save({
+            'tips': self.tips,
+            'issues': {str(number): [list(ref) for ref in refs] for number, refs in self.issues.items()}
+        })
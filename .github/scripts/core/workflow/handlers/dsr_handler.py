@@ -5,8 +5,13 @@ from typing import Dict, List, Tuple, Optional
 from github.Repository import Repository
 from github.Issue import Issue
 from ..utils.logger import logger
+from ..formatters.todo_formatter import create_todo_section
+from core.utils.markers import embed_marker, extract_marker
 import re
 
+# TODO, 커밋 워터마크, 이슈 참조 장부를 DSR 이슈 본문에 저장하는 마커 이름
+DSR_METADATA_MARKER = 'dsr-metadata'
+
 def find_active_dsr_issue(repo: Repository, date_string: str, issue_title: str) -> Optional[Issue]:
     """활성화된 DSR 이슈를 찾습니다."""
     logger.section("Searching for Active DSR Issue")
@@ -22,15 +27,12 @@ def find_active_dsr_issue(repo: Repository, date_string: str, issue_title: str)
     logger.debug("No active DSR issue found for today")
     return None
 
-def parse_existing_issue(body: str) -> dict:
-    """이슈 본문을 파싱하여 TODO 항목과 카테고리를 추출합니다."""
+def _parse_todo_markdown(body: str) -> List[Tuple[bool, str]]:
+    """메타데이터가 없는 이전 이슈의 본문 마크다운에서 TODO 항목과 카테고리를 추출합니다."""
     todos = []
     current_category = 'General'
     in_todo_section = False
     
-    if not body:
-        return {'todos': todos}
-    
     for line in body.split('\n'):
         if '## 📝 Todo' in line:
             in_todo_section = True
@@ -50,7 +52,36 @@ def parse_existing_issue(body: str) -> dict:
                 else:  # 일반 TODO 항목
                     todos.append((checked, text))
     
-    return {'todos': todos}
+    return todos
+
+def parse_existing_issue(body: str) -> dict:
+    """
+    이슈 본문에서 TODO 항목, 커밋 워터마크, 이슈 참조 장부를 읽습니다.
+    
+    메타데이터 블록을 한 번 파싱하며, 블록이 없거나 체크박스가 본문에서 직접 수정된 경우에만
+    마크다운을 다시 읽습니다.
+    """
+    if not body:
+        return {'todos': [], 'watermark': {}, 'issue_refs': {}}
+    
+    metadata = extract_marker(body, DSR_METADATA_MARKER) or {}
+    todos = [(bool(checked), text) for checked, text in metadata.get('todos', [])]
+    if not metadata or create_todo_section(todos) not in body:
+        todos = _parse_todo_markdown(body)
+    
+    return {
+        'todos': todos,
+        'watermark': metadata.get('watermark', {}),
+        'issue_refs': metadata.get('issue_refs', {}),
+    }
+
+def embed_dsr_metadata(body: str, todos: List[Tuple[bool, str]], watermark: Dict, issue_refs: Dict) -> str:
+    """DSR 이슈 본문 끝에 메타데이터 블록을 추가합니다."""
+    return embed_marker(body, DSR_METADATA_MARKER, {
+        'todos': [[checked, text] for checked, text in todos],
+        'watermark': watermark,
+        'issue_refs': issue_refs,
+    })
 
 def get_previous_dsr_todos(repo: Repository, current_date: str) -> List[Tuple[bool, str]]:
     """이전 일자의 미완료 TODO 항목을 가져오고 이슈를 닫습니다."""
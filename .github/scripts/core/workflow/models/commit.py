@@ -2,7 +2,9 @@
 커밋 메시지 처리를 위한 유틸리티 함수들
 """
 import re
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
 
 COMMIT_TYPES = {
     'feat': {'emoji': '✨', 'label': 'feature', 'description': 'New Feature'},
@@ -15,6 +17,23 @@ COMMIT_TYPES = {
     'perf': {'emoji': '⚡️', 'label': 'performance', 'description': 'Performance Improvement'},
 }
 
+@dataclass
+class CommitSignature:
+    name: str
+    date: datetime  # UTC (tzinfo 없음, PyGithub과 동일)
+
+@dataclass
+class CommitDetails:
+    message: str
+    author: CommitSignature
+
+@dataclass
+class LocalCommit:
+    """로컬 git에서 읽은 커밋 (PyGithub Commit과 같은 sha/commit/parents 속성 구조)"""
+    sha: str
+    commit: CommitDetails
+    parents: List[str] = field(default_factory=list)
+
 class CommitMessage:
     def __init__(self, type_: str, title: str, body: str = '', todo: str = '', footer: str = ''):
         self.type = type_
@@ -0,0 +1,101 @@
+"""
+로컬 git 저장소 관련 유틸리티 함수
+"""
+import subprocess
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .logger import logger
+
+# git log 출력 구분자 (필드: 0x1f, 레코드: 0x1e)
+FIELD_SEPARATOR = '\x1f'
+RECORD_SEPARATOR = '\x1e'
+
+class GitError(Exception):
+    """git 명령 실행 실패"""
+
+def run_git(args: List[str], cwd: Optional[str] = None) -> Optional[str]:
+    """
+    git 명령을 실행하고 표준 출력을 반환합니다.
+
+    Args:
+        args: git 인자 목록
+        cwd: 실행 디렉토리 (기본값: 현재 디렉토리)
+
+    Returns:
+        표준 출력 문자열, 실패 시 None
+    """
+    try:
+        result = subprocess.run(
+            ['git', *args], cwd=cwd, capture_output=True, text=True, encoding='utf-8', check=True
+        )
+        return result.stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = getattr(e, 'stderr', '') or str(e)
+        logger.debug(f"git {' '.join(args[:2])} 실행 실패: {stderr.strip()}")
+        return None
+
+def rev_list(revisions: Iterable[str], exclude: Iterable[str] = (), cwd: Optional[str] = None,
+             limit: Optional[int] = None) -> Optional[List[str]]:
+    """revisions에서 도달 가능하고 exclude에서는 도달할 수 없는 커밋 SHA 목록 (없는 SHA가 있거나 실패하면 None)"""
+    args = ['rev-list']
+    if limit:
+        args.append(f"--max-count={limit}")
+    args += list(revisions)
+    exclude = list(exclude)
+    if exclude:
+        args += ['--not', *exclude]
+    output = run_git(args, cwd)
+    return None if output is None else output.split()
+
+def list_ref_tips(cwd: Optional[str] = None) -> Dict[str, str]:
+    """브랜치/원격 브랜치/태그의 현재 커밋 SHA를 반환합니다."""
+    output = run_git(['for-each-ref', '--format=%(refname)%09%(objectname)', 'refs/heads', 'refs/remotes', 'refs/tags'], cwd)
+    if output is None:
+        return {}
+    tips = {}
+    for line in output.splitlines():
+        ref, _, sha = line.partition('\t')
+        if sha and not ref.endswith('/HEAD'):
+            tips[ref] = sha
+    return tips
+
+def iter_commits(revisions: Iterable[str], exclude: Iterable[str] = (), cwd: Optional[str] = None,
+                 since: Optional[datetime] = None, until: Optional[datetime] = None,
+                 no_merges: bool = False) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    revisions에서 도달 가능하고 exclude에서는 도달할 수 없는 커밋을 순회합니다.
+    since/until은 커밋 시각 기준 구간이며, no_merges면 머지 커밋을 제외합니다.
+
+    Returns:
+        (sha, 작성자, 작성일 ISO 8601, 전체 메시지) 튜플
+    
+    Raises:
+        GitError: git log 실행에 실패한 경우 (커밋이 없는 경우와 구분)
+    """
+    revisions = list(revisions)
+    if not revisions:
+        return
+    exclude = list(exclude)
+
+    # 히스토리 재작성 등으로 사라진 SHA는 --ignore-missing으로 무시합니다.
+    args = ['log', '--ignore-missing',
+            f"--format=%H{FIELD_SEPARATOR}%an{FIELD_SEPARATOR}%aI{FIELD_SEPARATOR}%B{RECORD_SEPARATOR}"]
+    if since:
+        args.append(f"--since={since.isoformat()}")
+    if until:
+        args.append(f"--until={until.isoformat()}")
+    if no_merges:
+        args.append('--no-merges')
+    args += revisions
+    if exclude:
+        args += ['--not', *exclude]
+    output = run_git(args, cwd)
+    if output is None:
+        raise GitError(f"git log 실행 실패: {' '.join(revisions[:3])}")
+
+    for record in output.split(RECORD_SEPARATOR):
+        record = record.strip('\n')
+        if not record:
+            continue
+        sha, author, date, message = record.split(FIELD_SEPARATOR, 3)
+        yield sha, author, date, message
@@ -4,8 +4,11 @@
 import os
 from core.slack.client import SlackClient
 from core.slack.handlers.report import ReportHandler
+from core.slack.handlers.user_digest import UserDigestHandler
 from core.github.handlers.project_handler import GitHubProjectHandler
 from core.github.client import GitHubClient
+from core.task.handlers.task_handler import TaskHandler
+from core.task.handlers.report_registry import ReportRegistry
 
 def main():
     """일일 리포트 실행"""
@@ -13,10 +16,25 @@ def main():
     github_token = os.environ.get('GITHUB_TOKEN')
     
     client = SlackClient(slack_token)
+    # 이전 실행에서 보관된 메시지를 먼저 별도 배치로 재전송
+    client.flush_spool()
     github_client = GitHubClient(github_token)
     github_manager = GitHubProjectHandler(github_client)
-    handler = ReportHandler(client, github_manager)
+    
+    # 프로젝트 스냅샷은 한 번만 조회해 리포트와 담당자별 요약 DM이 모두 이 값으로 계산
+    task_manager = TaskHandler(github_manager.get_project_items(), github_manager.get_task_issues())
+    
+    # 보고서 이슈 URL은 task_report.py가 게시하며 레지스트리에 남긴 값을 사용
+    project_name = os.environ.get('GITHUB_REPOSITORY', '').split('/')[-1]
+    report_url = ReportRegistry(project_name).report.get('url')
+    handler = ReportHandler(client, task_manager, report_url)
     handler.handle()
+    
+    # 담당자별 요약 DM
+    UserDigestHandler(client, task_manager).handle()
+    
+    # 이벤트 알림이 변경분을 반영할 기준 집계를 전체 스냅샷으로 다시 맞춤
+    task_manager.aggregator.save()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
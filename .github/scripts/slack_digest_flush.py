@@ -0,0 +1,52 @@
+"""
+이슈 이벤트 요약 전송
+"""
+import os
+from datetime import datetime, timedelta, timezone
+from core.slack.client import SlackClient
+from core.slack.handlers.task import TaskHandler
+from core.slack.handlers.proposal import ProposalHandler, is_proposal_event
+from core.slack.handlers.digest import DigestHandler, EventDigest
+from core.github.client import GitHubClient
+from core.github.handlers.issue_event_handler import IssueEventHandler
+from core.task.handlers.aggregate_handler import TaskAggregator
+
+# 처음 실행할 때 수집할 구간(분)
+DEFAULT_DIGEST_WINDOW = 30
+
+def main():
+    """요약 전송 실행"""
+    slack_token = os.environ['SLACK_BOT_TOKEN']
+    github_token = os.environ.get('GITHUB_TOKEN')
+    
+    client = SlackClient(slack_token)
+    # 이전 실행에서 보관된 메시지를 먼저 별도 배치로 재전송
+    client.flush_spool()
+    digest = EventDigest()
+    
+    # 마지막 수집 이후의 이슈 이벤트를 보관함에 추가
+    now = datetime.now(timezone.utc)
+    if digest.watermark:
+        since = datetime.fromisoformat(digest.watermark)
+    else:
+        since = now - timedelta(minutes=int(os.environ.get('SLACK_DIGEST_WINDOW', DEFAULT_DIGEST_WINDOW)))
+    
+    # 할당 DM은 이벤트마다 실행되는 slack_task_notifier.py가 이미 전송했습니다.
+    events = IssueEventHandler(GitHubClient(github_token)).collect(since, now)
+    aggregator = TaskAggregator.load()
+    for event_data in events:
+        if is_proposal_event(event_data):
+            ProposalHandler(client, digest).handle(event_data)
+        else:
+            TaskHandler(client, digest, aggregator).handle(event_data)
+    
+    # 늦게 조회되는 이벤트를 놓치지 않도록 실제로 처리한 마지막 이벤트 시각까지만 진행합니다.
+    if events:
+        digest.watermark = events[-1]['created_at']
+    
+    DigestHandler(client, digest).handle()
+    digest.save()
+    aggregator.save()
+
+if __name__ == '__main__':
+    main()
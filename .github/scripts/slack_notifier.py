@@ -17,6 +17,8 @@ def main():
     
     slack_token = os.environ['SLACK_BOT_TOKEN']
     client = SlackClient(slack_token)
+    # 이전 실행에서 보관된 메시지를 먼저 별도 배치로 재전송
+    client.flush_spool()
     
     handler = CommitHandler(client)
     handler.handle(event_data)
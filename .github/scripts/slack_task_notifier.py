@@ -5,33 +5,39 @@ import os
 import json
 from core.slack.client import SlackClient
 from core.slack.handlers.task import TaskHandler
-from core.slack.handlers.proposal import ProposalHandler
+from core.slack.handlers.proposal import ProposalHandler, is_proposal_event
+from core.slack.handlers.digest import is_digest_mode
+from core.task.handlers.aggregate_handler import TaskAggregator
 
 def load_event_data():
     """GitHub 이벤트 데이터 로드"""
     with open(os.environ['GITHUB_EVENT_PATH'], 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def is_proposal_event(event_data):
-    """제안서 이벤트 여부 확인"""
-    if 'issue' not in event_data:
-        return False
-    labels = [label['name'] for label in event_data['issue'].get('labels', [])]
-    return any(label in labels for label in ['⌛ 검토대기', '✅ 승인완료', '❌ 반려', '⏸️ 보류'])
-
 def main():
     """태스크 알림 실행"""
     event_data = load_event_data()
     
     slack_token = os.environ['SLACK_BOT_TOKEN']
     client = SlackClient(slack_token)
+    # 이전 실행에서 보관된 메시지를 먼저 별도 배치로 재전송
+    client.flush_spool()
+    
+    # 요약 모드: 채널 알림은 slack_digest_flush.py가 이슈 이벤트 API로 모아 전송하므로
+    # 여기서는 할당 DM만 바로 보냅니다.
+    if is_digest_mode():
+        if event_data.get('action') == 'assigned' and not is_proposal_event(event_data):
+            TaskHandler(client).notify_assignee(event_data)
+        return
     
     if is_proposal_event(event_data):
-        handler = ProposalHandler(client)
-    else:
-        handler = TaskHandler(client)
+        ProposalHandler(client).handle(event_data)
+        return
     
-    handler.handle(event_data)
+    # 이벤트 변경분만 집계에 반영해 상위 태스크 진행률을 계산 (프로젝트 전체 조회 없음)
+    aggregator = TaskAggregator.load()
+    TaskHandler(client, aggregator=aggregator).handle(event_data)
+    aggregator.save()
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
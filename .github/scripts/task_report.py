@@ -5,9 +5,13 @@ import os
 import logging
 from core.github.handlers.project_handler import GitHubProjectHandler
 from core.github.client import GitHubClient
+from core.github.handlers.timeline_handler import TimelineHandler
 from core.task.handlers.task_handler import TaskHandler
 from core.task.handlers.report_handler import ReportHandler
 from core.task.formatters.report_formatter import ReportFormatter
+from core.task.formatters.section_cache import SectionCache
+from core.utils.state_store import StateStore
+from core.workflow.handlers.commit_index_handler import CommitIndex
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -37,12 +41,23 @@ def main():
         project_items = github_manager.get_project_items()
         task_issues = github_manager.get_task_issues()
         
-        task_manager = TaskHandler(project_items, task_issues)
-        report_formatter = ReportFormatter(project_name, task_manager)
+        # 실제 작업 시간 계산용 타임라인 (변경된 이슈만 묶어서 조회)
+        work_times = TimelineHandler(github_client).collect_work_times(project_items)
+        
+        task_manager = TaskHandler(project_items, task_issues, work_times)
+        section_cache = SectionCache(StateStore('report_sections'), ReportFormatter.cache_context())
+        
+        # 체크아웃된 git 히스토리에서 이슈 참조 커밋을 증분 색인
+        commit_index = CommitIndex()
+        commit_index.update()
+        
+        report_formatter = ReportFormatter(project_name, task_manager, section_cache, commit_index=commit_index)
         
         # ReportHandler를 사용하여 보고서 생성/업데이트
         report_handler = ReportHandler(github_client, project_name)
         report_handler.create_or_update_report(report_formatter)
+        section_cache.save()
+        commit_index.save()
         
     except Exception as e:
         logger.error(f"오류 발생: {str(e)}")
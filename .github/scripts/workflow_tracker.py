@@ -2,94 +2,19 @@
 워크플로우 트래커 메인 스크립트
 """
 import os
-import re
 from datetime import datetime
 import pytz
 from github import Github
-from typing import List, Tuple, Optional
-from github.Repository import Repository
-from github.Issue import Issue
 from core.workflow.utils.logger import logger
 from core.workflow.models.commit import parse_commit_message
 from core.workflow.handlers.commit_handler import CommitProcessor
 from core.workflow.handlers.todo_handler import TodoProcessor
-from core.workflow.formatters.commit_formatter import CommitSectionBuilder
+from core.workflow.handlers.dsr_handler import (
+    find_active_dsr_issue, parse_existing_issue, get_previous_dsr_todos, embed_dsr_metadata
+)
+from core.workflow.formatters.commit_formatter import CommitSectionBuilder, parse_branch_sections
 from core.workflow.formatters.todo_formatter import create_todo_section
-
-def find_active_dsr_issue(repo: Repository, date_string: str, issue_title: str) -> Optional[Issue]:
-    logger.section("Searching for Active DSR Issue")
-    
-    dsr_issues = repo.get_issues(state='open', labels=['DSR'])
-
-    for issue in dsr_issues:
-        logger.debug(f"Checking issue #{issue.number}: {issue.title}")
-        if issue.title == issue_title:
-            logger.debug(f"Found today's DSR issue: #{issue.number}")
-            return issue
-    
-    logger.debug("No active DSR issue found for today")
-    return None
-
-def parse_existing_issue(body: str) -> dict:
-    todos = []
-    current_category = 'General'
-    in_todo_section = False
-    
-    if not body:
-        return {'todos': todos}
-    
-    for line in body.split('\n'):
-        if '## 📝 Todo' in line:
-            in_todo_section = True
-        elif in_todo_section and line.strip() and line.startswith('##'):
-            in_todo_section = False
-        elif in_todo_section and line.strip():
-            if '<summary><h3' in line:  # 카테고리 헤더 찾기
-                category_match = re.search(r'📑\s*(.*?)\s*\(', line)
-                if category_match:
-                    current_category = category_match.group(1).strip()
-                    todos.append((False, f"@{current_category}"))
-            elif line.startswith('- ['):
-                checked = 'x' in line[3]
-                text = line[6:].strip()
-                if text.startswith('#'):  # 이슈 참조인 경우
-                    todos.append((checked, text))
-                else:  # 일반 TODO 항목
-                    todos.append((checked, text))
-    
-    return {'todos': todos}
-
-def get_previous_dsr_todos(repo: Repository, current_date: str) -> List[Tuple[bool, str]]:
-    """이전 일자의 미완료 TODO 항목을 가져오고 이슈를 닫습니다."""
-    todos = []
-    dsr_issues = repo.get_issues(state='open', labels=['DSR'])
-    
-    # 날짜순으로 정렬 (최신순)
-    sorted_issues = sorted(
-        [issue for issue in dsr_issues if "Development Status Report" in issue.title],
-        key=lambda x: x.created_at,
-        reverse=True
-    )
-    
-    for issue in sorted_issues:
-        if current_date in issue.title:  # 현재 날짜의 이슈는 건너뜀
-            continue
-            
-        # 이전 이슈의 TODO 항목을 파싱
-        previous_content = parse_existing_issue(issue.body)
-        if previous_content and 'todos' in previous_content:
-            # 미완료 항목과 카테고리만 가져옴
-            for checked, text in previous_content['todos']:
-                if text.startswith('@') or not checked:  # 카테고리이거나 미완료 항목
-                    todos.append((checked, text))
-            
-            # 이전 이슈 닫기
-            issue.edit(state='closed')
-            logger.debug(f"이전 DSR 이슈 #{issue.number} 닫힘")
-            
-            break  # 가장 최근 이슈만 처리
-    
-    return todos
+from core.github.client import GitHubClient
 
 def main():
     github_token = os.environ.get('PAT') or os.environ['GITHUB_TOKEN']
@@ -125,7 +50,8 @@ def main():
     logger.section("Issue Title Format")
     logger.debug(f"Using title format: {issue_title}")
 
-    commit_processor = CommitProcessor(repo, timezone)
+    github_client = GitHubClient(github_token)
+    commit_processor = CommitProcessor(repo, timezone, github_client)
     branches_commits = commit_processor.get_todays_commits()
     
     if not branches_commits:
@@ -139,11 +65,17 @@ def main():
     previous_todos = get_previous_dsr_todos(repo, date_string)
     
     existing_content = {'todos': previous_todos}
+    today_content = {}
     if today_issue:
         today_content = parse_existing_issue(today_issue.body)
         existing_content['todos'] = todo_processor.merge_todos(previous_todos, today_content.get('todos', []))
+        # 이미 렌더링된 브랜치 섹션은 워터마크와 함께 재사용합니다.
+        existing_content['branches'] = parse_branch_sections(today_issue.body)
     
-    section_builder = CommitSectionBuilder(repo, timezone)
+    # 오늘 DSR 이슈 메타데이터에 기록된 (이슈, 커밋) 댓글 장부와 워터마크
+    section_builder = CommitSectionBuilder(
+        repo, timezone, github_client, today_content.get('issue_refs'), today_content.get('watermark')
+    )
     branches_content = section_builder.create_branch_sections(branches_commits, existing_content)
     
     current_commit = repo.get_commit(os.environ['GITHUB_SHA'])
@@ -178,8 +110,11 @@ def main():
 ## 📝 Todo
 
 {create_todo_section(processed_todos)}'''
+    body = embed_dsr_metadata(body, processed_todos, section_builder.watermark, section_builder.comment_ledger())
 
-    if today_issue:
+    if today_issue and today_issue.body == body:
+        logger.debug(f"이슈 #{today_issue.number} 변경 사항 없음 (새 커밋 {section_builder.new_commits}개)")
+    elif today_issue:
         today_issue.edit(body=body)
         logger.debug(f"이슈 #{today_issue.number} 업데이트됨")
     else: